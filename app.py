@@ -7,9 +7,15 @@ from core.main import MainWindow
 
 
 def main():
+    import argparse
     import sys
 
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Smart Task Manager")
+    parser.add_argument("--serve", nargs="?", const="", default=None, metavar="ADDRESS",
+                        help="also serve tasks over JSON-RPC on a unix socket path, PORT or HOST:PORT")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
 
     app.setStyle('Fusion')
 
@@ -32,7 +38,7 @@ def main():
 
     app.setPalette(dark_palette)
 
-    window = MainWindow()
+    window = MainWindow(server_address=args.serve)
     window.show()
     sys.exit(app.exec_())
 
@@ -0,0 +1,143 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import os
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.due_dates import parse_due_date
+from core.storage import LOAD_ERRORS, read_json, write_json
+from core.task import Task
+
+PRIORITIES = (1, 2, 3)
+
+
+def _day(value: Optional[str]) -> Optional[str]:
+    return value[:10] if value else None
+
+
+class ProductivityStats:
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.created: Counter = Counter()
+        self.completed: Counter = Counter()
+        self.completed_by_priority: Counter = Counter()
+        self.late_by_priority: Counter = Counter()
+        self.seconds_by_priority: Counter = Counter()
+        self._dirty = False
+
+    def load(self) -> bool:
+        if not os.path.isfile(self.filename):
+            return False
+        try:
+            data = read_json(self.filename)
+        except LOAD_ERRORS:
+            return False
+        self.created = Counter(data.get('created', {}))
+        self.completed = Counter(data.get('completed', {}))
+        self.completed_by_priority = Counter({int(k): v for k, v in data.get('completed_by_priority', {}).items()})
+        self.late_by_priority = Counter({int(k): v for k, v in data.get('late_by_priority', {}).items()})
+        self.seconds_by_priority = Counter({int(k): v for k, v in data.get('seconds_by_priority', {}).items()})
+        self._dirty = False
+        return True
+
+    def to_dict(self) -> Dict:
+        return {
+            'created': dict(self.created),
+            'completed': dict(self.completed),
+            'completed_by_priority': {str(k): v for k, v in self.completed_by_priority.items()},
+            'late_by_priority': {str(k): v for k, v in self.late_by_priority.items()},
+            'seconds_by_priority': {str(k): v for k, v in self.seconds_by_priority.items()},
+        }
+
+    def take_changes(self) -> Optional[Dict]:
+        if not self._dirty:
+            return None
+        self._dirty = False
+        return self.to_dict()
+
+    def save(self):
+        if not self._dirty:
+            return
+        write_json(self.filename, self.to_dict())
+        self._dirty = False
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self.created = Counter()
+        self.completed = Counter()
+        self.completed_by_priority = Counter()
+        self.late_by_priority = Counter()
+        self.seconds_by_priority = Counter()
+        for task in tasks:
+            self.record_created(task)
+            if task.completed:
+                self.record_completed(task)
+        self._dirty = True
+
+    def record_created(self, task: Task):
+        day = _day(task.created_at)
+        if day:
+            self.created[day] += 1
+            self._dirty = True
+
+    def record_completed(self, task: Task):
+        self._apply_completion(task, task.completed_at, 1)
+
+    def record_reopened(self, task: Task, completed_at: Optional[str]):
+        self._apply_completion(task, completed_at, -1)
+
+    def _apply_completion(self, task: Task, completed_at: Optional[str], sign: int):
+        if not completed_at:
+            return
+        day = _day(completed_at)
+        self.completed[day] += sign
+        self.completed_by_priority[task.priority] += sign
+        due = parse_due_date(task.due_date)
+        if due is not None and day > due.isoformat():
+            self.late_by_priority[task.priority] += sign
+        try:
+            seconds = (datetime.fromisoformat(completed_at) - datetime.fromisoformat(task.created_at)).total_seconds()
+        except ValueError:
+            seconds = 0
+        self.seconds_by_priority[task.priority] += sign * max(seconds, 0)
+        self._dirty = True
+
+    def daily(self, days: int, today: Optional[date] = None) -> List[Tuple[date, int, int]]:
+        today = today or date.today()
+        result = []
+        for offset in range(days - 1, -1, -1):
+            day = today - timedelta(days=offset)
+            key = day.isoformat()
+            result.append((day, self.created[key], self.completed[key]))
+        return result
+
+    def weekly(self, weeks: int, today: Optional[date] = None) -> List[Tuple[date, int, int]]:
+        today = today or date.today()
+        week_start = today - timedelta(days=today.weekday())
+        result = []
+        for offset in range(weeks - 1, -1, -1):
+            start = week_start - timedelta(weeks=offset)
+            keys = [(start + timedelta(days=i)).isoformat() for i in range(7)]
+            result.append((start,
+                           sum(self.created[key] for key in keys),
+                           sum(self.completed[key] for key in keys)))
+        return result
+
+    def completed_count(self, priority: Optional[int] = None) -> int:
+        if priority is None:
+            return sum(self.completed_by_priority.values())
+        return self.completed_by_priority[priority]
+
+    def average_completion_hours(self, priority: Optional[int] = None) -> Optional[float]:
+        count = self.completed_count(priority)
+        if count <= 0:
+            return None
+        seconds = sum(self.seconds_by_priority.values()) if priority is None else self.seconds_by_priority[priority]
+        return seconds / count / 3600
+
+    def late_rate(self, priority: Optional[int] = None) -> Optional[float]:
+        count = self.completed_count(priority)
+        if count <= 0:
+            return None
+        late = sum(self.late_by_priority.values()) if priority is None else self.late_by_priority[priority]
+        return late / count
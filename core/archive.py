@@ -0,0 +1,49 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import json
+import os
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+from core.task import Task
+
+
+class TaskArchive:
+
+    def __init__(self, filename: str = '~/.todos.archive.jsonl'):
+        self.filename = os.path.expanduser(filename)
+
+    def append(self, tasks: Iterable[Task]) -> int:
+        written = 0
+        with open(self.filename, 'a', encoding='utf-8') as f:
+            for task in tasks:
+                f.write(json.dumps(task.to_dict(), ensure_ascii=False, sort_keys=True))
+                f.write('\n')
+                written += 1
+        return written
+
+    def iter_tasks(self) -> Iterator[Task]:
+        if not os.path.isfile(self.filename):
+            return
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield Task.from_dict(json.loads(line))
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+
+    def search(self, text: str) -> Iterator[Task]:
+        text = text.lower()
+        for task in self.iter_tasks():
+            if not text or text in task.title.lower() or text in task.description.lower():
+                yield task
+
+    def page(self, page: int, page_size: int = 50, search_text: str = '') -> Tuple[List[Task], bool]:
+        start = max(page, 0) * page_size
+        tasks = list(islice(self.search(search_text), start, start + page_size + 1))
+        return tasks[:page_size], len(tasks) > page_size
+
+    def count(self) -> int:
+        return sum(1 for _ in self.iter_tasks())
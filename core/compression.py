@@ -0,0 +1,271 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import argparse
+import gzip
+import io
+import json
+import lzma
+import os
+import time
+import zlib
+from typing import BinaryIO, Dict, List, NamedTuple, Optional, TextIO, Tuple
+
+CODECS = ('none', 'gzip', 'zlib', 'lzma')
+DEFAULT_LEVELS = {'gzip': 6, 'zlib': 6, 'lzma': 6}
+LEVEL_RANGES = {'gzip': (0, 9), 'zlib': (0, 9), 'lzma': (0, 9)}
+BENCHMARK_SPECS = ('none', 'zlib:1', 'zlib:6', 'zlib:9', 'gzip:1', 'gzip:6', 'gzip:9', 'lzma:0', 'lzma:6')
+CHUNK_SIZE = 64 * 1024
+
+DECODE_ERRORS = (EOFError, lzma.LZMAError, zlib.error, UnicodeDecodeError)
+
+GZIP_MAGIC = b'\x1f\x8b'
+LZMA_MAGIC = b'\xfd7zXZ\x00'
+
+
+class CompressionError(ValueError):
+    pass
+
+
+class BenchmarkResult(NamedTuple):
+    spec: str
+    size: int
+    ratio: float
+    encode_ms: float
+    decode_ms: float
+
+
+def parse_codec(spec: Optional[str]) -> Tuple[str, Optional[int]]:
+    if not spec:
+        return 'none', None
+    name, _, level = spec.lower().partition(':')
+    if name not in CODECS:
+        raise CompressionError(f"Unknown codec: {name}")
+    if not level or name == 'none':
+        return name, DEFAULT_LEVELS.get(name)
+    try:
+        level_value = int(level)
+    except ValueError:
+        raise CompressionError(f"Invalid compression level: {level}")
+    low, high = LEVEL_RANGES[name]
+    if not low <= level_value <= high:
+        raise CompressionError(f"Compression level for {name} must be between {low} and {high}")
+    return name, level_value
+
+
+def detect_codec(head: bytes) -> str:
+    if head.startswith(GZIP_MAGIC):
+        return 'gzip'
+    if head.startswith(LZMA_MAGIC):
+        return 'lzma'
+    if len(head) >= 2 and head[0] & 0x0f == 8 and (head[0] << 8 | head[1]) % 31 == 0:
+        return 'zlib'
+    return 'none'
+
+
+class ZlibReader(io.RawIOBase):
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self._decompressor = zlib.decompressobj()
+        self._buffer = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            if self._decompressor.eof:
+                return 0
+            chunk = self._raw.read(CHUNK_SIZE)
+            if not chunk:
+                self._buffer = self._decompressor.flush()
+                if not self._buffer:
+                    return 0
+                break
+            self._buffer = self._decompressor.decompress(chunk)
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class ZlibWriter(io.RawIOBase):
+
+    def __init__(self, raw: BinaryIO, level: int):
+        self._raw = raw
+        self._compressor = zlib.compressobj(level)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._raw.write(self._compressor.compress(b))
+        return len(b)
+
+    def close(self):
+        if not self.closed:
+            self._raw.write(self._compressor.flush())
+        super().close()
+
+
+def wrap_reader(raw: BinaryIO, codec: str) -> BinaryIO:
+    if codec == 'gzip':
+        return gzip.GzipFile(fileobj=raw, mode='rb')
+    if codec == 'lzma':
+        return lzma.LZMAFile(raw, mode='rb')
+    if codec == 'zlib':
+        return io.BufferedReader(ZlibReader(raw), CHUNK_SIZE)
+    return raw
+
+
+def wrap_writer(raw: BinaryIO, codec: str, level: Optional[int] = None) -> BinaryIO:
+    level = DEFAULT_LEVELS.get(codec) if level is None else level
+    if codec == 'gzip':
+        return gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=level, mtime=0)
+    if codec == 'lzma':
+        return lzma.LZMAFile(raw, mode='wb', preset=level)
+    if codec == 'zlib':
+        return io.BufferedWriter(ZlibWriter(raw, level), CHUNK_SIZE)
+    return raw
+
+
+class _OwnedStream(io.RawIOBase):
+
+    def __init__(self, stream: BinaryIO, raw: BinaryIO):
+        self._stream = stream
+        self._raw = raw
+
+    def readable(self) -> bool:
+        return self._stream.readable()
+
+    def writable(self) -> bool:
+        return self._stream.writable()
+
+    def readinto(self, b) -> int:
+        data = self._stream.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def write(self, b) -> int:
+        return self._stream.write(b)
+
+    def close(self):
+        if not self.closed:
+            try:
+                if self._stream is not self._raw:
+                    self._stream.close()
+            finally:
+                self._raw.close()
+        super().close()
+
+
+def open_read(filename: str) -> Tuple[TextIO, str]:
+    raw = open(filename, 'rb')
+    try:
+        head = raw.read(len(LZMA_MAGIC))
+        raw.seek(0)
+        codec = detect_codec(head)
+        stream = _OwnedStream(wrap_reader(raw, codec), raw)
+    except Exception:
+        raw.close()
+        raise
+    return io.TextIOWrapper(io.BufferedReader(stream, CHUNK_SIZE), encoding='utf-8'), codec
+
+
+def open_write(filename: str, codec: str = 'none', level: Optional[int] = None) -> TextIO:
+    raw = open(filename, 'wb')
+    stream = _OwnedStream(wrap_writer(raw, codec, level), raw)
+    return io.TextIOWrapper(io.BufferedWriter(stream, CHUNK_SIZE), encoding='utf-8')
+
+
+def dump_json(data, f: TextIO, codec: str = 'none', compact: bool = False):
+    if codec == 'none' and not compact:
+        json.dump(data, f, indent=4, ensure_ascii=False, sort_keys=True)
+    else:
+        json.dump(data, f, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+
+
+def benchmark(data, specs=BENCHMARK_SPECS, repeat: int = 3) -> List[BenchmarkResult]:
+    plain_size = len(json.dumps(data, indent=4, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    results = []
+    for spec in specs:
+        codec, level = parse_codec(spec)
+        encode_times = []
+        decode_times = []
+        payload = b''
+        for _ in range(repeat):
+            buffer = io.BytesIO()
+            started = time.perf_counter()
+            stream = wrap_writer(buffer, codec, level)
+            text = io.TextIOWrapper(stream, encoding='utf-8')
+            dump_json(data, text, codec)
+            text.flush()
+            text.detach()
+            if stream is not buffer:
+                stream.close()
+            encode_times.append(time.perf_counter() - started)
+            payload = buffer.getvalue()
+
+            started = time.perf_counter()
+            json.load(io.TextIOWrapper(wrap_reader(io.BytesIO(payload), codec), encoding='utf-8'))
+            decode_times.append(time.perf_counter() - started)
+
+        results.append(BenchmarkResult(
+            spec=spec,
+            size=len(payload),
+            ratio=len(payload) / plain_size if plain_size else 1.0,
+            encode_ms=min(encode_times) * 1000,
+            decode_ms=min(decode_times) * 1000,
+        ))
+    return results
+
+
+def load_json(filename: str) -> Tuple[Dict, str]:
+    f, codec = open_read(filename)
+    with f:
+        return json.load(f), codec
+
+
+def save_json(filename: str, data: Dict, codec: str = 'none', level: Optional[int] = None,
+              compact: bool = False):
+    tmp_filename = filename + '.tmp'
+    with open_write(tmp_filename, codec, level) as f:
+        dump_json(data, f, codec, compact)
+    os.replace(tmp_filename, filename)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark or change Smart Task Manager file compression.")
+    parser.add_argument("--file", default="~/.todos.json", help="task file to use")
+    commands = parser.add_subparsers(dest="command", required=True)
+    bench = commands.add_parser("bench", help="report size and encode/decode time per codec")
+    bench.add_argument("--repeat", type=int, default=3)
+    bench.add_argument("specs", nargs="*", default=list(BENCHMARK_SPECS),
+                       help="codecs to try, e.g. gzip:6 zlib:1 lzma")
+    convert = commands.add_parser("convert", help="rewrite the task file with another codec")
+    convert.add_argument("codec", help="none, gzip[:level], zlib[:level] or lzma[:preset]")
+    args = parser.parse_args(argv)
+
+    try:
+        for spec in args.specs if args.command == "bench" else [args.codec]:
+            parse_codec(spec)
+    except CompressionError as e:
+        parser.error(str(e))
+
+    filename = os.path.expanduser(args.file)
+    data, current = load_json(filename)
+
+    if args.command == "bench":
+        print(f"{filename}: {len(data)} task(s), stored as {current}")
+        print(f"{'codec':<10}{'size':>12}{'ratio':>8}{'encode ms':>12}{'decode ms':>12}")
+        for result in benchmark(data, args.specs, args.repeat):
+            print(f"{result.spec:<10}{result.size:>12}{result.ratio:>8.3f}"
+                  f"{result.encode_ms:>12.1f}{result.decode_ms:>12.1f}")
+        return
+
+    codec, level = parse_codec(args.codec)
+    save_json(filename, data, codec, level)
+    print(f"Rewrote {filename} with {args.codec}: {os.path.getsize(filename)} bytes")
+
+
+if __name__ == "__main__":
+    main()
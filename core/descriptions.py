@@ -0,0 +1,137 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import json
+import mmap
+import os
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set
+
+from core.storage import read_json, write_json
+
+DESCRIPTION_CACHE_SIZE = 256
+COMPACT_MIN_GARBAGE = 1024 * 1024
+
+
+class DescriptionStore:
+
+    def __init__(self, filename: str, cache_size: int = DESCRIPTION_CACHE_SIZE):
+        self.filename = filename
+        self.index_filename = filename + '.idx'
+        self.cache_size = cache_size
+        self.index: Dict[str, List[int]] = self._load_index()
+        self._cache: 'OrderedDict[str, str]' = OrderedDict()
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._index_dirty = False
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self.index
+
+    def get(self, task_id: str) -> str:
+        if task_id in self._cache:
+            self._cache.move_to_end(task_id)
+            return self._cache[task_id]
+
+        text = self._read(task_id)
+        self._cache[task_id] = text
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
+    def put(self, task_id: str, text: str):
+        self._cache.pop(task_id, None)
+        if not text:
+            self.remove(task_id)
+            return
+
+        data = text.encode('utf-8')
+        self._close_map()
+        with open(self.filename, 'ab') as f:
+            offset = f.tell()
+            f.write(data)
+        self.index[task_id] = [offset, len(data)]
+        self._index_dirty = True
+
+    def remove(self, task_id: str):
+        self._cache.pop(task_id, None)
+        if self.index.pop(task_id, None) is not None:
+            self._index_dirty = True
+
+    def search(self, text: str) -> Set[str]:
+        text = text.lower()
+        view = self._view()
+        if view is None:
+            return set()
+        return {task_id for task_id, (offset, length) in self.index.items()
+                if text in view[offset:offset + length].decode('utf-8', 'replace').lower()}
+
+    def flush(self):
+        if not self._index_dirty:
+            return
+        if self._garbage_bytes() > max(COMPACT_MIN_GARBAGE, self._live_bytes()):
+            self.compact()
+        write_json(self.index_filename, self.index)
+        self._index_dirty = False
+
+    def compact(self):
+        view = self._view()
+        if view is None:
+            return
+        tmp_filename = self.filename + '.tmp'
+        index = {}
+        with open(tmp_filename, 'wb') as f:
+            for task_id, (offset, length) in self.index.items():
+                index[task_id] = [f.tell(), length]
+                f.write(view[offset:offset + length])
+        self._close_map()
+        os.replace(tmp_filename, self.filename)
+        self.index = index
+        self._index_dirty = True
+
+    def retain(self, task_ids: Iterable[str]):
+        keep = set(task_ids)
+        for task_id in [task_id for task_id in self.index if task_id not in keep]:
+            self.remove(task_id)
+
+    def close(self):
+        self.flush()
+        self._close_map()
+
+    def _read(self, task_id: str) -> str:
+        entry = self.index.get(task_id)
+        view = self._view() if entry else None
+        if view is None:
+            return ""
+        offset, length = entry
+        return view[offset:offset + length].decode('utf-8', 'replace')
+
+    def _view(self) -> Optional[mmap.mmap]:
+        if self._mmap is None:
+            if not os.path.isfile(self.filename) or os.path.getsize(self.filename) == 0:
+                return None
+            self._file = open(self.filename, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _close_map(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _live_bytes(self) -> int:
+        return sum(length for _, length in self.index.values())
+
+    def _garbage_bytes(self) -> int:
+        if not os.path.isfile(self.filename):
+            return 0
+        return os.path.getsize(self.filename) - self._live_bytes()
+
+    def _load_index(self) -> Dict[str, List[int]]:
+        if not os.path.isfile(self.index_filename):
+            return {}
+        try:
+            return read_json(self.index_filename)
+        except (json.JSONDecodeError, IOError):
+            return {}
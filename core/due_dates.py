@@ -0,0 +1,129 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+from core.task import Task
+
+DUE_NONE = 'none'
+DUE_OVERDUE = 'overdue'
+DUE_TODAY = 'today'
+DUE_FUTURE = 'future'
+
+
+def parse_due_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
+
+
+def msecs_until_midnight(now: Optional[datetime] = None) -> int:
+    now = now or datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max(int((midnight - now).total_seconds() * 1000), 0)
+
+
+class DueDateClassifier:
+
+    def __init__(self, today: Optional[date] = None):
+        self.today = today or date.today()
+        self._due: Dict[str, date] = {}
+        self._categories: Dict[str, str] = {}
+        self._by_date: Dict[date, Set[str]] = {}
+        self._days: List[date] = []
+
+    def classify_date(self, due: Optional[date]) -> str:
+        if due is None:
+            return DUE_NONE
+        if due < self.today:
+            return DUE_OVERDUE
+        if due == self.today:
+            return DUE_TODAY
+        return DUE_FUTURE
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self._due = {}
+        self._categories = {}
+        self._by_date = {}
+        self._days = []
+        for task in tasks:
+            self.update(task)
+
+    def update(self, task: Task):
+        due = parse_due_date(task.due_date)
+        old_due = self._due.get(task.id)
+        if old_due is not None and old_due != due:
+            self._discard(task.id, old_due)
+        if due is None:
+            self._due.pop(task.id, None)
+        else:
+            self._due[task.id] = due
+            bucket = self._by_date.get(due)
+            if bucket is None:
+                self._by_date[due] = {task.id}
+                insort(self._days, due)
+            else:
+                bucket.add(task.id)
+        self._categories[task.id] = self.classify_date(due)
+
+    def remove(self, task_id: str):
+        due = self._due.pop(task_id, None)
+        if due is not None:
+            self._discard(task_id, due)
+        self._categories.pop(task_id, None)
+
+    def category(self, task_id: str) -> str:
+        return self._categories.get(task_id, DUE_NONE)
+
+    def due(self, task_id: str) -> Optional[date]:
+        return self._due.get(task_id)
+
+    def days_between(self, low: Optional[date] = None, high: Optional[date] = None) -> List[date]:
+        start = 0 if low is None else bisect_left(self._days, low)
+        end = len(self._days) if high is None else bisect_right(self._days, high)
+        return self._days[start:end]
+
+    def ids_on(self, day: date) -> Set[str]:
+        return set(self._by_date.get(day, ()))
+
+    def ids_between(self, low: Optional[date] = None, high: Optional[date] = None) -> Set[str]:
+        ids = set()
+        for day in self.days_between(low, high):
+            ids.update(self._by_date[day])
+        return ids
+
+    def is_overdue(self, task: Task) -> bool:
+        return not task.completed and self.category(task.id) == DUE_OVERDUE
+
+    def rollover(self, today: Optional[date] = None) -> Set[str]:
+        new_today = today or date.today()
+        if new_today == self.today:
+            return set()
+
+        low, high = sorted((self.today, new_today))
+        self.today = new_today
+
+        if (high - low).days < len(self._by_date):
+            days = (low + timedelta(days=offset) for offset in range((high - low).days + 1))
+        else:
+            days = self.days_between(low, high)
+
+        changed = set()
+        for day in days:
+            category = self.classify_date(day)
+            for task_id in self._by_date.get(day, ()):
+                if self._categories.get(task_id) != category:
+                    self._categories[task_id] = category
+                    changed.add(task_id)
+        return changed
+
+    def _discard(self, task_id: str, due: date):
+        bucket = self._by_date.get(due)
+        if bucket is not None:
+            bucket.discard(task_id)
+            if not bucket:
+                del self._by_date[due]
+                del self._days[bisect_left(self._days, due)]
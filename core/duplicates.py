@@ -0,0 +1,213 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import hashlib
+import re
+from array import array
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from core.search import ngrams
+from core.task import Task
+
+NUM_HASHES = 64
+BANDS = 16
+DESCRIPTION_PREFIX = 200
+DUPLICATE_THRESHOLD = 0.7
+SIGNATURE_MARGIN = 0.2
+COMMON_SHINGLE_RATIO = 0.05
+COMMON_SHINGLE_MIN = 100
+COMMON_SHINGLE_SAMPLE = 10000
+MAX_DUPLICATES = 5
+
+_BIN_BITS = (NUM_HASHES - 1).bit_length()
+_EMPTY_BIN = 1 << 64
+_EMPTY_SIGNATURE: Tuple[int, ...] = ()
+_WORD_RE = re.compile(r'\w+')
+
+
+class DuplicateMatch(NamedTuple):
+    task_id: str
+    similarity: float
+
+
+def shingles(title: str, description: str = "") -> FrozenSet[str]:
+    words = _WORD_RE.findall(description[:DESCRIPTION_PREFIX].lower())
+    return ngrams(title).union(' ' + word for word in words)
+
+
+@lru_cache(maxsize=65536)
+def _shingle_hash(shingle: str) -> Tuple[int, int]:
+    value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+    return value & (NUM_HASHES - 1), value >> _BIN_BITS
+
+
+def minhash(grams: Iterable[str]) -> Tuple[int, ...]:
+    bins = [_EMPTY_BIN] * NUM_HASHES
+    for slot, value in map(_shingle_hash, grams):
+        if value < bins[slot]:
+            bins[slot] = value
+    if _EMPTY_BIN in bins:
+        if bins.count(_EMPTY_BIN) == NUM_HASHES:
+            return _EMPTY_SIGNATURE
+        last = max(slot for slot, value in enumerate(bins) if value != _EMPTY_BIN)
+        source, distance = bins[last], 0
+        for slot in range(last - 1, last - NUM_HASHES, -1):
+            if bins[slot] == _EMPTY_BIN:
+                distance += 1
+                bins[slot] = source | distance << 64
+            else:
+                source, distance = bins[slot], 0
+    return tuple(bins)
+
+
+def signature_of(grams: FrozenSet[str]) -> bytes:
+    values = minhash(grams)
+    return array('H', [hash(value) & 0xFFFF for value in values]).tobytes()
+
+
+def jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def agreement(first: bytes, second: bytes) -> float:
+    return sum(a == b for a, b in zip(memoryview(first).cast('H'), memoryview(second).cast('H'))) / NUM_HASHES
+
+
+def _band_keys(signature: bytes) -> List[bytes]:
+    lanes = memoryview(signature).cast('H')
+    return [lanes[band::BANDS].tobytes() for band in range(BANDS)]
+
+
+def similar_pairs(collisions: Iterable[Tuple[str, ...]], signatures: Dict[str, bytes],
+                  threshold: float = DUPLICATE_THRESHOLD) -> List[Tuple[str, str]]:
+    minimum = threshold - SIGNATURE_MARGIN
+    checked: Set[Tuple[str, str]] = set()
+    pairs = []
+    for bucket in collisions:
+        members = sorted(bucket)
+        for index, first in enumerate(members):
+            signature = signatures[first]
+            for second in members[index + 1:]:
+                if (first, second) in checked:
+                    continue
+                checked.add((first, second))
+                if agreement(signature, signatures[second]) >= minimum:
+                    pairs.append((first, second))
+    return pairs
+
+
+class DuplicateIndex:
+
+    def __init__(self, grams_of: Callable[[str], FrozenSet[str]]):
+        self._grams_of = grams_of
+        self._common: FrozenSet[str] = frozenset()
+        self._signatures: Dict[str, bytes] = {}
+        self._buckets: List[Dict[bytes, Set[str]]] = [{} for _ in range(BANDS)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self.rebuild_texts([(task.id, task.title, task.description[:DESCRIPTION_PREFIX]) for task in tasks])
+
+    def rebuild_texts(self, texts: Sequence[Tuple[str, str, str]]):
+        step = max(1, len(texts) // COMMON_SHINGLE_SAMPLE)
+        frequency: Counter = Counter()
+        for _, title, description in texts[::step]:
+            frequency.update(shingles(title, description))
+        limit = max(COMMON_SHINGLE_MIN, len(texts) * COMMON_SHINGLE_RATIO) / step
+        self._common = frozenset(shingle for shingle, count in frequency.items() if count > limit)
+        self._signatures = {}
+        self._buckets = [{} for _ in range(BANDS)]
+        for task_id, title, description in texts:
+            self.update_text(task_id, title, description)
+
+    def update(self, task: Task):
+        self.update_text(task.id, task.title, task.description)
+
+    def update_text(self, task_id: str, title: str, description: str):
+        self.remove(task_id)
+        signature = self._signature(shingles(title, description))
+        if not signature:
+            return
+        self._signatures[task_id] = signature
+        for buckets, key in zip(self._buckets, _band_keys(signature)):
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = {task_id}
+            else:
+                bucket.add(task_id)
+
+    def remove(self, task_id: str):
+        signature = self._signatures.pop(task_id, None)
+        if signature is None:
+            return
+        for buckets, key in zip(self._buckets, _band_keys(signature)):
+            bucket = buckets[key]
+            bucket.discard(task_id)
+            if not bucket:
+                del buckets[key]
+
+    def candidates(self, grams: FrozenSet[str], threshold: float = DUPLICATE_THRESHOLD) -> Set[str]:
+        signature = self._signature(grams)
+        if not signature:
+            return set()
+        result: Set[str] = set()
+        for buckets, key in zip(self._buckets, _band_keys(signature)):
+            bucket = buckets.get(key)
+            if bucket:
+                result.update(bucket)
+        minimum = threshold - SIGNATURE_MARGIN
+        return {task_id for task_id in result if agreement(signature, self._signatures[task_id]) >= minimum}
+
+    def find(self, title: str, description: str = "", exclude: Optional[str] = None,
+             threshold: float = DUPLICATE_THRESHOLD, limit: int = MAX_DUPLICATES) -> List[DuplicateMatch]:
+        grams = shingles(title, description)
+        matches = []
+        for task_id in self.candidates(grams, threshold):
+            if task_id == exclude:
+                continue
+            similarity = jaccard(grams, self._grams_of(task_id))
+            if similarity >= threshold:
+                matches.append(DuplicateMatch(task_id, similarity))
+        matches.sort(key=lambda match: (-match.similarity, match.task_id))
+        return matches[:limit]
+
+    def _signature(self, grams: FrozenSet[str]) -> bytes:
+        return signature_of(grams - self._common or grams)
+
+    def snapshot(self) -> Tuple[List[Tuple[str, ...]], Dict[str, bytes]]:
+        collisions = [tuple(bucket) for buckets in self._buckets for bucket in buckets.values() if len(bucket) > 1]
+        return collisions, dict(self._signatures)
+
+    def groups(self, threshold: float = DUPLICATE_THRESHOLD,
+               pairs: Optional[Iterable[Tuple[str, str]]] = None) -> List[List[str]]:
+        if pairs is None:
+            pairs = similar_pairs(*self.snapshot(), threshold)
+        parents: Dict[str, str] = {}
+
+        def root(task_id: str) -> str:
+            parent = parents.setdefault(task_id, task_id)
+            while parent != task_id:
+                grandparent = parents[parent]
+                parents[task_id] = grandparent
+                task_id, parent = parent, grandparent
+            return task_id
+
+        grams: Dict[str, FrozenSet[str]] = {}
+        for first, second in pairs:
+            if first not in self._signatures or second not in self._signatures or root(first) == root(second):
+                continue
+            for task_id in (first, second):
+                if task_id not in grams:
+                    grams[task_id] = self._grams_of(task_id)
+            if jaccard(grams[first], grams[second]) >= threshold:
+                parents[root(second)] = root(first)
+
+        grouped: Dict[str, List[str]] = {}
+        for task_id in parents:
+            grouped.setdefault(root(task_id), []).append(task_id)
+        return sorted((sorted(group) for group in grouped.values() if len(group) > 1),
+                      key=lambda group: (-len(group), group[0]))
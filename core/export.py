@@ -0,0 +1,197 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import argparse
+import csv
+import io
+import json
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, Iterator, TextIO, Tuple
+
+from core.archive import TaskArchive
+from core.descriptions import DescriptionStore
+from core.due_dates import DueDateClassifier
+from core.query import compile_query
+from core.storage import iter_tasks
+from core.task import Task
+
+PRIORITY_NAMES = {1: "High", 2: "Medium", 3: "Low"}
+ICAL_PRIORITIES = {1: 1, 2: 5, 3: 9}
+CSV_FIELDS = ["id", "title", "description", "priority", "completed", "created_at", "due_date", "tags"]
+
+
+def csv_lines(tasks: Iterable[Task]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDS)
+    yield buffer.getvalue()
+    for task in tasks:
+        buffer.seek(0)
+        buffer.truncate()
+        data = task.to_dict()
+        data["description"] = task.description
+        data["tags"] = " ".join(task.tags)
+        writer.writerow([data.get(field, "") for field in CSV_FIELDS])
+        yield buffer.getvalue()
+
+
+def jsonl_lines(tasks: Iterable[Task]) -> Iterator[str]:
+    for task in tasks:
+        data = task.to_dict()
+        data["description"] = task.description
+        yield json.dumps(data, ensure_ascii=False, sort_keys=True) + "\n"
+
+
+def markdown_lines(tasks: Iterable[Task]) -> Iterator[str]:
+    yield "# Tasks\n\n"
+    for task in tasks:
+        details = [f"priority: {PRIORITY_NAMES.get(task.priority, task.priority)}"]
+        if task.due_date:
+            details.append(f"due: {task.due_date}")
+        if task.tags:
+            details.append(" ".join(f"#{tag}" for tag in task.tags))
+        mark = "x" if task.completed else " "
+        yield f"- [{mark}] {task.title} ({', '.join(details)})\n"
+        for line in task.description.splitlines():
+            yield f"  {line}\n"
+
+
+def _ical_escape(text: str) -> str:
+    return (text.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _ical_fold(line: str) -> str:
+    folded = []
+    while len(line.encode("utf-8")) > 75:
+        cut = 75
+        while len(line[:cut].encode("utf-8")) > 75:
+            cut -= 1
+        folded.append(line[:cut])
+        line = " " + line[cut:]
+    folded.append(line)
+    return "\r\n".join(folded) + "\r\n"
+
+
+def _ical_timestamp(value: str) -> str:
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        moment = datetime.now()
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+        return moment.strftime("%Y%m%dT%H%M%SZ")
+    return moment.strftime("%Y%m%dT%H%M%S")
+
+
+def ical_lines(tasks: Iterable[Task]) -> Iterator[str]:
+    yield _ical_fold("BEGIN:VCALENDAR")
+    yield _ical_fold("VERSION:2.0")
+    yield _ical_fold("PRODID:-//Smart Task Manager//EN")
+    for task in tasks:
+        lines = [
+            "BEGIN:VTODO",
+            f"UID:{task.id}",
+            f"DTSTAMP:{_ical_timestamp(task.created_at)}",
+            f"CREATED:{_ical_timestamp(task.created_at)}",
+            f"SUMMARY:{_ical_escape(task.title)}",
+            f"PRIORITY:{ICAL_PRIORITIES.get(task.priority, 0)}",
+            f"STATUS:{'COMPLETED' if task.completed else 'NEEDS-ACTION'}",
+        ]
+        if task.description:
+            lines.append(f"DESCRIPTION:{_ical_escape(task.description)}")
+        if task.due_date:
+            lines.append(f"DUE;VALUE=DATE:{task.due_date.replace('-', '')[:8]}")
+        if task.tags:
+            lines.append(f"CATEGORIES:{','.join(_ical_escape(tag) for tag in task.tags)}")
+        lines.append("END:VTODO")
+        yield "".join(_ical_fold(line) for line in lines)
+    yield _ical_fold("END:VCALENDAR")
+
+
+EXPORT_FORMATS: Dict[str, Tuple[str, str, Callable[[Iterable[Task]], Iterator[str]]]] = {
+    "csv": ("CSV", ".csv", csv_lines),
+    "jsonl": ("JSON Lines", ".jsonl", jsonl_lines),
+    "md": ("Markdown checklist", ".md", markdown_lines),
+    "ics": ("iCalendar", ".ics", ical_lines),
+}
+
+
+def export_tasks(tasks: Iterable[Task], fmt: str, f: TextIO) -> Iterator[int]:
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    exported = 0
+
+    def counted():
+        nonlocal exported
+        for task in tasks:
+            yield task
+            exported += 1
+
+    last_reported = 0
+    for chunk in EXPORT_FORMATS[fmt][2](counted()):
+        f.write(chunk)
+        if exported != last_reported:
+            last_reported = exported
+            yield exported
+    if exported != last_reported:
+        yield exported
+
+
+def export_to_file(tasks: Iterable[Task], fmt: str, filename: str) -> Iterator[int]:
+    tmp_filename = filename + ".tmp"
+    completed = False
+    try:
+        with open(tmp_filename, "w", encoding="utf-8", newline="") as f:
+            yield from export_tasks(tasks, fmt, f)
+        os.replace(tmp_filename, filename)
+        completed = True
+    finally:
+        if not completed and os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+
+
+def _with_descriptions(tasks: Iterable[Task], descriptions: DescriptionStore) -> Iterator[Task]:
+    for task in tasks:
+        if not task.description_loaded:
+            task.set_description_source(descriptions.get)
+        yield task
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export Smart Task Manager tasks.")
+    parser.add_argument("format", choices=sorted(EXPORT_FORMATS))
+    parser.add_argument("output")
+    parser.add_argument("--file", default="~/.todos.json", help="task file to export from")
+    parser.add_argument("--query", default="", help='filter, e.g. "is:open priority:high"')
+    parser.add_argument("--archive", action="store_true", help="export archived tasks instead")
+    args = parser.parse_args(argv)
+
+    filename = os.path.expanduser(args.file)
+    descriptions = None
+    if args.archive:
+        tasks = TaskArchive(os.path.splitext(filename)[0] + '.archive.jsonl').iter_tasks()
+    else:
+        tasks = iter_tasks(filename)
+        descriptions_filename = os.path.splitext(filename)[0] + '.descriptions.bin'
+        if os.path.isfile(descriptions_filename):
+            descriptions = DescriptionStore(descriptions_filename)
+            tasks = _with_descriptions(tasks, descriptions)
+    if args.query:
+        plan = compile_query(args.query)
+        context = SimpleNamespace(due_dates=DueDateClassifier())
+        tasks = (task for task in tasks if plan.matches(task, context))
+
+    exported = 0
+    try:
+        for exported in export_to_file(tasks, args.format, args.output):
+            pass
+    finally:
+        if descriptions is not None:
+            descriptions.close()
+    print(f"Exported {exported} task(s) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
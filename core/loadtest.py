@@ -0,0 +1,136 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from core.server import ServerThread, parse_address
+from core.task import Task
+from core.task_manager import TaskManager
+
+
+class RpcClient:
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._ids = itertools.count(1)
+
+    @staticmethod
+    async def connect(address: Optional[str]) -> 'RpcClient':
+        path, host, port = parse_address(address)
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path, limit=16 * 1024 * 1024)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=16 * 1024 * 1024)
+        return RpcClient(reader, writer)
+
+    async def call(self, method: str, params: Optional[Dict] = None):
+        request = {'jsonrpc': '2.0', 'id': next(self._ids), 'method': method, 'params': params or {}}
+        self.writer.write(json.dumps(request).encode('utf-8') + b'\n')
+        await self.writer.drain()
+        while True:
+            response = json.loads(await self.reader.readline())
+            if 'id' in response:
+                break
+        if 'error' in response:
+            raise RuntimeError(response['error']['message'])
+        return response['result']
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def run_client(address: Optional[str], requests: int, write_ratio: float,
+                     task_ids: List[str], latencies: List[float], rng: random.Random):
+    client = await RpcClient.connect(address)
+    try:
+        for _ in range(requests):
+            roll = rng.random()
+            started = time.perf_counter()
+            if roll < write_ratio / 2:
+                await client.call('add', {'title': f'load test {rng.randrange(10 ** 6)}', 'priority': 3})
+            elif roll < write_ratio:
+                await client.call('toggle', {'id': rng.choice(task_ids)})
+            elif roll < (1 + write_ratio) / 2:
+                await client.call('get', {'id': rng.choice(task_ids)})
+            else:
+                await client.call('query', {'query': 'is:open priority:high', 'limit': 20})
+            latencies.append(time.perf_counter() - started)
+    finally:
+        await client.close()
+
+
+async def run_load(address: Optional[str], clients: int, requests: int, write_ratio: float, seed: int) -> Dict:
+    setup = await RpcClient.connect(address)
+    task_ids = [task['id'] for task in (await setup.call('query', {'limit': 1000}))['tasks']]
+    if not task_ids:
+        task_ids = [(await setup.call('add', {'title': 'load test seed'}))['id']]
+    await setup.close()
+
+    latencies: List[float] = []
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        run_client(address, requests, write_ratio, task_ids, latencies, random.Random(rng.random()))
+        for _ in range(clients)
+    ))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the Smart Task Manager JSON-RPC server.")
+    parser.add_argument("address", nargs="?", default=None,
+                        help="server to test; by default a temporary server is started in-process")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=100, help="requests per client")
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--tasks", type=int, default=5000, help="tasks to seed the temporary server with")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    server = None
+    manager = None
+    address = args.address
+    with tempfile.TemporaryDirectory() as directory:
+        if address is None:
+            manager = TaskManager(os.path.join(directory, 'todos.json'), background_writes=True)
+            rng = random.Random(args.seed)
+            manager.defer_writes()
+            for index in range(args.tasks):
+                manager.add_task(Task(id=f'seed-{index}', title=f'Seed task {index}',
+                                      priority=rng.choice((1, 2, 3))))
+            manager.flush_deferred_writes()
+            server = ServerThread(manager, address='0')
+            if not server.start():
+                parser.error(f"could not start server: {server.error}")
+            address = server.server.address
+
+        try:
+            result = asyncio.run(run_load(address, args.clients, args.requests, args.write_ratio, args.seed))
+        finally:
+            if server is not None:
+                server.stop()
+                manager.close()
+
+    print(f"{args.clients} clients, {result['requests']} requests in {result['seconds']:.2f} s")
+    print(f"{result['rps']:.0f} requests/s, p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
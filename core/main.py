@@ -1,26 +1,52 @@
 # Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import os
 import uuid
-from datetime import datetime
-from typing import Optional, List
+from concurrent.futures import Future
+from datetime import date, timedelta
+from typing import Callable, Iterable, Optional, List, Dict, Set, Tuple
 
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QMessageBox,
-    QLineEdit, QDialog, QTableWidget, QTableWidgetItem, QFrame,
+    QLineEdit, QDialog, QTableWidget, QTableWidgetItem, QTreeWidget, QTreeWidgetItem, QFrame,
     QHeaderView, QHBoxLayout, QGroupBox, QTextEdit, QDateEdit, QComboBox,
-    QMenu, QAction, QGridLayout, QCheckBox, QRadioButton, QButtonGroup, QDesktopWidget
+    QMenu, QAction, QGridLayout, QCheckBox, QRadioButton, QButtonGroup, QDesktopWidget,
+    QInputDialog, QFileDialog, QProgressDialog, QSpinBox, QDateTimeEdit, QSystemTrayIcon,
+    QApplication, QStyle, QTabWidget, QListWidget, QListWidgetItem
 )
 from PyQt5.QtGui import QFont, QColor
-from PyQt5.QtCore import Qt, QDate
+from PyQt5.QtCore import Qt, QDate, QDateTime, QEventLoop, QTimer, pyqtSignal
+
+from core.analytics import PRIORITIES, ProductivityStats
+from core.archive import TaskArchive
+from core.due_dates import DUE_NONE, DUE_OVERDUE, DUE_TODAY, DUE_FUTURE, msecs_until_midnight
+from core.export import EXPORT_FORMATS, export_to_file
+from core.query import QueryError, compile_query, is_structured_query
+from core.recurrence import FREQUENCIES, Recurrence
+from core.server import ServerThread
+from core.sync import TaskFileReplica, sync_managers
+from core.task import Task, normalize_tags
+from core.task_lists import DEFAULT_LIST, TaskListError, TaskLists
+from core.task_manager import TaskManager, ARCHIVE_AFTER_DAYS
+
+
+class TaskTreeItem(QTreeWidgetItem):
+    def __init__(self, task: Task):
+        super().__init__()
+        self.task = task
 
-from core.task import Task
-from core.task_manager import TaskManager
+    def data(self, column, role):
+        if column == 0 and role == Qt.ToolTipRole:
+            return self.task.description
+        return super().data(column, role)
 
 
 class TaskInputDialog(QDialog):
-    def __init__(self, parent=None, task: Optional[Task] = None):
+    def __init__(self, parent=None, task: Optional[Task] = None,
+                 find_duplicates: Optional[Callable[[str, str], List[Tuple[Task, float]]]] = None):
         super().__init__(parent)
         self.is_edit_mode = task is not None
         self.task = task
+        self.find_duplicates = find_duplicates
         self.setWindowTitle('Edit Task' if self.is_edit_mode else 'Create New Task')
         self.setMinimumWidth(500)
 
@@ -92,6 +118,81 @@ class TaskInputDialog(QDialog):
         settings_group.setLayout(settings_layout)
         self.layout.addWidget(settings_group)
 
+        tags_group = QGroupBox("Tags")
+        tags_layout = QVBoxLayout()
+        self.tags_input = QLineEdit(self)
+        self.tags_input.setPlaceholderText("e.g. work, home, project-x")
+        if task:
+            self.tags_input.setText(", ".join(task.tags))
+        tags_layout.addWidget(self.tags_input)
+        tags_group.setLayout(tags_layout)
+        self.layout.addWidget(tags_group)
+
+        repeat_group = QGroupBox("Repeat")
+        repeat_layout = QHBoxLayout()
+
+        self.repeat_combo = QComboBox(self)
+        self.repeat_combo.addItems(["Never", "Daily", "Weekly", "Monthly"])
+        repeat_layout.addWidget(self.repeat_combo)
+
+        repeat_layout.addWidget(QLabel('Every:'))
+        self.interval_input = QSpinBox(self)
+        self.interval_input.setRange(1, 365)
+        repeat_layout.addWidget(self.interval_input)
+
+        repeat_layout.addWidget(QLabel('Ends:'))
+        self.ends_combo = QComboBox(self)
+        self.ends_combo.addItems(["Never", "On date", "After"])
+        repeat_layout.addWidget(self.ends_combo)
+
+        self.until_input = QDateEdit(self)
+        self.until_input.setCalendarPopup(True)
+        self.until_input.setDate(QDate.currentDate().addMonths(3))
+        repeat_layout.addWidget(self.until_input)
+
+        self.count_input = QSpinBox(self)
+        self.count_input.setRange(1, 1000)
+        self.count_input.setValue(10)
+        self.count_input.setSuffix(" times")
+        repeat_layout.addWidget(self.count_input)
+
+        repeat_layout.addStretch()
+        repeat_group.setLayout(repeat_layout)
+        self.layout.addWidget(repeat_group)
+
+        if task and task.recurrence:
+            recurrence = task.recurrence
+            self.repeat_combo.setCurrentIndex(FREQUENCIES.index(recurrence.frequency) + 1)
+            self.interval_input.setValue(recurrence.interval)
+            if recurrence.until:
+                self.ends_combo.setCurrentIndex(1)
+                self.until_input.setDate(QDate.fromString(recurrence.until, Qt.ISODate))
+            elif recurrence.count is not None:
+                self.ends_combo.setCurrentIndex(2)
+                self.count_input.setValue(recurrence.count)
+
+        reminder_group = QGroupBox("Reminder")
+        reminder_layout = QHBoxLayout()
+        self.remind_check = QCheckBox("Remind me at", self)
+        reminder_layout.addWidget(self.remind_check)
+        self.remind_input = QDateTimeEdit(self)
+        self.remind_input.setCalendarPopup(True)
+        self.remind_input.setDisplayFormat("yyyy-MM-dd HH:mm")
+        self.remind_input.setDateTime(QDateTime.currentDateTime().addSecs(3600))
+        if task and task.remind_at:
+            self.remind_check.setChecked(True)
+            self.remind_input.setDateTime(QDateTime.fromString(task.remind_at, Qt.ISODate))
+        self.remind_input.setEnabled(self.remind_check.isChecked())
+        self.remind_check.toggled.connect(self.remind_input.setEnabled)
+        reminder_layout.addWidget(self.remind_input)
+        reminder_layout.addStretch()
+        reminder_group.setLayout(reminder_layout)
+        self.layout.addWidget(reminder_group)
+
+        self.repeat_combo.currentIndexChanged.connect(self.update_repeat_inputs)
+        self.ends_combo.currentIndexChanged.connect(self.update_repeat_inputs)
+        self.update_repeat_inputs()
+
         button_layout = QHBoxLayout()
         self.cancel_button = QPushButton('Cancel', self)
         self.cancel_button.clicked.connect(self.reject)
@@ -105,6 +206,23 @@ class TaskInputDialog(QDialog):
         button_layout.addWidget(self.submit_button)
         self.layout.addLayout(button_layout)
 
+    def accept(self):
+        inputs = self.get_inputs()
+        if self.find_duplicates is not None and len(inputs["title"]) >= 3:
+            matches = self.find_duplicates(inputs["title"], inputs["description"])
+            if matches:
+                similar = "\n".join(f"• {task.title} ({similarity:.0%} similar)" for task, similarity in matches)
+                reply = QMessageBox.question(
+                    self,
+                    'Possible Duplicate',
+                    f'Similar task(s) already exist:\n{similar}\n\nCreate this task anyway?',
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.No
+                )
+                if reply != QMessageBox.Yes:
+                    return
+        super().accept()
+
     def update_char_counter(self):
         current_length = len(self.title_input.text())
         remaining = 100 - current_length
@@ -118,13 +236,44 @@ class TaskInputDialog(QDialog):
         else:
             self.char_counter.setStyleSheet("color: #888; font-size: 10px;")
 
+    def update_repeat_inputs(self):
+        repeats = self.repeat_combo.currentIndex() > 0
+        self.interval_input.setEnabled(repeats)
+        self.ends_combo.setEnabled(repeats)
+        self.until_input.setEnabled(repeats and self.ends_combo.currentIndex() == 1)
+        self.count_input.setEnabled(repeats and self.ends_combo.currentIndex() == 2)
+
+    def get_recurrence(self) -> Optional[Recurrence]:
+        if self.repeat_combo.currentIndex() == 0:
+            return None
+        until = self.until_input.date().toString(Qt.ISODate) if self.ends_combo.currentIndex() == 1 else None
+        count = self.count_input.value() if self.ends_combo.currentIndex() == 2 else None
+        frequency = FREQUENCIES[self.repeat_combo.currentIndex() - 1]
+        anchor_day = self.due_input.date().day()
+        previous = self.task.recurrence if self.is_edit_mode else None
+        if (previous is not None and previous.anchor_day
+                and previous.frequency == frequency and previous.interval == self.interval_input.value()
+                and self.due_input.date().toString(Qt.ISODate) == self.task.due_date):
+            anchor_day = previous.anchor_day
+        return Recurrence(
+            frequency,
+            interval=self.interval_input.value(),
+            until=until,
+            count=count,
+            anchor_day=anchor_day
+        )
+
     def get_inputs(self):
         priority_map = {"High": 1, "Medium": 2, "Low": 3}
         return {
             "title": self.title_input.text().strip(),
             "description": self.desc_input.toPlainText().strip(),
             "priority": priority_map[self.priority_combo.currentText()],
-            "due_date": self.due_input.date().toString(Qt.ISODate)
+            "due_date": self.due_input.date().toString(Qt.ISODate),
+            "recurrence": self.get_recurrence(),
+            "remind_at": self.remind_input.dateTime().toString("yyyy-MM-ddTHH:mm")
+            if self.remind_check.isChecked() else None,
+            "tags": normalize_tags(self.tags_input.text())
         }
 
 
@@ -177,6 +326,19 @@ class TaskDisplayDialog(QDialog):
 
         info_layout.addLayout(dates_layout)
 
+        if task.recurrence:
+            repeat_label = QLabel(f'<b>Repeats:</b> {task.recurrence.describe()}')
+            info_layout.addWidget(repeat_label)
+
+        if task.remind_at:
+            remind_label = QLabel(f'<b>Reminder:</b> {task.remind_at.replace("T", " ")}')
+            info_layout.addWidget(remind_label)
+
+        if task.tags:
+            tags_label = QLabel(f'<b>Tags:</b> {" ".join("#" + tag for tag in task.tags)}')
+            tags_label.setTextFormat(Qt.RichText)
+            info_layout.addWidget(tags_label)
+
         info_group.setLayout(info_layout)
         self.layout.addWidget(info_group)
 
@@ -213,14 +375,500 @@ class TaskDisplayDialog(QDialog):
         self.accept()
 
 
+class ArchiveDialog(QDialog):
+    PAGE_SIZE = 50
+
+    def __init__(self, parent=None, archive: TaskArchive = None):
+        super().__init__(parent)
+        self.archive = archive
+        self.page = 0
+        self.setWindowTitle('Archived Tasks')
+        self.setMinimumSize(700, 500)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setSpacing(10)
+
+        search_layout = QHBoxLayout()
+        self.search_input = QLineEdit(self)
+        self.search_input.setPlaceholderText("Search archived tasks and press Enter...")
+        self.search_input.returnPressed.connect(self.search)
+        search_layout.addWidget(self.search_input)
+
+        self.search_button = QPushButton('🔍 Search', self)
+        self.search_button.clicked.connect(self.search)
+        search_layout.addWidget(self.search_button)
+        self.layout.addLayout(search_layout)
+
+        self.table_widget = QTableWidget()
+        self.table_widget.setColumnCount(4)
+        self.table_widget.setHorizontalHeaderLabels(['Title', 'Priority', 'Created', 'Due Date'])
+        self.table_widget.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table_widget.setAlternatingRowColors(True)
+        self.table_widget.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        for col in range(1, 4):
+            self.table_widget.horizontalHeader().setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        self.layout.addWidget(self.table_widget)
+
+        button_layout = QHBoxLayout()
+        self.prev_button = QPushButton('< Previous', self)
+        self.prev_button.clicked.connect(self.previous_page)
+        button_layout.addWidget(self.prev_button)
+
+        self.page_label = QLabel('')
+        self.page_label.setAlignment(Qt.AlignCenter)
+        button_layout.addWidget(self.page_label)
+
+        self.next_button = QPushButton('Next >', self)
+        self.next_button.clicked.connect(self.next_page)
+        button_layout.addWidget(self.next_button)
+
+        button_layout.addStretch()
+
+        self.close_button = QPushButton('Close', self)
+        self.close_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.close_button)
+        self.layout.addLayout(button_layout)
+
+        self.load_page()
+
+    def search(self):
+        self.page = 0
+        self.load_page()
+
+    def previous_page(self):
+        if self.page > 0:
+            self.page -= 1
+            self.load_page()
+
+    def next_page(self):
+        self.page += 1
+        self.load_page()
+
+    def load_page(self):
+        tasks, has_next = self.archive.page(self.page, self.PAGE_SIZE, self.search_input.text())
+
+        self.table_widget.setRowCount(0)
+        for task in tasks:
+            row = self.table_widget.rowCount()
+            self.table_widget.insertRow(row)
+            title_item = QTableWidgetItem(task.title)
+            title_item.setToolTip(task.description)
+            self.table_widget.setItem(row, 0, title_item)
+            priority_text = ["🚨 High", "⚠️ Medium", "📋 Low"][task.priority - 1]
+            self.table_widget.setItem(row, 1, QTableWidgetItem(priority_text))
+            self.table_widget.setItem(row, 2, QTableWidgetItem(task.created_at[:10]))
+            self.table_widget.setItem(row, 3, QTableWidgetItem(task.due_date or "No due date"))
+
+        self.page_label.setText(f"Page {self.page + 1}")
+        self.prev_button.setEnabled(self.page > 0)
+        self.next_button.setEnabled(has_next)
+
+
+class StatisticsDialog(QDialog):
+    DAYS = 14
+    WEEKS = 8
+
+    def __init__(self, parent=None, stats: ProductivityStats = None):
+        super().__init__(parent)
+        self.stats = stats
+        self.setWindowTitle('Statistics')
+        self.setMinimumSize(600, 500)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setSpacing(10)
+
+        week = stats.weekly(1)[0]
+        average = stats.average_completion_hours()
+        late_rate = stats.late_rate()
+        summary = QLabel(
+            f"<b>This week:</b> {week[1]} created, {week[2]} completed<br>"
+            f"<b>Average time to complete:</b> {self.format_hours(average)}<br>"
+            f"<b>Completed after due date:</b> {self.format_rate(late_rate)}"
+        )
+        self.layout.addWidget(summary)
+
+        tabs = QTabWidget(self)
+        tabs.addTab(self.create_table(['Day', 'Created', 'Completed'], [
+            (day.strftime('%a %Y-%m-%d'), created, completed)
+            for day, created, completed in reversed(stats.daily(self.DAYS))
+        ]), f'Last {self.DAYS} days')
+        tabs.addTab(self.create_table(['Week of', 'Created', 'Completed'], [
+            (day.isoformat(), created, completed)
+            for day, created, completed in reversed(stats.weekly(self.WEEKS))
+        ]), f'Last {self.WEEKS} weeks')
+        tabs.addTab(self.create_table(['Priority', 'Completed', 'Avg. time to complete', 'Late'], [
+            (["🚨 High", "⚠️ Medium", "📋 Low"][priority - 1],
+             stats.completed_count(priority),
+             self.format_hours(stats.average_completion_hours(priority)),
+             self.format_rate(stats.late_rate(priority)))
+            for priority in PRIORITIES
+        ]), 'By priority')
+        self.layout.addWidget(tabs)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.close_button = QPushButton('Close', self)
+        self.close_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.close_button)
+        self.layout.addLayout(button_layout)
+
+    @staticmethod
+    def format_hours(hours: Optional[float]) -> str:
+        if hours is None:
+            return "—"
+        if hours < 48:
+            return f"{hours:.1f} h"
+        return f"{hours / 24:.1f} days"
+
+    @staticmethod
+    def format_rate(rate: Optional[float]) -> str:
+        return "—" if rate is None else f"{rate:.0%}"
+
+    def create_table(self, headers: List[str], rows: List[tuple]) -> QTableWidget:
+        table = QTableWidget(len(rows), len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setAlternatingRowColors(True)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        for row, values in enumerate(rows):
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if col > 0:
+                    item.setTextAlignment(Qt.AlignCenter)
+                table.setItem(row, col, item)
+        return table
+
+
+class DuplicatesDialog(QDialog):
+    def __init__(self, parent=None, groups: List[List[Task]] = None, on_open_callback=None):
+        super().__init__(parent)
+        self.on_open_callback = on_open_callback
+        self.setWindowTitle('Possible Duplicates')
+        self.setMinimumSize(700, 450)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setSpacing(10)
+
+        task_count = sum(len(group) for group in groups)
+        summary_label = QLabel(f'{len(groups)} group(s) of similar tasks, {task_count} task(s) in total.'
+                               if groups else 'No similar tasks were found.')
+        self.layout.addWidget(summary_label)
+
+        self.tree_widget = QTreeWidget()
+        self.tree_widget.setColumnCount(4)
+        self.tree_widget.setHeaderLabels(['Title', 'Priority', 'Status', 'Created'])
+        self.tree_widget.setAlternatingRowColors(True)
+        self.tree_widget.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        for col in range(1, 4):
+            self.tree_widget.header().setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        self.tree_widget.itemDoubleClicked.connect(self.open_task)
+        for group in groups:
+            group_item = QTreeWidgetItem([f'{len(group)} similar tasks'])
+            self.tree_widget.addTopLevelItem(group_item)
+            for task in group:
+                priority_text = ["🚨 High", "⚠️ Medium", "📋 Low"][task.priority - 1]
+                task_item = QTreeWidgetItem([task.title, priority_text,
+                                             "✅ Completed" if task.completed else "⏳ Pending",
+                                             task.created_at[:10]])
+                task_item.setData(0, Qt.UserRole, task.id)
+                task_item.setToolTip(0, task.description)
+                group_item.addChild(task_item)
+            group_item.setExpanded(True)
+        self.layout.addWidget(self.tree_widget)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.close_button = QPushButton('Close', self)
+        self.close_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.close_button)
+        self.layout.addLayout(button_layout)
+
+    def open_task(self, item: QTreeWidgetItem):
+        task_id = item.data(0, Qt.UserRole)
+        if task_id and self.on_open_callback:
+            self.on_open_callback(task_id)
+
+
+class TaskListSearchDialog(QDialog):
+    MAX_RESULTS = 500
+
+    def __init__(self, parent=None, task_lists: TaskLists = None, on_open_callback=None):
+        super().__init__(parent)
+        self.task_lists = task_lists
+        self.on_open_callback = on_open_callback
+        self.setWindowTitle('Search All Lists')
+        self.setMinimumSize(700, 450)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setSpacing(10)
+
+        search_layout = QHBoxLayout()
+        self.search_input = QLineEdit(self)
+        self.search_input.setPlaceholderText('Search in title and description of every task list')
+        self.search_input.returnPressed.connect(self.run_search)
+        search_layout.addWidget(self.search_input)
+        self.search_button = QPushButton('Search', self)
+        self.search_button.clicked.connect(self.run_search)
+        search_layout.addWidget(self.search_button)
+        self.layout.addLayout(search_layout)
+
+        self.summary_label = QLabel('')
+        self.layout.addWidget(self.summary_label)
+
+        self.tree_widget = QTreeWidget()
+        self.tree_widget.setColumnCount(4)
+        self.tree_widget.setHeaderLabels(['Title', 'List', 'Priority', 'Status'])
+        self.tree_widget.setAlternatingRowColors(True)
+        self.tree_widget.setRootIsDecorated(False)
+        self.tree_widget.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        for col in range(1, 4):
+            self.tree_widget.header().setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        self.tree_widget.itemDoubleClicked.connect(self.open_task)
+        self.layout.addWidget(self.tree_widget)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.close_button = QPushButton('Close', self)
+        self.close_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.close_button)
+        self.layout.addLayout(button_layout)
+
+    def run_search(self):
+        text = self.search_input.text().strip()
+        self.tree_widget.clear()
+        if not text:
+            self.summary_label.setText('')
+            return
+        self.search_button.setEnabled(False)
+        self.summary_label.setText('Searching...')
+        count = 0
+        try:
+            for name, task in self.task_lists.search(text):
+                priority_text = ["🚨 High", "⚠️ Medium", "📋 Low"][task.priority - 1]
+                item = QTreeWidgetItem([task.title, name, priority_text,
+                                        "✅ Completed" if task.completed else "⏳ Pending"])
+                item.setData(0, Qt.UserRole, task.id)
+                item.setToolTip(0, task.description)
+                self.tree_widget.addTopLevelItem(item)
+                count += 1
+                if count >= self.MAX_RESULTS:
+                    break
+                if count % 50 == 0:
+                    QApplication.processEvents()
+        finally:
+            self.search_button.setEnabled(True)
+        if count >= self.MAX_RESULTS:
+            self.summary_label.setText(f'Showing the first {count} matching tasks.')
+        else:
+            self.summary_label.setText(f'{count} matching task(s).')
+
+    def open_task(self, item: QTreeWidgetItem):
+        task_id = item.data(0, Qt.UserRole)
+        if task_id and self.on_open_callback:
+            self.accept()
+            self.on_open_callback(item.text(1), task_id)
+
+
+class CalendarDialog(QDialog):
+    WEEKDAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    REFRESH_FIELDS = {'title', 'description', 'priority', 'completed', 'due_date', 'recurrence'}
+
+    def __init__(self, parent=None, manager: TaskManager = None, on_open_callback=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.on_open_callback = on_open_callback
+        self.anchor = manager.due_dates.today
+        self.cells: Dict[date, QListWidget] = {}
+        self.task_days: Dict[str, Set[date]] = {}
+        self.setWindowTitle('Calendar')
+        self.setMinimumSize(900, 600)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setSpacing(10)
+
+        nav_layout = QHBoxLayout()
+        self.mode_combo = QComboBox(self)
+        self.mode_combo.addItems(["Month", "Week"])
+        self.mode_combo.currentIndexChanged.connect(self.show_period)
+        nav_layout.addWidget(self.mode_combo)
+        self.btn_previous = QPushButton('◀', self)
+        self.btn_previous.clicked.connect(lambda: self.move_period(-1))
+        nav_layout.addWidget(self.btn_previous)
+        self.btn_today = QPushButton('Today', self)
+        self.btn_today.clicked.connect(self.go_to_today)
+        nav_layout.addWidget(self.btn_today)
+        self.btn_next = QPushButton('▶', self)
+        self.btn_next.clicked.connect(lambda: self.move_period(1))
+        nav_layout.addWidget(self.btn_next)
+        self.period_label = QLabel('')
+        font = QFont()
+        font.setBold(True)
+        self.period_label.setFont(font)
+        nav_layout.addWidget(self.period_label)
+        nav_layout.addStretch()
+        self.layout.addLayout(nav_layout)
+
+        self.grid = QTableWidget(0, 7)
+        self.grid.setHorizontalHeaderLabels(self.WEEKDAYS)
+        self.grid.verticalHeader().setVisible(False)
+        self.grid.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.grid.setSelectionMode(QTableWidget.NoSelection)
+        self.grid.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.grid.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.layout.addWidget(self.grid)
+
+        button_layout = QHBoxLayout()
+        button_layout.addWidget(QLabel('Double-click a task to open it. ↻ marks a repeat of a recurring task.'))
+        button_layout.addStretch()
+        self.close_button = QPushButton('Close', self)
+        self.close_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.close_button)
+        self.layout.addLayout(button_layout)
+
+        self.manager.add_listener(self.on_tasks_changed)
+        self.finished.connect(lambda: self.manager.remove_listener(self.on_tasks_changed))
+        self.show_period()
+
+    def period(self) -> Tuple[date, date]:
+        if self.mode_combo.currentIndex() == 1:
+            start = self.anchor - timedelta(days=self.anchor.weekday())
+            return start, start + timedelta(days=6)
+        first = self.anchor.replace(day=1)
+        start = first - timedelta(days=first.weekday())
+        return start, start + timedelta(days=41)
+
+    def move_period(self, step: int):
+        if self.mode_combo.currentIndex() == 1:
+            self.anchor += timedelta(days=7 * step)
+        else:
+            month_index = self.anchor.year * 12 + self.anchor.month - 1 + step
+            self.anchor = date(month_index // 12, month_index % 12 + 1, 1)
+        self.show_period()
+
+    def go_to_today(self):
+        self.anchor = self.manager.due_dates.today
+        self.show_period()
+
+    def show_period(self):
+        start, end = self.period()
+        if self.mode_combo.currentIndex() == 1:
+            self.period_label.setText(f'{start:%d %b %Y} – {end:%d %b %Y}')
+        else:
+            self.period_label.setText(f'{self.anchor:%B %Y}')
+        days = (end - start).days + 1
+        self.cells = {}
+        self.task_days = {}
+        self.grid.clearContents()
+        self.grid.setRowCount(days // 7)
+        tasks_by_day = self.manager.tasks_by_day(start, end)
+        repeats_by_day = self.repeats_between(start, end)
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            cell = QListWidget()
+            cell.itemDoubleClicked.connect(self.open_task)
+            self.grid.setCellWidget(offset // 7, offset % 7, cell)
+            self.cells[day] = cell
+            self.fill_day(day, tasks_by_day.get(day, []), repeats_by_day.get(day, []))
+
+    def repeats_between(self, start: date, end: date, task_ids: Optional[Set[str]] = None) -> Dict[date, List[Task]]:
+        repeats: Dict[date, List[Task]] = {}
+        for task, day in self.manager.occurrences_between(start, end):
+            if (task_ids is None or task.id in task_ids) and day != self.manager.due_dates.due(task.id):
+                repeats.setdefault(day, []).append(task)
+        return repeats
+
+    def fill_day(self, day: date, tasks: List[Task], repeats: List[Task]):
+        cell = self.cells[day]
+        cell.clear()
+        start, _ = self.period()
+        today = self.manager.due_dates.today
+        header = QListWidgetItem(f'{day.day} {day:%b}' if day.day == 1 or day == start else str(day.day))
+        header.setFlags(Qt.NoItemFlags)
+        font = header.font()
+        font.setBold(True)
+        header.setFont(font)
+        if day == today:
+            header.setForeground(QColor(42, 130, 218))
+        elif self.mode_combo.currentIndex() == 0 and day.month != self.anchor.month:
+            header.setForeground(QColor(120, 120, 120))
+        cell.addItem(header)
+        for task in tasks:
+            self.add_task_item(cell, day, task, repeat=False)
+        for task in repeats:
+            self.add_task_item(cell, day, task, repeat=True)
+
+    def add_task_item(self, cell: QListWidget, day: date, task: Task, repeat: bool):
+        icon = ["🚨", "⚠️", "📋"][task.priority - 1]
+        if repeat:
+            text = f'↻ {task.title}'
+        else:
+            text = f'{"✅" if task.completed else icon} {task.title}'
+        item = QListWidgetItem(text)
+        item.setData(Qt.UserRole, task.id)
+        item.setToolTip(task.description or task.title)
+        font = item.font()
+        font.setStrikeOut(task.completed and not repeat)
+        font.setItalic(repeat)
+        item.setFont(font)
+        if repeat:
+            item.setForeground(QColor(136, 136, 136))
+        elif self.manager.due_dates.is_overdue(task):
+            item.setForeground(QColor(255, 125, 125))
+        cell.addItem(item)
+        self.task_days.setdefault(task.id, set()).add(day)
+
+    def refresh_days(self, days: Iterable[date]):
+        days = sorted(day for day in set(days) if day in self.cells)
+        if not days:
+            return
+        repeats = self.repeats_between(days[0], days[-1])
+        for day in days:
+            tasks_by_day = self.manager.tasks_by_day(day, day)
+            for task_ids in self.task_days.values():
+                task_ids.discard(day)
+            self.fill_day(day, tasks_by_day.get(day, []), repeats.get(day, []))
+
+    def on_tasks_changed(self, event: str, task_ids: List[str], fields: Optional[Set[str]]):
+        if fields is not None and not fields & self.REFRESH_FIELDS:
+            return
+        start, end = self.period()
+        days: Set[date] = set()
+        for task_id in task_ids:
+            days.update(self.task_days.pop(task_id, ()))
+            due = self.manager.due_dates.due(task_id)
+            if due is not None:
+                days.add(due)
+        days.update(self.repeats_between(start, end, set(task_ids)))
+        self.refresh_days(days)
+
+    def open_task(self, item: QListWidgetItem):
+        task_id = item.data(Qt.UserRole)
+        if task_id and self.on_open_callback:
+            self.on_open_callback(task_id)
+
+
 class MainWindow(QWidget):
-    def __init__(self, parent=None):
+    write_failed = pyqtSignal(str)
+    server_call = pyqtSignal(object)
+
+    def __init__(self, parent=None, server_address: Optional[str] = None):
         super().__init__(parent)
         self.setWindowTitle('Smart Task Manager v1.1.2')
         self.resize(1000, 700)
 
-        self.todo_manager = TaskManager()
+        self.task_lists = TaskLists(factory=self.open_list_manager)
+        self.current_list = DEFAULT_LIST
+        self.todo_manager = self.task_lists.get(DEFAULT_LIST)
+        self.write_error_box: Optional[QMessageBox] = None
+        self.write_failed.connect(self.on_write_failed)
+        self.server_call.connect(self.run_server_call)
+        self.server_thread: Optional[ServerThread] = None
         self.all_tasks: List[Task] = []
+        self.task_items: Dict[str, QTreeWidgetItem] = {}
+        self.visible_ids: Set[str] = set()
+        self.expanded_ids: Set[str] = set()
+        self.filtered_tasks: List[Task] = []
 
         self.main_layout = QVBoxLayout()
         self.main_layout.setSpacing(15)
@@ -237,6 +885,26 @@ class MainWindow(QWidget):
 
         header_layout.addStretch()
 
+        header_layout.addWidget(QLabel('List:'))
+        self.list_combo = QComboBox(self)
+        self.list_combo.setMinimumWidth(160)
+        self.list_combo.setToolTip("Switch between task lists")
+        self.list_combo.activated[str].connect(self.switch_list)
+        header_layout.addWidget(self.list_combo)
+
+        self.btn_new_list = QPushButton('New List')
+        self.btn_new_list.clicked.connect(self.create_list)
+        header_layout.addWidget(self.btn_new_list)
+
+        self.btn_delete_list = QPushButton('Delete List')
+        self.btn_delete_list.clicked.connect(self.delete_list)
+        header_layout.addWidget(self.btn_delete_list)
+
+        self.btn_search_lists = QPushButton('Search All Lists')
+        self.btn_search_lists.setToolTip("Search titles and descriptions in every task list")
+        self.btn_search_lists.clicked.connect(self.search_all_lists)
+        header_layout.addWidget(self.btn_search_lists)
+
         self.stats_label = QLabel("0 tasks")
         self.stats_label.setStyleSheet("color: #888;")
         header_layout.addWidget(self.stats_label)
@@ -264,8 +932,13 @@ class MainWindow(QWidget):
         search_layout.addWidget(self.search_label, 0, 0)
 
         self.search_input = QLineEdit(self)
-        self.search_input.setPlaceholderText("Search in title and description...")
-        self.search_input.textChanged.connect(self.apply_filters)
+        self.search_input.setPlaceholderText(
+            'Search in title and description, or query: is:open priority:high due:<2026-11-01 "phrase"')
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_input.textChanged.connect(self.search_timer.start)
         self.search_input.setStyleSheet("""
             QLineEdit {
                 padding: 8px;
@@ -278,7 +951,16 @@ class MainWindow(QWidget):
                 border: 1px solid #2a82da;
             }
         """)
-        search_layout.addWidget(self.search_input, 0, 1, 1, 3)
+        search_layout.addWidget(self.search_input, 0, 1, 1, 2)
+
+        self.fuzzy_check = QCheckBox("Fuzzy")
+        self.fuzzy_check.setToolTip("Typo-tolerant search, best matches first")
+        self.fuzzy_check.stateChanged.connect(self.on_fuzzy_toggled)
+        self.fuzzy_index_timer = QTimer(self)
+        self.fuzzy_index_timer.setSingleShot(True)
+        self.fuzzy_index_timer.setInterval(100)
+        self.fuzzy_index_timer.timeout.connect(self.on_fuzzy_index_timer)
+        search_layout.addWidget(self.fuzzy_check, 0, 3)
 
         self.status_label = QLabel('Status:')
         search_layout.addWidget(self.status_label, 1, 0)
@@ -360,6 +1042,25 @@ class MainWindow(QWidget):
         """)
         search_layout.addWidget(self.reset_filters_btn, 4, 3)
 
+        self.view_label = QLabel('View:')
+        search_layout.addWidget(self.view_label, 4, 0)
+
+        self.view_combo = QComboBox(self)
+        self.view_combo.currentIndexChanged.connect(self.apply_filters)
+        search_layout.addWidget(self.view_combo, 4, 1)
+
+        self.btn_save_view = QPushButton("Save View")
+        self.btn_save_view.setToolTip("Save the current search and filters as a named view")
+        self.btn_save_view.clicked.connect(self.save_view)
+        self.btn_delete_view = QPushButton("Delete View")
+        self.btn_delete_view.clicked.connect(self.delete_view)
+
+        view_buttons_layout = QHBoxLayout()
+        view_buttons_layout.addWidget(self.btn_save_view)
+        view_buttons_layout.addWidget(self.btn_delete_view)
+        view_buttons_layout.addStretch()
+        search_layout.addLayout(view_buttons_layout, 4, 2)
+
         self.status_all_radio.toggled.connect(self.apply_filters)
         self.status_pending_radio.toggled.connect(self.apply_filters)
         self.status_completed_radio.toggled.connect(self.apply_filters)
@@ -376,18 +1077,38 @@ class MainWindow(QWidget):
         search_group.setLayout(search_layout)
         self.main_layout.addWidget(search_group)
 
-        self.table_widget = QTableWidget()
-        self.table_widget.setColumnCount(7)
-        self.table_widget.setHorizontalHeaderLabels(
+        self.selected_tags = []
+        self.tags_group = QGroupBox("Tags")
+        tags_layout = QVBoxLayout()
+        self.tag_mode_combo = QComboBox(self)
+        self.tag_mode_combo.addItems(["Match all (AND)", "Match any (OR)", "Exclude (NOT)"])
+        self.tag_mode_combo.setToolTip("How checked tags are combined")
+        self.tag_mode_combo.currentIndexChanged.connect(self.apply_filters)
+        tags_layout.addWidget(self.tag_mode_combo)
+        self.tag_list = QListWidget(self)
+        self.tag_list.setToolTip("Task counts follow the status and priority filters")
+        self.tag_list.itemChanged.connect(self.on_tag_item_changed)
+        tags_layout.addWidget(self.tag_list)
+        self.btn_clear_tags = QPushButton("Clear Tags")
+        self.btn_clear_tags.clicked.connect(self.clear_tag_filter)
+        tags_layout.addWidget(self.btn_clear_tags)
+        self.tags_group.setLayout(tags_layout)
+        self.tags_group.setMaximumWidth(220)
+
+        self.task_tree = QTreeWidget()
+        self.task_tree.setColumnCount(7)
+        self.task_tree.setHeaderLabels(
             ['Title', 'Priority', 'Status', 'Due Date', 'View', 'Edit', 'Delete'])
-        self.table_widget.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table_widget.setAlternatingRowColors(True)
-        self.table_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.table_widget.customContextMenuRequested.connect(self.show_context_menu)
-        self.table_widget.setStyleSheet("""
-            QTableWidget {
+        self.task_tree.setEditTriggers(QTreeWidget.NoEditTriggers)
+        self.task_tree.setAlternatingRowColors(True)
+        self.task_tree.setUniformRowHeights(True)
+        self.task_tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.task_tree.customContextMenuRequested.connect(self.show_context_menu)
+        self.task_tree.itemExpanded.connect(self.on_item_expanded)
+        self.task_tree.itemCollapsed.connect(self.on_item_collapsed)
+        self.task_tree.setStyleSheet("""
+            QTreeWidget {
                 background-color: #2a2a2a;
-                gridline-color: #444;
             }
             QHeaderView::section {
                 background-color: #353535;
@@ -397,22 +1118,25 @@ class MainWindow(QWidget):
             }
         """)
 
-        self.table_widget.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.table_widget.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.table_widget.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.table_widget.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.table_widget.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        self.table_widget.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        self.table_widget.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeToContents)
+        self.task_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.task_tree.header().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.task_tree.header().setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        self.task_tree.header().setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        self.task_tree.header().setSectionResizeMode(4, QHeaderView.ResizeToContents)
+        self.task_tree.header().setSectionResizeMode(5, QHeaderView.ResizeToContents)
+        self.task_tree.header().setSectionResizeMode(6, QHeaderView.ResizeToContents)
 
-        self.main_layout.addWidget(self.table_widget)
+        table_layout = QHBoxLayout()
+        table_layout.addWidget(self.task_tree, 1)
+        table_layout.addWidget(self.tags_group)
+        self.main_layout.addLayout(table_layout)
 
         button_layout = QHBoxLayout()
         button_layout.setSpacing(10)
 
         self.btn_new_task = QPushButton('+ Add Task')
         self.btn_new_task.setMinimumHeight(40)
-        self.btn_new_task.clicked.connect(self.add_task)
+        self.btn_new_task.clicked.connect(lambda: self.add_task())
         self.btn_new_task.setStyleSheet("""
             QPushButton {
                 background-color: #2a82da;
@@ -432,6 +1156,45 @@ class MainWindow(QWidget):
         self.btn_clear_completed.clicked.connect(self.clear_completed)
         button_layout.addWidget(self.btn_clear_completed)
 
+        self.btn_archive_completed = QPushButton('Archive Completed')
+        self.btn_archive_completed.setMinimumHeight(40)
+        self.btn_archive_completed.clicked.connect(self.archive_completed)
+        button_layout.addWidget(self.btn_archive_completed)
+
+        self.btn_export = QPushButton('Export')
+        self.btn_export.setMinimumHeight(40)
+        self.btn_export.setToolTip("Export the tasks currently shown in the table")
+        self.btn_export.clicked.connect(self.export_tasks)
+        button_layout.addWidget(self.btn_export)
+
+        self.btn_sync = QPushButton('Sync')
+        self.btn_sync.setMinimumHeight(40)
+        self.btn_sync.setToolTip("Merge changes with another task file, e.g. a copy in a synced folder")
+        self.btn_sync.clicked.connect(self.sync_with_file)
+        button_layout.addWidget(self.btn_sync)
+
+        self.btn_duplicates = QPushButton('Duplicates')
+        self.btn_duplicates.setMinimumHeight(40)
+        self.btn_duplicates.setToolTip("Find tasks that look like duplicates of each other")
+        self.btn_duplicates.clicked.connect(self.show_duplicates)
+        button_layout.addWidget(self.btn_duplicates)
+
+        self.btn_calendar = QPushButton('Calendar')
+        self.btn_calendar.setMinimumHeight(40)
+        self.btn_calendar.setToolTip("Show tasks by due date in a month or week calendar")
+        self.btn_calendar.clicked.connect(self.show_calendar)
+        button_layout.addWidget(self.btn_calendar)
+
+        self.btn_show_archive = QPushButton('Archive')
+        self.btn_show_archive.setMinimumHeight(40)
+        self.btn_show_archive.clicked.connect(self.show_archive)
+        button_layout.addWidget(self.btn_show_archive)
+
+        self.btn_statistics = QPushButton('Statistics')
+        self.btn_statistics.setMinimumHeight(40)
+        self.btn_statistics.clicked.connect(self.show_statistics)
+        button_layout.addWidget(self.btn_statistics)
+
         button_layout.addStretch()
 
         self.btn_help = QPushButton('? Help')
@@ -477,13 +1240,156 @@ class MainWindow(QWidget):
         self.main_layout.addLayout(footer_layout)
 
         self.setLayout(self.main_layout)
+
+        self.midnight_timer = QTimer(self)
+        self.midnight_timer.setSingleShot(True)
+        self.midnight_timer.timeout.connect(self.on_midnight)
+
+        self.reminder_timer = QTimer(self)
+        self.reminder_timer.setSingleShot(True)
+        self.reminder_timer.timeout.connect(self.on_reminder_timer)
+
+        self.tray_icon = None
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray_icon = QSystemTrayIcon(self.style().standardIcon(QStyle.SP_MessageBoxInformation), self)
+            self.tray_icon.setToolTip('Smart Task Manager')
+            self.tray_icon.show()
+
+        self.remote_refresh_timer = QTimer(self)
+        self.remote_refresh_timer.setSingleShot(True)
+        self.remote_refresh_timer.setInterval(100)
+        self.remote_refresh_timer.timeout.connect(self.on_remote_change)
+
         self._init()
         self.center_window()
+        if server_address is not None:
+            self.start_server(server_address or None)
 
     def _init(self):
         self.all_tasks = list(self.todo_manager.tasks.values())
+        self.refresh_list_combo()
+        self.refresh_view_combo()
         self.update_stats()
         self.apply_filters()
+        self.schedule_midnight_timer()
+        self.todo_manager.reminders.on_next_changed = self.arm_reminder_timer
+        self.arm_reminder_timer()
+
+    def open_list_manager(self, filename: str) -> TaskManager:
+        manager = TaskManager(filename, lazy_descriptions=True, background_writes=True)
+        manager.on_write_error = lambda error: self.write_failed.emit(str(error))
+        return manager
+
+    def refresh_list_combo(self):
+        self.list_combo.clear()
+        self.list_combo.addItems(self.task_lists.names())
+        self.list_combo.setCurrentText(self.current_list)
+        self.btn_delete_list.setEnabled(self.current_list != DEFAULT_LIST)
+
+    def switch_list(self, name: str):
+        if name == self.current_list:
+            return
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            manager = self.task_lists.get(name)
+        except TaskListError as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.warning(self, 'Task Lists', str(e))
+            self.refresh_list_combo()
+            return
+        try:
+            self.todo_manager.reminders.on_next_changed = None
+            manager.roll_over_due_dates()
+            self.todo_manager = manager
+            self.current_list = name
+            self.expanded_ids.clear()
+            self.selected_tags = []
+            self._init()
+        finally:
+            QApplication.restoreOverrideCursor()
+
+    def create_list(self):
+        name, ok = QInputDialog.getText(self, 'New Task List', 'List name:')
+        if not ok or not name.strip():
+            return
+        try:
+            self.task_lists.create(name)
+        except (TaskListError, OSError) as e:
+            QMessageBox.warning(self, 'Task Lists', str(e))
+            return
+        self.switch_list(name.strip())
+
+    def delete_list(self):
+        name = self.current_list
+        reply = QMessageBox.question(
+            self, 'Delete List',
+            f'Delete the task list "{name}" with all of its tasks and archive?',
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+        if name in self.task_lists.pinned:
+            QMessageBox.warning(self, 'Task Lists', f'Task list {name} is being served and cannot be deleted.')
+            return
+        self.switch_list(DEFAULT_LIST)
+        try:
+            self.task_lists.delete(name)
+        except (TaskListError, OSError) as e:
+            QMessageBox.warning(self, 'Task Lists', str(e))
+        self.refresh_list_combo()
+
+    def search_all_lists(self):
+        dialog = TaskListSearchDialog(self, self.task_lists, on_open_callback=self.open_list_task)
+        dialog.exec_()
+
+    def open_list_task(self, name: str, task_id: str):
+        self.switch_list(name)
+        if self.current_list == name:
+            self.view_task_by_id(task_id)
+
+    def arm_reminder_timer(self):
+        msecs = self.todo_manager.reminders.msecs_until_next()
+        if msecs is None:
+            self.reminder_timer.stop()
+        else:
+            self.reminder_timer.start(msecs)
+
+    def on_reminder_timer(self):
+        for task_id in self.todo_manager.reminders.pop_due():
+            task = self.todo_manager.get_task(task_id)
+            if task:
+                self.notify_reminder(task)
+                self.todo_manager.clear_reminder(task_id)
+        self.arm_reminder_timer()
+
+    def notify_reminder(self, task: Task):
+        message = task.title if not task.due_date else f'{task.title}\nDue: {task.due_date}'
+        if self.tray_icon is not None and QSystemTrayIcon.supportsMessages():
+            self.tray_icon.showMessage('Task Reminder', message, QSystemTrayIcon.Information, 10000)
+            return
+        QApplication.alert(self)
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Task Reminder')
+        msg_box.setText(message)
+        msg_box.setIcon(QMessageBox.Information)
+        msg_box.setWindowModality(Qt.NonModal)
+        msg_box.show()
+
+    def schedule_midnight_timer(self):
+        self.midnight_timer.start(msecs_until_midnight() + 1000)
+
+    def on_midnight(self):
+        changed_ids = self.todo_manager.roll_over_due_dates()
+        self.task_lists.roll_over_due_dates()
+        if changed_ids:
+            if self.can_refresh_in_place({'due_date'}):
+                for task_id in changed_ids:
+                    task = self.todo_manager.get_task(task_id)
+                    if task:
+                        self.refresh_task_row(task, {'due_date'})
+            else:
+                self.apply_filters()
+            self.update_stats()
+        self.schedule_midnight_timer()
 
     def center_window(self):
         frame = self.frameGeometry()
@@ -495,20 +1401,124 @@ class MainWindow(QWidget):
         total = len(self.all_tasks)
         completed = sum(1 for task in self.all_tasks if task.completed)
         pending = total - completed
-        self.stats_label.setText(f"{total} tasks ({completed} completed, {pending} pending)")
+        overdue = sum(1 for task in self.all_tasks if self.todo_manager.due_dates.is_overdue(task))
+        self.stats_label.setText(
+            f"{total} tasks ({completed} completed, {pending} pending, {overdue} overdue)")
+        self.update_view_counts()
+        self.refresh_tag_panel()
+
+    def refresh_view_combo(self, selected: Optional[str] = None):
+        self.view_combo.blockSignals(True)
+        self.view_combo.clear()
+        self.view_combo.addItem("All tasks", None)
+        for view in self.todo_manager.views:
+            self.view_combo.addItem(f"{view.name} ({view.count})", view.name)
+        index = self.view_combo.findData(selected) if selected else 0
+        self.view_combo.setCurrentIndex(max(index, 0))
+        self.view_combo.blockSignals(False)
+        self.btn_delete_view.setEnabled(self.view_combo.currentData() is not None)
+
+    def update_view_counts(self):
+        for index in range(1, self.view_combo.count()):
+            view = self.todo_manager.views.get(self.view_combo.itemData(index))
+            if view:
+                self.view_combo.setItemText(index, f"{view.name} ({view.count})")
+
+    def current_view(self):
+        view_name = self.view_combo.currentData()
+        return self.todo_manager.views.get(view_name) if view_name else None
+
+    def current_filter_query(self) -> str:
+        terms = []
+        if self.status_pending_radio.isChecked():
+            terms.append("is:open")
+        elif self.status_completed_radio.isChecked():
+            terms.append("is:done")
+
+        priorities = [name for name, check in (("high", self.priority_high_check),
+                                               ("medium", self.priority_medium_check),
+                                               ("low", self.priority_low_check)) if check.isChecked()]
+        if priorities and len(priorities) < 3:
+            terms.append("priority:" + ",".join(priorities))
+
+        if self.date_overdue_radio.isChecked():
+            terms.append("is:overdue")
+        elif self.date_today_radio.isChecked():
+            terms.append("is:today")
+        elif self.date_future_radio.isChecked():
+            terms.append("is:future")
+
+        if self.selected_tags:
+            mode = self.tag_mode_combo.currentIndex()
+            if mode == 0:
+                terms.extend(f"tag:{tag}" for tag in self.selected_tags)
+            elif mode == 1:
+                terms.append("tag:" + ",".join(self.selected_tags))
+            else:
+                terms.extend(f"-tag:{tag}" for tag in self.selected_tags)
+
+        search_text = self.search_input.text().strip()
+        if search_text:
+            terms.append(search_text)
+        return " ".join(terms)
+
+    def save_view(self):
+        query = self.current_filter_query()
+        if not query:
+            QMessageBox.information(
+                self,
+                'Nothing to Save',
+                'Set a search or filters first, then save them as a view.'
+            )
+            return
+
+        name, ok = QInputDialog.getText(self, 'Save View', f'View name for:\n{query}')
+        name = name.strip()
+        if not ok or not name:
+            return
+
+        try:
+            self.todo_manager.views.add(name, query, self.todo_manager)
+        except QueryError as e:
+            QMessageBox.warning(self, 'Invalid Query', str(e))
+            return
 
-    def add_item(self, task: Task):
-        row_position = self.table_widget.rowCount()
-        self.table_widget.insertRow(row_position)
+        self.refresh_view_combo(selected=name)
+        self.reset_filters()
 
-        title_item = QTableWidgetItem(task.title)
-        title_item.setToolTip(task.description)
+    def delete_view(self):
+        view = self.current_view()
+        if view is None:
+            return
+        self.todo_manager.views.remove(view.name)
+        self.refresh_view_combo()
+        self.apply_filters()
+
+    @staticmethod
+    def due_text(task: Task) -> str:
+        due_text = task.due_date if task.due_date else "No due date"
+        if task.recurrence:
+            due_text += " ↻"
+        return due_text
+
+    def title_text(self, task: Task) -> str:
+        done, total = self.todo_manager.progress(task.id)
+        return f"{task.title} ({done}/{total})" if total else task.title
+
+    def add_item(self, task: Task, parent: Optional[QTreeWidgetItem] = None) -> QTreeWidgetItem:
+        item = TaskTreeItem(task)
+        item.setData(0, Qt.UserRole, task.id)
+        item.setText(0, self.title_text(task))
         if task.completed:
-            title_item.setForeground(QColor(100, 100, 100))
-            font = title_item.font()
+            item.setForeground(0, QColor(100, 100, 100))
+            font = item.font(0)
             font.setStrikeOut(True)
-            title_item.setFont(font)
-        self.table_widget.setItem(row_position, 0, title_item)
+            item.setFont(0, font)
+        if parent is None:
+            self.task_tree.addTopLevelItem(item)
+        else:
+            parent.addChild(item)
+        self.task_items[task.id] = item
 
         priority_text = ["🚨 High", "⚠️ Medium", "📋 Low"][task.priority - 1]
         priority_label = QLabel(priority_text)
@@ -527,7 +1537,7 @@ class MainWindow(QWidget):
         priority_layout.setContentsMargins(0, 0, 0, 0)
         priority_widget.setLayout(priority_layout)
 
-        self.table_widget.setCellWidget(row_position, 1, priority_widget)
+        self.task_tree.setItemWidget(item, 1, priority_widget)
 
         status_button = QPushButton("✅ Completed" if task.completed else "⏳ Pending")
         status_button.setCheckable(True)
@@ -548,19 +1558,14 @@ class MainWindow(QWidget):
             }
         """)
         status_button.clicked.connect(lambda checked, t_id=task.id: self.toggle_task_status_by_id(t_id))
-        status_button.task_id = task.id
-        self.table_widget.setCellWidget(row_position, 2, status_button)
-
-        due_text = task.due_date if task.due_date else "No due date"
-        due_item = QTableWidgetItem(due_text)
-        due_item.setTextAlignment(Qt.AlignCenter)
+        self.task_tree.setItemWidget(item, 2, status_button)
 
-        if task.due_date and not task.completed:
-            due_date = datetime.fromisoformat(task.due_date).date()
-            if due_date < datetime.now().date():
-                due_item.setForeground(QColor(255, 100, 100))
+        item.setText(3, self.due_text(task))
+        item.setTextAlignment(3, Qt.AlignCenter)
+        item.setToolTip(3, task.recurrence.describe() if task.recurrence else "")
 
-        self.table_widget.setItem(row_position, 3, due_item)
+        if self.todo_manager.due_dates.is_overdue(task):
+            item.setForeground(3, QColor(255, 100, 100))
 
         view_button = QPushButton("👁 View")
         view_button.setStyleSheet("""
@@ -576,8 +1581,7 @@ class MainWindow(QWidget):
             }
         """)
         view_button.clicked.connect(lambda checked, t_id=task.id: self.view_task_by_id(t_id))
-        view_button.task_id = task.id
-        self.table_widget.setCellWidget(row_position, 4, view_button)
+        self.task_tree.setItemWidget(item, 4, view_button)
 
         edit_button = QPushButton("✏️ Edit")
         edit_button.setStyleSheet("""
@@ -593,8 +1597,7 @@ class MainWindow(QWidget):
             }
         """)
         edit_button.clicked.connect(lambda checked, t_id=task.id: self.edit_task_by_id(t_id))
-        edit_button.task_id = task.id
-        self.table_widget.setCellWidget(row_position, 5, edit_button)
+        self.task_tree.setItemWidget(item, 5, edit_button)
 
         delete_button = QPushButton("Delete")
         delete_button.setToolTip("Delete this task")
@@ -612,12 +1615,61 @@ class MainWindow(QWidget):
             }
         """)
         delete_button.clicked.connect(lambda checked, t_id=task.id: self.delete_task_by_id(t_id))
-        delete_button.task_id = task.id
-        self.table_widget.setCellWidget(row_position, 6, delete_button)
+        self.task_tree.setItemWidget(item, 6, delete_button)
+
+        if self.todo_manager.subtasks.has_children(task.id):
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+            if task.id in self.expanded_ids:
+                item.setExpanded(True)
+        return item
+
+    def on_item_expanded(self, item: QTreeWidgetItem):
+        task_id = item.data(0, Qt.UserRole)
+        self.expanded_ids.add(task_id)
+        if item.childCount():
+            return
+        subtasks = [task for task in self.todo_manager.subtasks_of(task_id) if task.id in self.visible_ids]
+        for task in subtasks:
+            self.add_item(task, item)
+        if not subtasks:
+            item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicator)
+
+    def expand_item(self, task_id: str):
+        item = self.task_items.get(task_id)
+        if item is None:
+            return
+        item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        if item.isExpanded() and not item.childCount():
+            self.on_item_expanded(item)
+        item.setExpanded(True)
+
+    def on_item_collapsed(self, item: QTreeWidgetItem):
+        self.expanded_ids.discard(item.data(0, Qt.UserRole))
+
+    def on_fuzzy_toggled(self):
+        if self.fuzzy_check.isChecked() and self.todo_manager.fully_loaded:
+            self.fuzzy_index_ready()
+        self.apply_filters()
+
+    def fuzzy_index_ready(self) -> bool:
+        if self.todo_manager.prepare_fuzzy_index():
+            return True
+        if not self.fuzzy_index_timer.isActive():
+            self.fuzzy_index_timer.start()
+        return False
+
+    def on_fuzzy_index_timer(self):
+        if self.fuzzy_check.isChecked() and self.fuzzy_index_ready():
+            self.apply_filters()
 
     def apply_filters(self):
+        self.search_timer.stop()
         search_text = self.search_input.text().lower()
 
+        if not self.todo_manager.fully_loaded and (search_text or self.status_completed_radio.isChecked()):
+            self.all_tasks.extend(self.todo_manager.load_all())
+            self.update_stats()
+
         if self.status_pending_radio.isChecked():
             status_filter = "pending"
         elif self.status_completed_radio.isChecked():
@@ -633,46 +1685,86 @@ class MainWindow(QWidget):
         if self.priority_low_check.isChecked():
             selected_priorities.append(3)
 
-        today = datetime.now().date()
+        due_dates = self.todo_manager.due_dates
+        view = self.current_view()
+        self.btn_delete_view.setEnabled(view is not None)
+
+        self.refresh_tag_panel()
+        tag_bitmap = self.tag_filter_bitmap()
+        tag_ids = set(self.todo_manager.tag_index.ids(tag_bitmap)) if tag_bitmap is not None else None
 
-        filtered_tasks = []
-        for task in self.all_tasks:
-            if search_text:
-                if (search_text not in task.title.lower() and
-                        search_text not in task.description.lower()):
-                    continue
+        def passes_filters(task: Task) -> bool:
+            if view is not None and task.id not in view.task_ids:
+                return False
+
+            if tag_ids is not None and task.id not in tag_ids:
+                return False
 
             if status_filter == "pending" and task.completed:
-                continue
+                return False
             if status_filter == "completed" and not task.completed:
-                continue
+                return False
 
             if task.priority not in selected_priorities:
-                continue
-
-            if task.due_date:
-                try:
-                    due_date = datetime.fromisoformat(task.due_date).date()
-                    if self.date_overdue_radio.isChecked():
-                        if not (due_date < today and not task.completed):
-                            continue
-                    elif self.date_today_radio.isChecked():
-                        if not (due_date == today):
-                            continue
-                    elif self.date_future_radio.isChecked():
-                        if not (due_date > today):
-                            continue
-                except ValueError:
-                    pass
-
-            filtered_tasks.append(task)
-
-        self.table_widget.setRowCount(0)
+                return False
+
+            due_category = due_dates.category(task.id)
+            if due_category != DUE_NONE:
+                if self.date_overdue_radio.isChecked():
+                    if not (due_category == DUE_OVERDUE and not task.completed):
+                        return False
+                elif self.date_today_radio.isChecked():
+                    if due_category != DUE_TODAY:
+                        return False
+                elif self.date_future_radio.isChecked():
+                    if due_category != DUE_FUTURE:
+                        return False
+            return True
+
+        query_plan = None
+        self.search_input.setToolTip("")
+        if search_text and is_structured_query(search_text):
+            try:
+                query_plan = compile_query(search_text)
+            except QueryError as e:
+                self.search_input.setToolTip(f"Query error: {e}")
+
+        if query_plan is not None:
+            filtered_tasks = [task for task in query_plan.execute(self.todo_manager) if passes_filters(task)]
+        elif search_text and self.fuzzy_check.isChecked() and self.fuzzy_index_ready():
+            filtered_tasks = self.todo_manager.fuzzy_search(search_text, predicate=passes_filters)
+        else:
+            description_matches = self.todo_manager.search_descriptions(search_text) if search_text else set()
+            if view is not None:
+                candidates = sorted((self.todo_manager.tasks[task_id] for task_id in view.task_ids
+                                     if task_id in self.todo_manager.tasks),
+                                    key=lambda task: (task.created_at, task.id))
+            elif tag_bitmap is not None:
+                candidates = sorted((self.todo_manager.tasks[task_id]
+                                     for task_id in self.todo_manager.tag_index.ids(tag_bitmap)),
+                                    key=lambda task: (task.created_at, task.id))
+            else:
+                candidates = self.all_tasks
+            filtered_tasks = []
+            for task in candidates:
+                if search_text:
+                    if search_text not in task.title.lower() and task.id not in description_matches:
+                        continue
+                if passes_filters(task):
+                    filtered_tasks.append(task)
+
+        self.filtered_tasks = filtered_tasks
+        self.visible_ids = {task.id for task in filtered_tasks}
+        subtasks = self.todo_manager.subtasks
+        self.task_items.clear()
+        self.task_tree.clear()
         for task in filtered_tasks:
-            self.add_item(task)
+            if subtasks.parent(task.id) not in self.visible_ids:
+                self.add_item(task)
 
     def reset_filters(self):
         self.search_input.clear()
+        self.fuzzy_check.setChecked(False)
         self.status_all_radio.setChecked(True)
 
         self.priority_high_check.setChecked(True)
@@ -680,74 +1772,168 @@ class MainWindow(QWidget):
         self.priority_low_check.setChecked(True)
 
         self.date_all_radio.setChecked(True)
+        self.selected_tags = []
+        self.tag_mode_combo.setCurrentIndex(0)
+        self.apply_filters()
+
+    def facet_filters(self) -> Tuple[Optional[bool], List[int]]:
+        completed = None
+        if self.status_pending_radio.isChecked():
+            completed = False
+        elif self.status_completed_radio.isChecked():
+            completed = True
+        priorities = [priority for priority, check in ((1, self.priority_high_check),
+                                                       (2, self.priority_medium_check),
+                                                       (3, self.priority_low_check)) if check.isChecked()]
+        return completed, priorities
+
+    def tag_filter_bitmap(self) -> Optional[int]:
+        if not self.selected_tags:
+            return None
+        tag_index = self.todo_manager.tag_index
+        base = tag_index.facet(*self.facet_filters())
+        mode = self.tag_mode_combo.currentIndex()
+        if mode == 2:
+            return tag_index.select(exclude=self.selected_tags, base=base)
+        return tag_index.select(self.selected_tags, match_all=mode == 0, base=base)
+
+    def refresh_tag_panel(self):
+        tag_index = self.todo_manager.tag_index
+        counts = tag_index.counts(tag_index.facet(*self.facet_filters()))
+        tags = sorted(set(counts) | set(self.selected_tags))
+        self.tag_list.blockSignals(True)
+        if [self.tag_list.item(row).data(Qt.UserRole) for row in range(self.tag_list.count())] != tags:
+            self.tag_list.clear()
+            for tag in tags:
+                item = QListWidgetItem()
+                item.setData(Qt.UserRole, tag)
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Checked if tag in self.selected_tags else Qt.Unchecked)
+                self.tag_list.addItem(item)
+        for row in range(self.tag_list.count()):
+            item = self.tag_list.item(row)
+            tag = item.data(Qt.UserRole)
+            item.setText(f"#{tag} ({counts.get(tag, 0)})")
+        self.tag_list.blockSignals(False)
+        self.tags_group.setTitle(f"Tags ({len(counts)})")
+
+    def on_tag_item_changed(self, item: QListWidgetItem):
+        tag = item.data(Qt.UserRole)
+        if item.checkState() == Qt.Checked and tag not in self.selected_tags:
+            self.selected_tags.append(tag)
+        elif item.checkState() != Qt.Checked and tag in self.selected_tags:
+            self.selected_tags.remove(tag)
         self.apply_filters()
 
-    def refresh_task_row(self, task: Task):
-        for row in range(self.table_widget.rowCount()):
-            for col in [2, 4, 5, 6]:
-                widget = self.table_widget.cellWidget(row, col)
-                if widget and hasattr(widget, 'task_id') and widget.task_id == task.id:
-                    title_item = self.table_widget.item(row, 0)
-                    if title_item:
-                        title_item.setText(task.title)
-                        title_item.setToolTip(task.description)
-
-                        if task.completed:
-                            title_item.setForeground(QColor(100, 100, 100))
-                            font = title_item.font()
-                            font.setStrikeOut(True)
-                            title_item.setFont(font)
-                        else:
-                            title_item.setForeground(QColor(255, 255, 255))
-                            font = title_item.font()
-                            font.setStrikeOut(False)
-                            title_item.setFont(font)
-
-                    priority_text = ["🚨 High", "⚠️ Medium", "📋 Low"][task.priority - 1]
-                    priority_widget = self.table_widget.cellWidget(row, 1)
-                    if priority_widget:
-                        priority_label = priority_widget.findChild(QLabel)
-                        if priority_label:
-                            priority_label.setText(priority_text)
-                            if task.priority == 1:
-                                priority_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
-                            elif task.priority == 2:
-                                priority_label.setStyleSheet("color: #ffd166; font-weight: bold;")
-                            else:
-                                priority_label.setStyleSheet("color: #8ac926; font-weight: bold;")
-
-                    status_button = self.table_widget.cellWidget(row, 2)
-                    if isinstance(status_button, QPushButton):
-                        status_button.setText("✅ Completed" if task.completed else "⏳ Pending")
-                        status_button.setChecked(task.completed)
-
-                    due_text = task.due_date if task.due_date else "No due date"
-                    due_item = self.table_widget.item(row, 3)
-                    if due_item:
-                        due_item.setText(due_text)
-                        due_item.setForeground(QColor(255, 255, 255))
-                        if task.due_date and not task.completed:
-                            due_date = datetime.fromisoformat(task.due_date).date()
-                            if due_date < datetime.now().date():
-                                due_item.setForeground(QColor(255, 100, 100))
-
-                    for col in [2, 4, 5, 6]:
-                        widget = self.table_widget.cellWidget(row, col)
-                        if widget:
-                            widget.task_id = task.id
+    def clear_tag_filter(self):
+        if self.selected_tags:
+            self.selected_tags = []
+            self.apply_filters()
 
-                    return
+    def remove_task_row(self, task_id: str):
+        item = self.task_items.pop(task_id, None)
+        if item is None:
+            return
+        pending = [item]
+        while pending:
+            child = pending.pop()
+            for index in range(child.childCount()):
+                pending.append(child.child(index))
+                self.task_items.pop(child.child(index).data(0, Qt.UserRole), None)
+        parent = item.parent()
+        if parent is None:
+            self.task_tree.takeTopLevelItem(self.task_tree.indexOfTopLevelItem(item))
+        else:
+            parent.removeChild(item)
+
+    def refresh_progress(self, task_ids: Iterable[str]):
+        for task_id in task_ids:
+            item = self.task_items.get(task_id)
+            if item is not None:
+                item.setText(0, self.title_text(item.task))
+                if not self.todo_manager.subtasks.has_children(task_id):
+                    item.setChildIndicatorPolicy(QTreeWidgetItem.DontShowIndicator)
+
+    def can_refresh_in_place(self, fields: Set[str]) -> bool:
+        search_text = self.search_input.text()
+        if self.current_view() is not None or is_structured_query(search_text) or 'parent_id' in fields:
+            return False
+        if search_text and fields & {'title', 'description'}:
+            return False
+        if self.selected_tags and fields & {'tags', 'completed', 'priority'}:
+            return False
+        if 'priority' in fields and not (self.priority_high_check.isChecked() and
+                                         self.priority_medium_check.isChecked() and
+                                         self.priority_low_check.isChecked()):
+            return False
+        if 'due_date' in fields and not self.date_all_radio.isChecked():
+            return False
+        if 'completed' in fields and not (self.status_all_radio.isChecked() and
+                                          not self.date_overdue_radio.isChecked()):
+            return False
+        return True
+
+    def refresh_task_row(self, task: Task, fields: Optional[Set[str]] = None):
+        item = self.task_items.get(task.id)
+        if item is None:
+            return
+
+        def changed(*names: str) -> bool:
+            return fields is None or any(name in fields for name in names)
+
+        if changed('title', 'description', 'completed'):
+            item.setText(0, self.title_text(task))
+            item.task = task
+
+            if task.completed:
+                item.setForeground(0, QColor(100, 100, 100))
+                font = item.font(0)
+                font.setStrikeOut(True)
+                item.setFont(0, font)
+            else:
+                item.setForeground(0, QColor(255, 255, 255))
+                font = item.font(0)
+                font.setStrikeOut(False)
+                item.setFont(0, font)
+            if changed('completed'):
+                self.refresh_progress(self.todo_manager.subtasks.ancestors(task.id))
+
+        priority_text = ["🚨 High", "⚠️ Medium", "📋 Low"][task.priority - 1]
+        priority_widget = self.task_tree.itemWidget(item, 1)
+        if priority_widget and changed('priority'):
+            priority_label = priority_widget.findChild(QLabel)
+            if priority_label:
+                priority_label.setText(priority_text)
+                if task.priority == 1:
+                    priority_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
+                elif task.priority == 2:
+                    priority_label.setStyleSheet("color: #ffd166; font-weight: bold;")
+                else:
+                    priority_label.setStyleSheet("color: #8ac926; font-weight: bold;")
+
+        status_button = self.task_tree.itemWidget(item, 2)
+        if isinstance(status_button, QPushButton) and changed('completed'):
+            status_button.setText("✅ Completed" if task.completed else "⏳ Pending")
+            status_button.setChecked(task.completed)
+
+        if changed('due_date', 'recurrence', 'completed'):
+            item.setText(3, self.due_text(task))
+            item.setToolTip(3, task.recurrence.describe() if task.recurrence else "")
+            item.setForeground(3, QColor(255, 255, 255))
+            if self.todo_manager.due_dates.is_overdue(task):
+                item.setForeground(3, QColor(255, 100, 100))
 
     def toggle_task_status_by_id(self, task_id: str):
         task = self.todo_manager.get_task(task_id)
         if task:
-            task.toggle_complete()
-            self.todo_manager.write_data()
-            for i, t in enumerate(self.all_tasks):
-                if t.id == task_id:
-                    self.all_tasks[i] = task
-                    break
-            self.apply_filters()
+            next_task = self.todo_manager.toggle_task(task_id)
+            if next_task is not None:
+                self.all_tasks.append(next_task)
+                self.apply_filters()
+            elif self.can_refresh_in_place({'completed'}):
+                self.refresh_task_row(task, {'completed'})
+            else:
+                self.apply_filters()
             self.update_stats()
 
     def view_task_by_id(self, task_id: str):
@@ -791,31 +1977,19 @@ class MainWindow(QWidget):
                 )
                 return
 
-            updated_task = Task(
-                id=task.id,
-                title=inputs["title"],
-                description=inputs["description"],
-                priority=inputs["priority"],
-                completed=task.completed,
-                created_at=task.created_at,
-                due_date=inputs["due_date"]
-            )
-
-            self.todo_manager.tasks[task.id] = updated_task
-            self.todo_manager.write_data()
-
-            for i, t in enumerate(self.all_tasks):
-                if t.id == task.id:
-                    self.all_tasks[i] = updated_task
-                    break
-
-            self.apply_filters()
-            self.update_stats()
+            fields = self.todo_manager.edit_task(task.id, **inputs)
+            if fields:
+                if self.can_refresh_in_place(fields):
+                    self.refresh_task_row(task, fields)
+                else:
+                    self.apply_filters()
+                if fields & {'priority', 'due_date', 'tags'}:
+                    self.update_stats()
 
             QMessageBox.information(
                 self,
                 'Updated',
-                f'Task "{updated_task.title}" has been updated.'
+                f'Task "{task.title}" has been updated.'
             )
 
     def delete_task_by_id(self, task_id: str):
@@ -824,9 +1998,13 @@ class MainWindow(QWidget):
             QMessageBox.warning(self, "Error", "Task not found")
             return
 
+        subtask_count = self.todo_manager.progress(task.id)[1]
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle('Confirm Deletion')
-        msg_box.setText(f'Delete task:\n<b>{task.title}</b>?')
+        if subtask_count:
+            msg_box.setText(f'Delete task:\n<b>{task.title}</b>\nand its {subtask_count} subtask(s)?')
+        else:
+            msg_box.setText(f'Delete task:\n<b>{task.title}</b>?')
         msg_box.setTextFormat(Qt.RichText)
         msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         msg_box.setDefaultButton(QMessageBox.No)
@@ -835,9 +2013,14 @@ class MainWindow(QWidget):
         reply = msg_box.exec_()
 
         if reply == QMessageBox.Yes:
+            parent_id = self.todo_manager.subtasks.parent(task.id)
+            removed_ids = set(self.todo_manager.subtasks.descendants(task.id))
+            removed_ids.add(task.id)
             self.todo_manager.delete_task(task.id)
-            self.all_tasks = [t for t in self.all_tasks if t.id != task.id]
-            self.apply_filters()
+            self.all_tasks = [t for t in self.all_tasks if t.id not in removed_ids]
+            self.remove_task_row(task.id)
+            if parent_id is not None:
+                self.refresh_progress([parent_id] + list(self.todo_manager.subtasks.ancestors(parent_id)))
             self.update_stats()
             QMessageBox.information(
                 self,
@@ -846,17 +2029,11 @@ class MainWindow(QWidget):
             )
 
     def show_context_menu(self, position):
-        row = self.table_widget.rowAt(position.y())
-        if row < 0:
+        item = self.task_tree.itemAt(position)
+        if item is None:
             return
 
-        task_id = None
-        for col in [2, 4, 5, 6]:
-            widget = self.table_widget.cellWidget(row, col)
-            if widget and hasattr(widget, 'task_id'):
-                task_id = widget.task_id
-                break
-
+        task_id = item.data(0, Qt.UserRole)
         if not task_id:
             return
 
@@ -880,16 +2057,28 @@ class MainWindow(QWidget):
         edit_action.triggered.connect(lambda: self.edit_task_by_id(task_id))
         menu.addAction(edit_action)
 
+        subtask_action = QAction("➕ Add Subtask")
+        subtask_action.triggered.connect(lambda: self.add_task(task_id))
+        menu.addAction(subtask_action)
+
+        top_level_action = QAction("⤴️ Make Top-Level Task")
+        top_level_action.triggered.connect(lambda: self.move_task_to_top_level(task_id))
+        top_level_action.setEnabled(self.todo_manager.subtasks.parent(task_id) is not None)
+        menu.addAction(top_level_action)
+
         menu.addSeparator()
 
         delete_action = QAction("🗑️ Delete Task")
         delete_action.triggered.connect(lambda: self.delete_task_by_id(task_id))
         menu.addAction(delete_action)
 
-        menu.exec_(self.table_widget.viewport().mapToGlobal(position))
+        menu.exec_(self.task_tree.viewport().mapToGlobal(position))
 
-    def add_task(self):
-        dialog = TaskInputDialog(self)
+    def add_task(self, parent_id: Optional[str] = None):
+        self.todo_manager.prepare_duplicate_index()
+        dialog = TaskInputDialog(self, find_duplicates=self.find_duplicates_if_ready)
+        if parent_id is not None:
+            dialog.setWindowTitle('Create New Subtask')
         if dialog.exec_() == QDialog.Accepted:
             inputs = dialog.get_inputs()
 
@@ -924,12 +2113,21 @@ class MainWindow(QWidget):
                 title=inputs["title"],
                 description=inputs["description"],
                 priority=inputs["priority"],
-                due_date=inputs["due_date"]
+                due_date=inputs["due_date"],
+                recurrence=inputs["recurrence"],
+                remind_at=inputs["remind_at"],
+                tags=inputs["tags"]
             )
 
-            self.todo_manager.add_task(task)
+            if parent_id is not None:
+                self.todo_manager.add_subtask(parent_id, task)
+                self.expanded_ids.add(parent_id)
+            else:
+                self.todo_manager.add_task(task)
             self.all_tasks.append(task)
             self.apply_filters()
+            if parent_id is not None:
+                self.expand_item(parent_id)
             self.update_stats()
 
             QMessageBox.information(
@@ -938,6 +2136,11 @@ class MainWindow(QWidget):
                 f'Task "{task.title}" has been created.'
             )
 
+    def move_task_to_top_level(self, task_id: str):
+        if self.todo_manager.get_task(task_id):
+            self.todo_manager.edit_task(task_id, parent_id=None)
+            self.apply_filters()
+
     def clear_completed(self):
         completed_count = self.todo_manager.completed_count
         if completed_count == 0:
@@ -967,6 +2170,162 @@ class MainWindow(QWidget):
                 f'{completed_count} completed task(s) have been cleared.'
             )
 
+    def archive_completed(self):
+        if self.todo_manager.completed_count == 0:
+            QMessageBox.information(
+                self,
+                'No Completed Tasks',
+                'There are no completed tasks to archive.'
+            )
+            return
+
+        days, ok = QInputDialog.getInt(
+            self,
+            'Archive Completed Tasks',
+            'Archive completed tasks older than (days):',
+            ARCHIVE_AFTER_DAYS, 0, 3650
+        )
+        if not ok:
+            return
+
+        archived_count = self.todo_manager.archive_completed(days)
+        self.all_tasks = list(self.todo_manager.tasks.values())
+        self.apply_filters()
+        self.update_stats()
+        QMessageBox.information(
+            self,
+            'Archived',
+            f'{archived_count} completed task(s) have been moved to the archive.'
+        )
+
+    def export_tasks(self):
+        row_count = len(self.filtered_tasks)
+        if row_count == 0:
+            QMessageBox.information(self, 'Nothing to Export', 'There are no tasks in the current view.')
+            return
+
+        name_filters = {f"{label} (*{extension})": fmt
+                        for fmt, (label, extension, _) in EXPORT_FORMATS.items()}
+        filename, selected_filter = QFileDialog.getSaveFileName(
+            self, 'Export Tasks', 'tasks.csv', ';;'.join(name_filters))
+        if not filename:
+            return
+        fmt = name_filters.get(selected_filter, 'csv')
+        extension = EXPORT_FORMATS[fmt][1]
+        if not filename.endswith(extension):
+            filename += extension
+
+        tasks = (task for task in self.filtered_tasks if task.id in self.todo_manager.tasks)
+
+        progress = QProgressDialog('Exporting tasks...', 'Cancel', 0, row_count, self)
+        progress.setWindowTitle('Export')
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+
+        exported = 0
+        export = export_to_file(tasks, fmt, filename)
+        try:
+            for exported in export:
+                if exported % 100 == 0 or exported == row_count:
+                    progress.setValue(exported)
+                if progress.wasCanceled():
+                    export.close()
+                    return
+        except OSError as e:
+            QMessageBox.warning(self, 'Export Failed', f'Could not export tasks:\n{e}')
+            return
+        finally:
+            progress.close()
+
+        QMessageBox.information(self, 'Exported', f'{exported} task(s) exported to {filename}.')
+
+    def sync_with_file(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            self, 'Sync With Task File', os.path.expanduser('~'), 'Task files (*.json);;All files (*)')
+        if not filename:
+            return
+        if os.path.abspath(filename) == os.path.abspath(self.todo_manager.filename):
+            QMessageBox.warning(self, 'Sync', 'Choose a different task file than the one in use.')
+            return
+
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        previous_ids = set(self.todo_manager.tasks)
+        try:
+            other = TaskFileReplica(filename)
+            try:
+                result = sync_managers(self.todo_manager, other)
+            finally:
+                other.close()
+        except (OSError, ValueError) as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.warning(self, 'Sync Failed', f'Could not sync with {filename}:\n{e}')
+            return
+        received = [task for task_id, task in self.todo_manager.tasks.items() if task_id not in previous_ids]
+        duplicates = [task for task in received
+                      if self.todo_manager.find_duplicates(task.title, task.description, exclude=task.id)]
+        QApplication.restoreOverrideCursor()
+
+        self.all_tasks = list(self.todo_manager.tasks.values())
+        self.apply_filters()
+        self.update_stats()
+        message = (f'Received {result.received} and sent {result.sent} changed task(s).\n'
+                   f'Removed {result.deleted_local} task(s) here and {result.deleted_remote} in the other file.')
+        if duplicates:
+            message += (f'\n\n{len(duplicates)} new task(s) look like duplicates of existing tasks. '
+                        f'Click Duplicates to review them.')
+        QMessageBox.information(self, 'Synced', message)
+
+    def find_duplicates_if_ready(self, title: str, description: str) -> List[Tuple[Task, float]]:
+        if not self.todo_manager.prepare_duplicate_index():
+            return []
+        return self.todo_manager.find_duplicates(title, description)
+
+    def show_duplicates(self):
+        if not self.todo_manager.fully_loaded:
+            self.all_tasks.extend(self.todo_manager.load_all())
+            self.apply_filters()
+            self.update_stats()
+        progress = QProgressDialog('Looking for similar tasks...', 'Cancel', 0, 0, self)
+        progress.setWindowTitle('Duplicates')
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        try:
+            if not self.wait_with_progress(progress, self.todo_manager.prepare_duplicate_index):
+                return
+            pairs = self.todo_manager.duplicate_pairs()
+            if not self.wait_with_progress(progress, pairs.done):
+                return
+            groups = self.todo_manager.duplicate_groups(pairs=pairs.result())
+        finally:
+            progress.close()
+        dialog = DuplicatesDialog(self, groups, on_open_callback=self.view_task_by_id)
+        dialog.exec_()
+
+    def wait_with_progress(self, progress: QProgressDialog, done: Callable[[], bool]) -> bool:
+        while not done():
+            if progress.wasCanceled():
+                return False
+            loop = QEventLoop()
+            QTimer.singleShot(50, loop.quit)
+            loop.exec_()
+        return True
+
+    def show_calendar(self):
+        if not self.todo_manager.fully_loaded:
+            self.all_tasks.extend(self.todo_manager.load_all())
+            self.apply_filters()
+            self.update_stats()
+        dialog = CalendarDialog(self, self.todo_manager, on_open_callback=self.view_task_by_id)
+        dialog.exec_()
+
+    def show_archive(self):
+        dialog = ArchiveDialog(self, self.todo_manager.archive)
+        dialog.exec_()
+
+    def show_statistics(self):
+        dialog = StatisticsDialog(self, self.todo_manager.stats)
+        dialog.exec_()
+
     def show_help(self):
         QMessageBox.information(
             self,
@@ -980,11 +2339,24 @@ class MainWindow(QWidget):
             '<li>View detailed task information</li>'
             '<li>Right-click on tasks for context menu with quick actions</li>'
             '<li>Delete individual tasks or clear all completed at once</li>'
+            '<li>Archive old completed tasks and browse the archive on demand</li>'
             '<li>Search tasks by text in title and description</li>'
+            '<li>Enable Fuzzy search to tolerate typos and rank the best matches first</li>'
             '<li>Filter tasks by status (All/Pending/Completed)</li>'
             '<li>Filter tasks by priority (High/Medium/Low)</li>'
             '<li>Filter tasks by due date (All/Overdue/Today/Future)</li>'
             '<li>Reset all filters with one click</li>'
+            '<li>Save the current search and filters as a named view</li>'
+            '<li>Set a reminder time to get a desktop notification</li>'
+            '<li>Repeat tasks daily, weekly or monthly; the next one appears when you complete the current one</li>'
+            '<li>Export the tasks shown to CSV, JSON Lines, Markdown or iCalendar</li>'
+            '<li>Tag tasks and filter by tags with AND, OR or NOT in the Tags panel, or with tag:work in the search box</li>'
+            '<li>Right-click a task to add subtasks; parents show how many of their subtasks are done</li>'
+            '<li>Get a warning before creating a task similar to an existing one, and list all likely duplicates with Duplicates</li>'
+            '<li>See tasks by due date in a month or week Calendar, including repeats of recurring tasks</li>'
+            '<li>Keep separate task lists, switch between them from the header and search all lists at once</li>'
+            '<li>Sync with another copy of your task file; only changed tasks are exchanged</li>'
+            '<li>Open Statistics for tasks created and completed per day and week, time to complete and late completions by priority</li>'
             '</ul>'
             '<p><b>Quick Actions:</b></p>'
             '<ul>'
@@ -992,13 +2364,20 @@ class MainWindow(QWidget):
             '<li>Right-click any task for context menu</li>'
             '<li>Use search box for instant filtering</li>'
             '</ul>'
+            '<p><b>Search queries:</b></p>'
+            '<ul>'
+            '<li>is:open, is:done, is:overdue, is:today, is:future</li>'
+            '<li>priority:high or priority:high,medium</li>'
+            '<li>due:&lt;2026-11-01, due:&gt;=today, due:none, created:&gt;2026-01-01</li>'
+            '<li>"exact phrase" and -term to exclude</li>'
+            '</ul>'
             '<p><b>Priority levels:</b></p>'
             '<ul>'
             '<li>🚨 High - Urgent tasks (Red)</li>'
             '<li>⚠️ Medium - Important tasks (Yellow)</li>'
             '<li>📋 Low - Nice-to-have tasks (Green)</li>'
             '</ul>'
-            '<p>Tasks are automatically saved to ~/.todos.json</p>'
+            '<p>Tasks are automatically saved to ~/.todos.json, extra task lists to ~/.todo-lists</p>'
             '<hr>'
             '<p><b>Links:</b></p>'
             '<p>'
@@ -1007,6 +2386,52 @@ class MainWindow(QWidget):
             '</p>'
         )
 
+    def start_server(self, address: Optional[str]):
+        self.server_thread = ServerThread(self.todo_manager, self.invoke_on_gui_thread, address)
+        if not self.server_thread.start():
+            QMessageBox.warning(self, 'Server Error',
+                                f'Could not start the task server: {self.server_thread.error}')
+            self.server_thread = None
+            return
+        self.task_lists.pin(self.current_list)
+        self.setWindowTitle(f'Smart Task Manager v1.1.2 — serving on {self.server_thread.server.address}')
+
+    def invoke_on_gui_thread(self, fn) -> Future:
+        future = Future()
+        self.server_call.emit((fn, future))
+        return future
+
+    def run_server_call(self, call):
+        fn, future = call
+        if not future.set_running_or_notify_cancel():
+            return
+        manager = self.server_thread.server.manager if self.server_thread is not None else self.todo_manager
+        revision = manager.revision
+        try:
+            future.set_result(fn())
+        except Exception as e:
+            future.set_exception(e)
+        if (manager is self.todo_manager and manager.revision != revision
+                and not self.remote_refresh_timer.isActive()):
+            self.remote_refresh_timer.start()
+
+    def on_remote_change(self):
+        self.all_tasks = list(self.todo_manager.tasks.values())
+        self.apply_filters()
+        self.update_stats()
+
+    def on_write_failed(self, message: str):
+        if self.write_error_box is not None and self.write_error_box.isVisible():
+            self.write_error_box.setInformativeText(message)
+            return
+        self.write_error_box = QMessageBox(self)
+        self.write_error_box.setWindowTitle('Save Failed')
+        self.write_error_box.setText('Your changes could not be saved. They will be retried on the next change.')
+        self.write_error_box.setInformativeText(message)
+        self.write_error_box.setIcon(QMessageBox.Warning)
+        self.write_error_box.setWindowModality(Qt.NonModal)
+        self.write_error_box.show()
+
     def closeEvent(self, event):
         if self.todo_manager.count > 0:
             reply = QMessageBox.question(
@@ -1017,9 +2442,32 @@ class MainWindow(QWidget):
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
-            if reply == QMessageBox.Yes:
-                event.accept()
-            else:
+            if reply != QMessageBox.Yes:
                 event.ignore()
-        else:
-            event.accept()
+                return
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            saved = self.task_lists.flush()
+        finally:
+            QApplication.restoreOverrideCursor()
+        if not saved:
+            reply = QMessageBox.warning(
+                self,
+                'Save Failed',
+                'Some changes could not be saved, even after retrying.\n'
+                'Exit anyway and lose them?',
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                event.ignore()
+                return
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            if self.server_thread is not None:
+                self.server_thread.stop()
+                self.server_thread = None
+            self.task_lists.close()
+        finally:
+            QApplication.restoreOverrideCursor()
+        event.accept()
@@ -0,0 +1,118 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import threading
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from core.storage import write_json
+
+Records = Dict[str, Dict]
+
+
+class BackgroundWriter:
+
+    def __init__(self, write: Callable[[Records, Optional[Iterable[str]]], None],
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        self._write = write
+        self.on_error = on_error
+        self._condition = threading.Condition()
+        self._pending: Optional[Records] = None
+        self._pending_ids: Optional[Set[str]] = set()
+        self._failed_ids: Optional[Set[str]] = set()
+        self._failed_records: Optional[Records] = None
+        self._pending_files: Dict[str, Dict] = {}
+        self._failed_files: Dict[str, Dict] = {}
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='task-writer', daemon=True)
+        self._thread.start()
+
+    @property
+    def idle(self) -> bool:
+        with self._condition:
+            return self._pending is None and not self._busy
+
+    @property
+    def failed(self) -> bool:
+        with self._condition:
+            return self._failed_ids is None or bool(self._failed_ids) or bool(self._failed_files)
+
+    def submit(self, records: Records, task_ids: Optional[Iterable[str]] = None,
+               files: Optional[Dict[str, Dict]] = None):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Writer is closed.")
+            self._pending_ids = self._merge_ids(self._pending_ids if self._pending is not None else set(),
+                                                task_ids)
+            self._pending = records
+            if files:
+                self._pending_files.update(files)
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def retry(self):
+        with self._condition:
+            if self._pending is None and self._failed_records is not None:
+                self._pending = self._failed_records
+                self._pending_ids = set()
+                self._condition.notify_all()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        if not self.flush(timeout):
+            return False
+        if self.failed:
+            self.retry()
+            if not self.flush(timeout):
+                return False
+        return not self.failed
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        drained = self.drain(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return drained
+
+    @staticmethod
+    def _merge_ids(current: Optional[Set[str]], task_ids: Optional[Iterable[str]]) -> Optional[Set[str]]:
+        if current is None or task_ids is None:
+            return None
+        return current | set(task_ids)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                records = self._pending
+                task_ids = self._merge_ids(self._pending_ids, self._failed_ids)
+                files = dict(self._failed_files, **self._pending_files)
+                self._pending = None
+                self._pending_ids = set()
+                self._failed_ids = set()
+                self._pending_files = {}
+                self._failed_files = {}
+                self._busy = True
+
+            try:
+                self._write(records, task_ids)
+                while files:
+                    filename, data = next(iter(files.items()))
+                    write_json(filename, data)
+                    del files[filename]
+                with self._condition:
+                    self._failed_records = None
+            except Exception as e:
+                with self._condition:
+                    self._failed_ids = self._merge_ids(self._failed_ids, task_ids)
+                    self._failed_records = records
+                    self._failed_files = files
+                if self.on_error is not None:
+                    self.on_error(e)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
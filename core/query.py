@@ -0,0 +1,272 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import re
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Callable, List, Optional, Set, Tuple
+
+from core.due_dates import DUE_FUTURE, DUE_NONE, DUE_OVERDUE, DUE_TODAY, parse_due_date
+from core.task import Task, normalize_tags
+
+QUERY_KEYS = ('is', 'priority', 'due', 'created', 'tag')
+PRIORITY_NAMES = {'high': 1, 'medium': 2, 'low': 3, '1': 1, '2': 2, '3': 3}
+STATUS_NAMES = {'open': False, 'pending': False, 'done': True, 'completed': True}
+DUE_NAMES = {'overdue': DUE_OVERDUE, 'today': DUE_TODAY, 'future': DUE_FUTURE}
+
+_TOKEN_RE = re.compile(r'(-?)(?:(\w+):)?(?:"([^"]*)"|(\S+))')
+_COMPARISON_RE = re.compile(r'(<=|>=|<|>|=)?(.+)')
+_STRUCTURED_RE = re.compile(r'(^|\s)-?(?:(?:%s):|")' % '|'.join(QUERY_KEYS))
+
+Predicate = Callable[[Task], bool]
+
+
+class QueryError(ValueError):
+    pass
+
+
+def is_structured_query(text: str) -> bool:
+    return bool(_STRUCTURED_RE.search(text))
+
+
+def parse_query_date(value: str) -> date:
+    if value == 'today':
+        return date.today()
+    if value == 'tomorrow':
+        return date.today() + timedelta(days=1)
+    if value == 'yesterday':
+        return date.today() - timedelta(days=1)
+    parsed = parse_due_date(value)
+    if parsed is None:
+        raise QueryError(f'Invalid date: {value}')
+    return parsed
+
+
+def date_bounds(value: str) -> Tuple[Optional[date], Optional[date]]:
+    operator, raw_date = _COMPARISON_RE.fullmatch(value).groups()
+    day = parse_query_date(raw_date)
+    if operator == '<':
+        return None, day - timedelta(days=1)
+    if operator == '<=':
+        return None, day
+    if operator == '>':
+        return day + timedelta(days=1), None
+    if operator == '>=':
+        return day, None
+    return day, day
+
+
+class Clause:
+    cost = 0
+
+    def __init__(self, negated: bool = False):
+        self.negated = negated
+
+    def bind(self, manager) -> Tuple[Optional[Set[str]], Optional[Predicate]]:
+        predicate = self.predicate(manager)
+        if self.negated:
+            return None, lambda task: not predicate(task)
+        return None, predicate
+
+    def predicate(self, manager) -> Predicate:
+        return lambda task: self.test(task, manager)
+
+    def matches(self, task: Task, manager) -> bool:
+        return self.test(task, manager) != self.negated
+
+    def test(self, task: Task, manager) -> bool:
+        raise NotImplementedError
+
+
+class IndexedClause(Clause):
+
+    def bind(self, manager) -> Tuple[Optional[Set[str]], Optional[Predicate]]:
+        ids = self.candidates(manager)
+        if self.negated:
+            return None, lambda task: task.id not in ids
+        return ids, None
+
+    def candidates(self, manager) -> Set[str]:
+        raise NotImplementedError
+
+
+class StatusClause(Clause):
+    cost = 0
+
+    def __init__(self, completed: bool, negated: bool = False):
+        super().__init__(negated)
+        self.completed = completed
+
+    def predicate(self, manager) -> Predicate:
+        completed = self.completed
+        return lambda task: task.completed == completed
+
+    def test(self, task: Task, manager) -> bool:
+        return task.completed == self.completed
+
+
+class PriorityClause(Clause):
+    cost = 0
+
+    def __init__(self, priorities: Set[int], negated: bool = False):
+        super().__init__(negated)
+        self.priorities = frozenset(priorities)
+
+    def predicate(self, manager) -> Predicate:
+        priorities = self.priorities
+        return lambda task: task.priority in priorities
+
+    def test(self, task: Task, manager) -> bool:
+        return task.priority in self.priorities
+
+
+class DueCategoryClause(Clause):
+    cost = 1
+
+    def __init__(self, category: str, negated: bool = False):
+        super().__init__(negated)
+        self.category = category
+
+    def predicate(self, manager) -> Predicate:
+        due_dates = manager.due_dates
+        if self.category == DUE_OVERDUE:
+            return due_dates.is_overdue
+        category = self.category
+        return lambda task: due_dates.category(task.id) == category
+
+    def test(self, task: Task, manager) -> bool:
+        category = manager.due_dates.classify_date(parse_due_date(task.due_date))
+        if self.category == DUE_OVERDUE:
+            return category == DUE_OVERDUE and not task.completed
+        return category == self.category
+
+
+class DueRangeClause(IndexedClause):
+    cost = 1
+
+    def __init__(self, low: Optional[date], high: Optional[date], negated: bool = False):
+        super().__init__(negated)
+        self.low = low
+        self.high = high
+
+    def candidates(self, manager) -> Set[str]:
+        return manager.due_dates.ids_between(self.low, self.high)
+
+    def test(self, task: Task, manager) -> bool:
+        due = parse_due_date(task.due_date)
+        return (due is not None and (self.low is None or due >= self.low) and
+                (self.high is None or due <= self.high))
+
+
+class TagClause(IndexedClause):
+    cost = 0
+
+    def __init__(self, tags: Set[str], negated: bool = False):
+        super().__init__(negated)
+        self.tags = frozenset(tags)
+
+    def candidates(self, manager) -> Set[str]:
+        return set(manager.tag_index.ids(manager.tag_index.select(self.tags, match_all=False)))
+
+    def test(self, task: Task, manager) -> bool:
+        return not self.tags.isdisjoint(task.tags)
+
+
+class CreatedRangeClause(Clause):
+    cost = 2
+
+    def __init__(self, low: Optional[date], high: Optional[date], negated: bool = False):
+        super().__init__(negated)
+        self.low = low.isoformat() if low else None
+        self.high = high.isoformat() if high else None
+
+    def test(self, task: Task, manager) -> bool:
+        created = task.created_at[:10]
+        return (self.low is None or created >= self.low) and (self.high is None or created <= self.high)
+
+
+class TextClause(Clause):
+    cost = 3
+
+    def __init__(self, text: str, negated: bool = False):
+        super().__init__(negated)
+        self.text = text.lower()
+
+    def predicate(self, manager) -> Predicate:
+        description_matches = manager.search_descriptions(self.text)
+        return lambda task: self.text in task.title.lower() or task.id in description_matches
+
+    def test(self, task: Task, manager) -> bool:
+        return self.text in task.title.lower() or self.text in task.description.lower()
+
+
+class QueryPlan:
+
+    def __init__(self, clauses: List[Clause]):
+        self.clauses = sorted(clauses, key=lambda clause: clause.cost)
+
+    def execute(self, manager) -> List[Task]:
+        candidate_sets = []
+        predicates = []
+        for clause in self.clauses:
+            ids, predicate = clause.bind(manager)
+            if ids is not None:
+                candidate_sets.append(ids)
+            if predicate is not None:
+                predicates.append(predicate)
+
+        if candidate_sets:
+            candidate_sets.sort(key=len)
+            ids = set(candidate_sets[0]).intersection(*candidate_sets[1:])
+            tasks = sorted((manager.tasks[task_id] for task_id in ids if task_id in manager.tasks),
+                           key=lambda task: (task.created_at, task.id))
+        else:
+            tasks = manager.tasks.values()
+
+        for predicate in predicates:
+            tasks = filter(predicate, tasks)
+        return list(tasks)
+
+    def matches(self, task: Task, manager) -> bool:
+        return all(clause.matches(task, manager) for clause in self.clauses)
+
+
+def _compile_term(key: str, value: str, negated: bool) -> Clause:
+    if key == 'is':
+        if value in STATUS_NAMES:
+            return StatusClause(STATUS_NAMES[value], negated)
+        if value in DUE_NAMES:
+            return DueCategoryClause(DUE_NAMES[value], negated)
+        raise QueryError(f'Unknown status: {value}')
+
+    if key == 'priority':
+        try:
+            return PriorityClause({PRIORITY_NAMES[name] for name in value.split(',')}, negated)
+        except KeyError as e:
+            raise QueryError(f'Unknown priority: {e.args[0]}')
+
+    if key == 'tag':
+        tags = normalize_tags(value)
+        if not tags:
+            raise QueryError('Missing value for tag:')
+        return TagClause(set(tags), negated)
+
+    if key == 'due':
+        if value == 'none':
+            return DueCategoryClause(DUE_NONE, negated)
+        return DueRangeClause(*date_bounds(value), negated=negated)
+
+    return CreatedRangeClause(*date_bounds(value), negated=negated)
+
+
+@lru_cache(maxsize=128)
+def compile_query(text: str) -> QueryPlan:
+    clauses = []
+    for match in _TOKEN_RE.finditer(text.strip()):
+        negation, key, phrase, word = match.groups()
+        value = phrase if phrase is not None else word
+        if key and key.lower() in QUERY_KEYS:
+            if not value:
+                raise QueryError(f'Missing value for {key}:')
+            clauses.append(_compile_term(key.lower(), value.lower(), bool(negation)))
+        elif value:
+            clauses.append(TextClause(f'{key}:{value}' if key else value, bool(negation)))
+    return QueryPlan(clauses)
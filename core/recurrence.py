@@ -0,0 +1,119 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import calendar
+from datetime import date, timedelta
+from typing import Dict, Iterator, Optional
+
+FREQUENCIES = ('daily', 'weekly', 'monthly')
+FREQUENCY_UNITS = {'daily': 'day', 'weekly': 'week', 'monthly': 'month'}
+
+
+def add_months(day: date, months: int, anchor_day: Optional[int] = None) -> date:
+    month_index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(month_index, 12)
+    last_day = calendar.monthrange(year, month + 1)[1]
+    return date(year, month + 1, min(anchor_day or day.day, last_day))
+
+
+class Recurrence:
+
+    def __init__(self, frequency: str, interval: int = 1, until: Optional[str] = None,
+                 count: Optional[int] = None, anchor_day: Optional[int] = None):
+        if frequency not in FREQUENCIES:
+            raise ValueError(f"Unknown frequency: {frequency}")
+        if interval < 1:
+            raise ValueError("Interval must be at least 1.")
+        self._frequency = frequency
+        self._interval = interval
+        self._until = until
+        self._count = count
+        self._anchor_day = anchor_day
+
+    @property
+    def frequency(self) -> str:
+        return self._frequency
+
+    @property
+    def interval(self) -> int:
+        return self._interval
+
+    @property
+    def until(self) -> Optional[str]:
+        return self._until
+
+    @property
+    def count(self) -> Optional[int]:
+        return self._count
+
+    @property
+    def anchor_day(self) -> Optional[int]:
+        return self._anchor_day
+
+    def step(self, start: date, index: int) -> date:
+        if self._frequency == 'daily':
+            return start + timedelta(days=index * self._interval)
+        if self._frequency == 'weekly':
+            return start + timedelta(weeks=index * self._interval)
+        return add_months(start, index * self._interval, self._anchor_day or start.day)
+
+    def first_index_on_or_after(self, start: date, day: date) -> int:
+        if day <= start:
+            return 0
+        if self._frequency == 'monthly':
+            months = (day.year - start.year) * 12 + day.month - start.month
+            index = max(months // self._interval, 0)
+        else:
+            days_per_step = self._interval * (7 if self._frequency == 'weekly' else 1)
+            index = (day - start).days // days_per_step
+        while self.step(start, index) < day:
+            index += 1
+        return index
+
+    def occurrences(self, start: date, window_start: Optional[date] = None,
+                    window_end: Optional[date] = None) -> Iterator[date]:
+        until = date.fromisoformat(self._until) if self._until else None
+        index = self.first_index_on_or_after(start, window_start) if window_start else 0
+        while self._count is None or index < self._count:
+            day = self.step(start, index)
+            if (until and day > until) or (window_end and day > window_end):
+                return
+            yield day
+            index += 1
+
+    def next_after(self, start: date) -> Optional['Recurrence']:
+        if self._count is not None and self._count <= 1:
+            return None
+        next_day = self.step(start, 1)
+        if self._until and next_day > date.fromisoformat(self._until):
+            return None
+        count = self._count - 1 if self._count is not None else None
+        return Recurrence(self._frequency, self._interval, self._until, count,
+                          self._anchor_day or start.day)
+
+    def describe(self) -> str:
+        unit = FREQUENCY_UNITS[self._frequency]
+        text = f"Every {unit}" if self._interval == 1 else f"Every {self._interval} {unit}s"
+        if self._until:
+            text += f" until {self._until}"
+        elif self._count is not None:
+            text += f", {self._count} time(s) left"
+        return text
+
+    def to_dict(self) -> Dict:
+        data = {"frequency": self._frequency, "interval": self._interval}
+        if self._until:
+            data["until"] = self._until
+        if self._count is not None:
+            data["count"] = self._count
+        if self._anchor_day:
+            data["anchor_day"] = self._anchor_day
+        return data
+
+    @staticmethod
+    def from_dict(data: Dict) -> 'Recurrence':
+        return Recurrence(
+            frequency=data['frequency'],
+            interval=data.get('interval', 1),
+            until=data.get('until'),
+            count=data.get('count'),
+            anchor_day=data.get('anchor_day')
+        )
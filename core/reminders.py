@@ -0,0 +1,109 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import heapq
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.task import Task
+
+MAX_TIMER_MSECS = 24 * 60 * 60 * 1000
+
+
+def parse_reminder(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class ReminderScheduler:
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._versions: Dict[str, int] = {}
+        self._live: Dict[str, datetime] = {}
+        self._next_version = 0
+        self.on_next_changed: Optional[Callable[[], None]] = None
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self._live = {}
+        self._versions = {}
+        for task in tasks:
+            fire_at = parse_reminder(task.remind_at)
+            if fire_at is not None and not task.completed:
+                self._next_version += 1
+                self._versions[task.id] = self._next_version
+                self._live[task.id] = fire_at
+        self._heap = [(fire_at, self._versions[task_id], task_id) for task_id, fire_at in self._live.items()]
+        heapq.heapify(self._heap)
+        self._notify()
+
+    def schedule(self, task: Task):
+        fire_at = parse_reminder(task.remind_at)
+        if fire_at is None or task.completed:
+            self.remove(task.id)
+            return
+        if self._live.get(task.id) == fire_at:
+            return
+
+        previous_next = self.next_fire_time()
+        self._next_version += 1
+        self._versions[task.id] = self._next_version
+        self._live[task.id] = fire_at
+        heapq.heappush(self._heap, (fire_at, self._next_version, task.id))
+        self._compact()
+        if previous_next is None or fire_at < previous_next:
+            self._notify()
+
+    def remove(self, task_id: str):
+        fire_at = self._live.pop(task_id, None)
+        if fire_at is None:
+            return
+        self._versions.pop(task_id, None)
+        if self._heap and self._heap[0][2] == task_id:
+            self._notify()
+
+    def next_fire_time(self) -> Optional[datetime]:
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[str]:
+        now = now or datetime.now()
+        due = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            _, _, task_id = heapq.heappop(self._heap)
+            self._versions.pop(task_id, None)
+            self._live.pop(task_id, None)
+            due.append(task_id)
+        return due
+
+    def msecs_until_next(self, now: Optional[datetime] = None) -> Optional[int]:
+        fire_at = self.next_fire_time()
+        if fire_at is None:
+            return None
+        now = now or datetime.now()
+        msecs = int((fire_at - now).total_seconds() * 1000)
+        return min(max(msecs, 0), MAX_TIMER_MSECS)
+
+    def _is_stale(self, entry: Tuple[datetime, int, str]) -> bool:
+        return self._versions.get(entry[2]) != entry[1]
+
+    def _drop_stale(self):
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _compact(self):
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._heap = [entry for entry in self._heap if not self._is_stale(entry)]
+            heapq.heapify(self._heap)
+
+    def _notify(self):
+        if self.on_next_changed is not None:
+            self.on_next_changed()
@@ -0,0 +1,190 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import argparse
+import gc
+import heapq
+import random
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from itertools import accumulate, chain
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from core.task import Task
+
+NGRAM_SIZE = 3
+TITLE_WEIGHT = 2.0
+MIN_MATCH_RATIO = 0.4
+FUZZY_TOP_K = 200
+COMMON_GRAM_RATIO = 0.05
+MAX_SCANNED_POSTINGS = 50000
+MAX_RANKED = 5000
+
+_WORD_RE = re.compile(r'\w+')
+
+
+@lru_cache(maxsize=65536)
+def word_ngrams(word: str, size: int = NGRAM_SIZE) -> FrozenSet[str]:
+    padded = f' {word} '
+    if len(padded) <= size:
+        return frozenset((padded,))
+    return frozenset(padded[i:i + size] for i in range(len(padded) - size + 1))
+
+
+def ngrams(text: str, size: int = NGRAM_SIZE) -> FrozenSet[str]:
+    words = set(_WORD_RE.findall(text.lower()))
+    return frozenset(chain.from_iterable(word_ngrams(word, size) for word in words))
+
+
+class FuzzySearchIndex:
+
+    def __init__(self):
+        self._title_postings: Dict[str, Set[str]] = {}
+        self._description_postings: Dict[str, Set[str]] = {}
+        self._title_grams: Dict[str, FrozenSet[str]] = {}
+        self._description_grams: Dict[str, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._title_grams)
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self._title_postings = {}
+        self._description_postings = {}
+        self._title_grams = {}
+        self._description_grams = {}
+        for task in tasks:
+            self.update(task)
+
+    def add_texts(self, texts: Iterable[Tuple[str, str, str]]):
+        for task_id, title, description in texts:
+            self.update_text(task_id, title, description)
+
+    def update(self, task: Task):
+        self.update_text(task.id, task.title, task.description)
+
+    def update_text(self, task_id: str, title: str, description: str):
+        self.remove(task_id)
+        self._title_grams[task_id] = self._add_postings(self._title_postings, task_id, ngrams(title))
+        self._description_grams[task_id] = self._add_postings(
+            self._description_postings, task_id, ngrams(description))
+
+    def remove(self, task_id: str):
+        self._remove_postings(self._title_postings, task_id, self._title_grams.pop(task_id, ()))
+        self._remove_postings(self._description_postings, task_id,
+                              self._description_grams.pop(task_id, ()))
+
+    def search(self, text: str, k: int = FUZZY_TOP_K,
+               predicate: Optional[Callable[[str], bool]] = None) -> List[str]:
+        query = ngrams(text)
+        if not query:
+            return []
+
+        title_query, description_query = self._selective_grams(query)
+        title_hits = self._count_hits(self._title_postings, title_query)
+        description_hits = self._count_hits(self._description_postings, description_query)
+        candidates = self._matching(title_hits, len(title_query))
+        candidates.update(self._matching(description_hits, len(description_query)))
+        if predicate is not None:
+            candidates = [task_id for task_id in candidates if predicate(task_id)]
+        if len(candidates) > MAX_RANKED:
+            candidates = heapq.nlargest(
+                MAX_RANKED, candidates,
+                key=lambda task_id: TITLE_WEIGHT * title_hits.get(task_id, 0) + description_hits.get(task_id, 0))
+
+        title_grams = self._title_grams
+        description_grams = self._description_grams
+        query_size = len(query)
+
+        def score(task_id: str) -> float:
+            grams = title_grams[task_id]
+            title_score = 2.0 * len(query & grams) / (query_size + len(grams))
+            return TITLE_WEIGHT * title_score + len(query & description_grams[task_id]) / query_size
+
+        return heapq.nlargest(k, candidates, key=score)
+
+    def _selective_grams(self, query: FrozenSet[str]) -> Tuple[List[str], List[str]]:
+        fields = (self._title_postings, self._description_postings)
+        sizes = sorted((len(postings.get(gram, ())), field, gram)
+                       for field, postings in enumerate(fields) for gram in query)
+        common = max(1, len(self) * COMMON_GRAM_RATIO)
+        selected: Tuple[List[str], List[str]] = ([], [])
+        scanned = 0
+        for size, field, gram in sizes:
+            if scanned and (size > common or scanned + size > MAX_SCANNED_POSTINGS):
+                break
+            selected[field].append(gram)
+            scanned += size
+        return selected
+
+    @staticmethod
+    def _matching(hits: Dict[str, int], grams: int) -> Set[str]:
+        min_hits = max(1, int(grams * MIN_MATCH_RATIO))
+        return {task_id for task_id, count in hits.items() if count >= min_hits}
+
+    @staticmethod
+    def _count_hits(postings: Dict[str, Set[str]], grams: Iterable[str]) -> Dict[str, int]:
+        return Counter(chain.from_iterable(postings.get(gram, ()) for gram in grams))
+
+    @staticmethod
+    def _add_postings(postings: Dict[str, Set[str]], task_id: str,
+                      grams: FrozenSet[str]) -> FrozenSet[str]:
+        for gram in grams:
+            postings.setdefault(gram, set()).add(task_id)
+        return grams
+
+    @staticmethod
+    def _remove_postings(postings: Dict[str, Set[str]], task_id: str, grams: Iterable[str]):
+        for gram in grams:
+            bucket = postings.get(gram)
+            if bucket is not None:
+                bucket.discard(task_id)
+                if not bucket:
+                    del postings[gram]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy search latency on a synthetic task set.")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--max-ms", type=float, default=100.0,
+                        help="fail if the 99th percentile query latency is above this")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9)))
+                  for _ in range(5000)]
+    weights = list(accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def words(count: int) -> str:
+        return ' '.join(rng.choices(vocabulary, cum_weights=weights, k=count))
+
+    texts = [(str(index), words(rng.randint(4, 7)), words(rng.randint(15, 40))) for index in range(args.tasks)]
+    started = time.perf_counter()
+    index = FuzzySearchIndex()
+    index.add_texts(texts)
+    print(f"Indexed {args.tasks} task(s) in {time.perf_counter() - started:.1f} s")
+    gc.collect()
+
+    latencies = []
+    for number in range(args.queries):
+        title = rng.choice(texts)[1]
+        if number % 2:
+            position = rng.randrange(len(title) - 1)
+            query = title[:position] + title[position + 1] + title[position] + title[position + 2:]
+        else:
+            query = ' '.join(title.split()[:2])
+        started = time.perf_counter()
+        index.search(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{len(latencies)} queries: p50 {p50:.1f} ms, p99 {p99:.1f} ms, max {latencies[-1]:.1f} ms")
+    if p99 > args.max_ms:
+        parser.exit(1, f"p99 latency {p99:.1f} ms is above the {args.max_ms:.0f} ms budget\n")
+
+
+if __name__ == "__main__":
+    main()
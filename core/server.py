@@ -0,0 +1,446 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import argparse
+import asyncio
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from core.due_dates import parse_due_date
+from core.query import QueryError, compile_query
+from core.reminders import parse_reminder
+from core.subtasks import SubtaskError
+from core.task import Task, normalize_tags
+from core.task_manager import TaskManager
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+WRITE_DELAY = 0.25
+MAX_LINE = 4 * 1024 * 1024
+MAX_SUBSCRIBER_BUFFER = 1024 * 1024
+QUERY_CACHE_SIZE = 64
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+TASK_NOT_FOUND = -32001
+
+Invoke = Callable[[Callable[[], Any]], Future]
+
+
+class RpcError(Exception):
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def parse_address(address: Optional[str]) -> Tuple[Optional[str], str, int]:
+    if not address:
+        return None, DEFAULT_HOST, DEFAULT_PORT
+    if address.isdigit():
+        return None, DEFAULT_HOST, int(address)
+    host, _, port = address.rpartition(':')
+    if host and port.isdigit():
+        return None, host, int(port)
+    return os.path.expanduser(address), DEFAULT_HOST, DEFAULT_PORT
+
+
+def task_record(task: Task) -> Dict:
+    data = task.to_dict()
+    data['description'] = task.description
+    return data
+
+
+def _require_task(manager: TaskManager, task_id: Any) -> Task:
+    task = manager.get_task(task_id) if isinstance(task_id, str) else None
+    if task is None:
+        raise RpcError(TASK_NOT_FOUND, "Task not found.")
+    return task
+
+
+def _validated_fields(params: Dict, fields: Dict) -> Dict:
+    values = dict(fields)
+    if 'title' in params:
+        title = params['title']
+        if not isinstance(title, str) or not 3 <= len(title.strip()) <= 100:
+            raise RpcError(INVALID_PARAMS, "Title must be between 3 and 100 characters.")
+        values['title'] = title.strip()
+    if 'description' in params:
+        if not isinstance(params['description'], str):
+            raise RpcError(INVALID_PARAMS, "Description must be a string.")
+        values['description'] = params['description']
+    if 'priority' in params:
+        if params['priority'] not in (1, 2, 3):
+            raise RpcError(INVALID_PARAMS, "Priority must be 1, 2 or 3.")
+        values['priority'] = params['priority']
+    if 'due_date' in params:
+        due_date = params['due_date']
+        if due_date is not None and (not isinstance(due_date, str) or parse_due_date(due_date) is None):
+            raise RpcError(INVALID_PARAMS, "Invalid due_date.")
+        values['due_date'] = due_date
+    if 'remind_at' in params:
+        remind_at = params['remind_at']
+        if remind_at is not None and (not isinstance(remind_at, str) or parse_reminder(remind_at) is None):
+            raise RpcError(INVALID_PARAMS, "Invalid remind_at.")
+        values['remind_at'] = remind_at
+    if 'tags' in params:
+        tags = params['tags']
+        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise RpcError(INVALID_PARAMS, "Tags must be a list of strings.")
+        values['tags'] = normalize_tags(tags)
+    if 'parent_id' in params:
+        if params['parent_id'] is not None and not isinstance(params['parent_id'], str):
+            raise RpcError(INVALID_PARAMS, "parent_id must be a string.")
+        values['parent_id'] = params['parent_id']
+    return values
+
+
+class _Connection:
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+
+    def send(self, message: Any) -> bool:
+        if self.writer.is_closing():
+            return False
+        self.writer.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+        return True
+
+
+class TaskServer:
+    MUTATING = ('add', 'update', 'toggle', 'delete')
+
+    def __init__(self, manager: TaskManager, invoke: Optional[Invoke] = None,
+                 write_delay: float = WRITE_DELAY):
+        self.manager = manager
+        self.invoke = invoke
+        self.write_delay = write_delay
+        self._connections: Set[_Connection] = set()
+        self._subscribers: Set[_Connection] = set()
+        self._handlers: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._query_cache: 'OrderedDict[Tuple, List[Task]]' = OrderedDict()
+        self._methods: Dict[str, Callable[[Dict], Any]] = {
+            'query': self.query,
+            'get': self.get,
+            'add': self.add,
+            'update': self.update,
+            'toggle': self.toggle,
+            'delete': self.delete,
+        }
+
+    @property
+    def address(self) -> str:
+        if self._server is None or not self._server.sockets:
+            return ''
+        name = self._server.sockets[0].getsockname()
+        return name if isinstance(name, str) else f'{name[0]}:{name[1]}'
+
+    async def start(self, path: Optional[str] = None, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        self._loop = asyncio.get_running_loop()
+        if path:
+            if os.path.exists(path):
+                os.remove(path)
+            self._server = await asyncio.start_unix_server(self._handle_connection, path, limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_LINE)
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+        for connection in list(self._connections):
+            connection.writer.close()
+        handlers = list(self._handlers)
+        for handler in handlers:
+            handler.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    def attach(self):
+        self.manager.add_listener(self._on_change)
+
+    def detach(self):
+        self.manager.remove_listener(self._on_change)
+        self.manager.flush_deferred_writes()
+
+    async def _call(self, fn: Callable[[], Any]) -> Any:
+        if self.invoke is None:
+            return fn()
+        return await asyncio.wrap_future(self.invoke(fn))
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = _Connection(writer)
+        handler = asyncio.current_task()
+        self._connections.add(connection)
+        self._handlers.add(handler)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    connection.send(self._error(None, INVALID_REQUEST, "Request too large."))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self._handle_line(line, connection)
+                if response is not None and connection.send(response):
+                    await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(handler)
+            self._connections.discard(connection)
+            self._subscribers.discard(connection)
+            writer.close()
+
+    async def _handle_line(self, line: bytes, connection: _Connection) -> Any:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return self._error(None, PARSE_ERROR, "Parse error.")
+        if isinstance(message, list):
+            if not message:
+                return self._error(None, INVALID_REQUEST, "Empty batch.")
+            responses = [await self._handle_request(request, connection) for request in message]
+            return [response for response in responses if response is not None] or None
+        return await self._handle_request(message, connection)
+
+    async def _handle_request(self, request: Any, connection: _Connection) -> Optional[Dict]:
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' or \
+                not isinstance(request.get('method'), str):
+            return self._error(None, INVALID_REQUEST, "Invalid request.")
+        request_id = request.get('id')
+        method = request['method']
+        params = request.get('params', {})
+        if not isinstance(params, dict):
+            return self._error(request_id, INVALID_PARAMS, "Params must be an object.")
+
+        try:
+            if method == 'subscribe':
+                self._subscribers.add(connection)
+                result = True
+            elif method == 'unsubscribe':
+                self._subscribers.discard(connection)
+                result = True
+            elif method in self._methods:
+                handler = self._methods[method]
+                try:
+                    result = await self._call(lambda: handler(params))
+                finally:
+                    if method in self.MUTATING:
+                        self._schedule_flush()
+            else:
+                raise RpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+        except RpcError as e:
+            return self._error(request_id, e.code, e.message)
+        except Exception as e:
+            return self._error(request_id, INTERNAL_ERROR, str(e))
+
+        if 'id' not in request:
+            return None
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    @staticmethod
+    def _error(request_id: Any, code: int, message: str) -> Dict:
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+    def _schedule_flush(self):
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self.write_delay, lambda: asyncio.ensure_future(self._flush()))
+
+    async def _flush(self):
+        self._flush_handle = None
+        await self._call(self.manager.flush_deferred_writes)
+
+    def _on_change(self, event: str, task_ids: List[str], fields: Optional[Set[str]] = None):
+        if not self._subscribers:
+            return
+        params = {'event': event}
+        if fields is not None:
+            params['fields'] = sorted(fields)
+        if event == 'removed':
+            params['ids'] = task_ids
+        else:
+            params['tasks'] = [task_record(self.manager.tasks[task_id])
+                               for task_id in task_ids if task_id in self.manager.tasks]
+        self._loop.call_soon_threadsafe(self._broadcast, {'jsonrpc': '2.0', 'method': 'tasks_changed',
+                                                          'params': params})
+
+    def _broadcast(self, message: Dict):
+        for connection in list(self._subscribers):
+            if connection.writer.transport.get_write_buffer_size() > MAX_SUBSCRIBER_BUFFER:
+                self._subscribers.discard(connection)
+                connection.writer.close()
+                continue
+            connection.send(message)
+
+    def query(self, params: Dict) -> Dict:
+        text = params.get('query', '')
+        offset = params.get('offset', 0)
+        limit = params.get('limit')
+        if not isinstance(text, str):
+            raise RpcError(INVALID_PARAMS, "query must be a string.")
+        if not isinstance(offset, int) or (limit is not None and not isinstance(limit, int)):
+            raise RpcError(INVALID_PARAMS, "offset and limit must be integers.")
+
+        key = (text, self.manager.revision, self.manager.due_dates.today)
+        tasks = self._query_cache.get(key)
+        if tasks is None:
+            try:
+                tasks = list(compile_query(text).execute(self.manager))
+            except QueryError as e:
+                raise RpcError(INVALID_PARAMS, str(e))
+            self._query_cache[key] = tasks
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        else:
+            self._query_cache.move_to_end(key)
+        page = tasks[offset:offset + limit if limit is not None else None]
+        return {'total': len(tasks), 'tasks': [task_record(task) for task in page]}
+
+    def get(self, params: Dict) -> Dict:
+        return task_record(_require_task(self.manager, params.get('id')))
+
+    def add(self, params: Dict) -> Dict:
+        if 'title' not in params:
+            raise RpcError(INVALID_PARAMS, "Missing title.")
+        fields = _validated_fields(params, {'description': '', 'priority': 3, 'due_date': None, 'remind_at': None})
+        task = Task(id=str(uuid.uuid4()), **fields)
+        try:
+            self.manager.subtasks.check_parent(task.id, task.parent_id)
+        except SubtaskError as e:
+            raise RpcError(INVALID_PARAMS, str(e))
+        duplicates = (self.manager.find_duplicates(task.title, task.description)
+                      if params.get('check_duplicates') else [])
+        self.manager.defer_writes()
+        self.manager.add_task(task)
+        record = task_record(task)
+        if duplicates:
+            record['duplicates'] = [duplicate.id for duplicate, _ in duplicates]
+        return record
+
+    def update(self, params: Dict) -> Dict:
+        task = _require_task(self.manager, params.get('id'))
+        fields = _validated_fields(params, {})
+        try:
+            if 'parent_id' in fields:
+                self.manager.subtasks.check_parent(task.id, fields['parent_id'])
+        except SubtaskError as e:
+            raise RpcError(INVALID_PARAMS, str(e))
+        self.manager.defer_writes()
+        self.manager.edit_task(task.id, **fields)
+        if 'completed' in params and bool(params['completed']) != task.completed:
+            self.manager.toggle_task(task.id)
+        return task_record(task)
+
+    def toggle(self, params: Dict) -> Dict:
+        task = _require_task(self.manager, params.get('id'))
+        self.manager.defer_writes()
+        next_task = self.manager.toggle_task(task.id)
+        result = {'task': task_record(task)}
+        if next_task is not None:
+            result['next'] = task_record(next_task)
+        return result
+
+    def delete(self, params: Dict) -> bool:
+        task = _require_task(self.manager, params.get('id'))
+        self.manager.defer_writes()
+        self.manager.delete_task(task.id)
+        return True
+
+
+class ServerThread:
+
+    def __init__(self, manager: TaskManager, invoke: Optional[Invoke] = None, address: Optional[str] = None):
+        self.server = TaskServer(manager, invoke)
+        self.path, self.host, self.port = parse_address(address)
+        self.error: Optional[Exception] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='task-server', daemon=True)
+
+    def start(self, timeout: float = 5.0) -> bool:
+        self.server.attach()
+        self._thread.start()
+        self._started.wait(timeout)
+        if self.error is None and self._started.is_set():
+            return True
+        self.server.detach()
+        return False
+
+    def stop(self, timeout: float = 5.0):
+        if self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        self._thread.join(timeout)
+        self.server.detach()
+
+    async def _shutdown(self):
+        try:
+            await asyncio.wait_for(self.server.stop(), 2.0)
+        except asyncio.TimeoutError:
+            pass
+        asyncio.get_running_loop().stop()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self.server.start(self.path, self.host, self.port))
+        except Exception as e:
+            self.error = e
+            self._started.set()
+            self._loop.close()
+            return
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+
+async def serve(manager: TaskManager, path: Optional[str], host: str, port: int):
+    server = TaskServer(manager)
+    server.attach()
+    await server.start(path, host, port)
+    print(f"Serving {manager.filename} on {server.address}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        server.detach()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Smart Task Manager tasks over JSON-RPC.")
+    parser.add_argument("address", nargs="?", default=None,
+                        help=f"unix socket path, PORT or HOST:PORT (default {DEFAULT_HOST}:{DEFAULT_PORT})")
+    parser.add_argument("--file", default="~/.todos.json", help="task file to serve")
+    args = parser.parse_args(argv)
+
+    manager = TaskManager(args.file, background_writes=True)
+    path, host, port = parse_address(args.address)
+    try:
+        asyncio.run(serve(manager, path, host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
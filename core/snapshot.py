@@ -0,0 +1,117 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import gc
+import hashlib
+import marshal
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, NamedTuple, Optional
+
+from core.recurrence import Recurrence
+from core.task import Task
+
+SNAPSHOT_MAGIC = b'STMSNAP\x01'
+SNAPSHOT_VERSION = 3
+HASH_CHUNK = 1024 * 1024
+FIELDS = ('id', 'title', 'description', 'priority', 'completed', 'created_at', 'due_date', 'recurrence',
+          'remind_at', 'completed_at', 'status_changed_at', 'updated_at', 'tags', 'parent_id')
+
+
+class SourceKey(NamedTuple):
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+@contextmanager
+def paused_gc():
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def source_key(filename: str) -> Optional[SourceKey]:
+    before = os.stat(filename)
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    after = os.stat(filename)
+    if (before.st_size, before.st_mtime_ns) != (after.st_size, after.st_mtime_ns):
+        return None
+    return SourceKey(after.st_size, after.st_mtime_ns, digest.hexdigest())
+
+
+def encode_records(records: Dict[str, Dict]) -> bytes:
+    keys = list(records)
+    columns = [[record.get(field) for record in records.values()] for field in FIELDS]
+    return marshal.dumps((None if keys == columns[0] else keys, columns))
+
+
+def decode_tasks(payload: bytes) -> Dict[str, Task]:
+    keys, columns = marshal.loads(payload)
+    recurrence = FIELDS.index('recurrence')
+    columns[recurrence] = [Recurrence.from_dict(data) if data else None for data in columns[recurrence]]
+    return dict(zip(keys or columns[0], map(Task, *columns)))
+
+
+class SnapshotCache:
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._thread: Optional[threading.Thread] = None
+
+    def load(self, source: str) -> Optional[tuple]:
+        try:
+            with open(self.filename, 'rb') as f:
+                if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                    return None
+                version, size, mtime_ns, digest, codec = marshal.load(f)
+                stat = os.stat(source)
+                if version != SNAPSHOT_VERSION or (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                    return None
+                if source_key(source) != (size, mtime_ns, digest):
+                    return None
+                payload = f.read()
+            with paused_gc():
+                return decode_tasks(payload), codec
+        except (OSError, EOFError, ValueError, TypeError, KeyError):
+            return None
+
+    def save(self, key: SourceKey, records: Dict[str, Dict], codec: str):
+        tmp_filename = self.filename + '.tmp'
+        with open(tmp_filename, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC)
+            marshal.dump((SNAPSHOT_VERSION,) + tuple(key) + (codec,), f)
+            f.write(encode_records(records))
+        os.replace(tmp_filename, self.filename)
+
+    def save_from(self, source: str, records: Dict[str, Dict], codec: str):
+        key = source_key(source)
+        if key is not None:
+            self.save(key, records, codec)
+
+    def rebuild_async(self, key: SourceKey, records: Dict[str, Dict], codec: str):
+        self.join()
+        self._thread = threading.Thread(target=self._rebuild, args=(key, records, codec),
+                                        name='task-snapshot', daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            return False
+        self._thread = None
+        return True
+
+    def _rebuild(self, key: SourceKey, records: Dict[str, Dict], codec: str):
+        try:
+            self.save(key, records, codec)
+        except OSError:
+            pass
@@ -0,0 +1,313 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from core.compression import CHUNK_SIZE, DECODE_ERRORS, load_json, open_read, parse_codec, save_json
+from core.snapshot import SnapshotCache, paused_gc, source_key
+from core.task import Task
+
+RECENT_MONTHS = 3
+LOAD_ERRORS = (json.JSONDecodeError, IOError) + DECODE_ERRORS
+
+
+def read_json(filename: str) -> Dict:
+    return load_json(filename)[0]
+
+
+def write_json(filename: str, data: Dict, codec: str = 'none', level: Optional[int] = None,
+               compact: bool = False):
+    save_json(filename, data, codec, level, compact)
+
+
+def iter_records(filename: str) -> Iterator[Tuple[str, Dict]]:
+    decoder = json.JSONDecoder()
+    f, _ = open_read(filename)
+    with f:
+        buffer, position, expected = '', 0, '{'
+        key = None
+        while expected:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position == len(buffer):
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    raise json.JSONDecodeError("Unexpected end of task file", buffer, position)
+                buffer, position = chunk, 0
+                continue
+            char = buffer[position]
+            if expected in ('{', ':'):
+                if char != expected:
+                    raise json.JSONDecodeError(f"Expected '{expected}'", buffer, position)
+                position += 1
+                expected = 'key' if expected == '{' else 'value'
+            elif expected == ',' or (expected == 'key' and char == '}' and key is None):
+                if char == '}':
+                    expected = ''
+                elif char == ',':
+                    position += 1
+                    expected = 'key'
+                else:
+                    raise json.JSONDecodeError("Expected ',' or '}'", buffer, position)
+            else:
+                try:
+                    value, position = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    chunk = f.read(CHUNK_SIZE)
+                    if not chunk:
+                        raise
+                    buffer, position = buffer[position:] + chunk, 0
+                    continue
+                if expected == 'key':
+                    key = value
+                    expected = ':'
+                else:
+                    yield key, value
+                    expected = ','
+
+
+def iter_tasks(filename: str) -> Iterator[Task]:
+    if not os.path.isfile(filename):
+        return
+    for _, record in iter_records(filename):
+        try:
+            yield Task.from_dict(record)
+        except (KeyError, TypeError):
+            continue
+
+
+class JsonFileStorage:
+
+    def __init__(self, filename: str, compression: Optional[str] = None,
+                 snapshot: Optional[SnapshotCache] = None):
+        self.filename = filename
+        self.codec, self.level = parse_codec(compression) if compression else (None, None)
+        self.snapshot = snapshot
+        self._saved_records: Optional[Dict[str, Dict]] = None
+
+    @property
+    def fully_loaded(self) -> bool:
+        return True
+
+    def load(self) -> Dict[str, Task]:
+        if not os.path.isfile(self.filename):
+            return {}
+        if self.snapshot is not None:
+            cached = self.snapshot.load(self.filename)
+            if cached is not None:
+                tasks, codec = cached
+                if self.codec is None:
+                    self.codec = codec
+                return tasks
+        try:
+            key = source_key(self.filename) if self.snapshot is not None else None
+            with paused_gc():
+                data, codec = load_json(self.filename)
+        except LOAD_ERRORS:
+            return {}
+        if self.codec is None:
+            self.codec = codec
+        with paused_gc():
+            tasks = {task_id: Task.from_dict(task_data)
+                     for task_id, task_data in data.items()}
+        if key is not None:
+            self.snapshot.rebuild_async(key, data, codec)
+        return tasks
+
+    def load_remaining(self, resident: Dict[str, Task]) -> Dict[str, Task]:
+        return {}
+
+    def save(self, records: Dict[str, Dict], task_ids: Optional[Iterable[str]] = None):
+        self._saved_records = None
+        write_json(self.filename, records, self.codec or 'none', self.level)
+        self._saved_records = records
+
+    def close(self):
+        if self.snapshot is None:
+            return
+        self.snapshot.join()
+        if self._saved_records is not None:
+            try:
+                self.snapshot.save_from(self.filename, self._saved_records, self.codec or 'none')
+            except OSError:
+                pass
+            self._saved_records = None
+
+
+class ShardedStorage:
+    SEGMENT_BY = ('month', 'status')
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, directory: str, segment_by: str = 'month',
+                 legacy_filename: Optional[str] = None, recent_months: int = RECENT_MONTHS,
+                 compression: Optional[str] = None):
+        if segment_by not in self.SEGMENT_BY:
+            raise ValueError(f"Unknown segment_by: {segment_by}")
+        self.directory = directory
+        self.segment_by = segment_by
+        self.legacy_filename = legacy_filename
+        self.recent_months = recent_months
+        self.codec, self.level = parse_codec(compression) if compression else (None, None)
+        self.manifest: Dict[str, Dict] = {}
+        self._members: Dict[str, Set[str]] = {}
+        self._segment_of: Dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def manifest_filename(self) -> str:
+        return os.path.join(self.directory, self.MANIFEST)
+
+    @property
+    def fully_loaded(self) -> bool:
+        with self._lock:
+            return all(segment in self._members for segment in self.manifest)
+
+    def segment_key(self, task_data: Dict) -> str:
+        if self.segment_by == 'status':
+            return 'completed' if task_data.get('completed') else 'pending'
+        try:
+            return datetime.fromisoformat(task_data.get('created_at', '')).strftime('%Y-%m')
+        except ValueError:
+            return 'undated'
+
+    def segment_filename(self, segment: str) -> str:
+        return os.path.join(self.directory, f'{segment}.json')
+
+    def is_hot(self, segment: str) -> bool:
+        info = self.manifest.get(segment, {})
+        if info.get('pending', 0) > 0:
+            return True
+        if self.segment_by == 'month':
+            now = datetime.now()
+            month_index = now.year * 12 + now.month - 1 - self.recent_months
+            cutoff = f'{month_index // 12:04d}-{month_index % 12 + 1:02d}'
+            return segment >= cutoff
+        return False
+
+    def load(self) -> Dict[str, Task]:
+        self.manifest = {}
+        self._members = {}
+        self._segment_of = {}
+
+        if not os.path.isfile(self.manifest_filename):
+            return self._migrate_legacy()
+
+        try:
+            self.manifest = read_json(self.manifest_filename)
+        except LOAD_ERRORS:
+            self.manifest = {}
+
+        tasks = {}
+        for segment in list(self.manifest):
+            if self.is_hot(segment):
+                tasks.update(self._load_segment(segment))
+        return tasks
+
+    def load_remaining(self, resident: Dict[str, Task]) -> Dict[str, Task]:
+        with self._lock:
+            segments = [segment for segment in self.manifest if segment not in self._members]
+        tasks = {}
+        for segment in segments:
+            for task_id, task in self._load_segment(segment).items():
+                if task_id not in resident:
+                    tasks[task_id] = task
+        return tasks
+
+    def save(self, records: Dict[str, Dict], task_ids: Optional[Iterable[str]] = None):
+        with self._lock:
+            if task_ids is None:
+                task_ids = set(records) | set(self._segment_of)
+
+            moved = {}
+            dirty_segments = set()
+            for task_id in task_ids:
+                old_segment = self._segment_of.get(task_id)
+                task_data = records.get(task_id)
+                new_segment = self.segment_key(task_data) if task_data else None
+                if old_segment:
+                    dirty_segments.add(old_segment)
+                if new_segment:
+                    dirty_segments.add(new_segment)
+                moved[task_id] = (old_segment, new_segment)
+
+            for task_id, (old_segment, new_segment) in moved.items():
+                if old_segment == new_segment:
+                    continue
+                if old_segment:
+                    self._members.get(old_segment, set()).discard(task_id)
+                    del self._segment_of[task_id]
+                if new_segment:
+                    if new_segment in self._members or new_segment not in self.manifest:
+                        self._members.setdefault(new_segment, set()).add(task_id)
+                    self._segment_of[task_id] = new_segment
+
+            members = {segment: set(self._members[segment]) if segment in self._members else None
+                       for segment in dirty_segments}
+
+        os.makedirs(self.directory, exist_ok=True)
+        for segment, segment_members in members.items():
+            self._write_segment(segment, segment_members, records, moved)
+        with self._lock:
+            manifest = dict(self.manifest)
+        write_json(self.manifest_filename, manifest)
+
+    def close(self):
+        pass
+
+    def _load_segment(self, segment: str) -> Dict[str, Task]:
+        try:
+            data, codec = load_json(self.segment_filename(segment))
+        except LOAD_ERRORS:
+            data, codec = {}, None
+        if self.codec is None and codec is not None:
+            self.codec = codec
+        tasks = {task_id: Task.from_dict(task_data) for task_id, task_data in data.items()}
+        with self._lock:
+            self._members[segment] = set(tasks)
+            for task_id in tasks:
+                self._segment_of[task_id] = segment
+        return tasks
+
+    def _write_segment(self, segment: str, members: Optional[Set[str]], records: Dict[str, Dict], moved: Dict):
+        if members is not None:
+            data = {task_id: records[task_id] for task_id in members if task_id in records}
+        else:
+            try:
+                data = read_json(self.segment_filename(segment))
+            except LOAD_ERRORS:
+                data = {}
+            for task_id, (old_segment, new_segment) in moved.items():
+                if new_segment == segment:
+                    data[task_id] = records[task_id]
+                elif old_segment == segment:
+                    data.pop(task_id, None)
+
+        if not data:
+            with self._lock:
+                self.manifest.pop(segment, None)
+                self._members.pop(segment, None)
+            if os.path.isfile(self.segment_filename(segment)):
+                os.remove(self.segment_filename(segment))
+            return
+
+        completed = sum(1 for task_data in data.values() if task_data.get('completed'))
+        with self._lock:
+            self.manifest[segment] = {
+                'count': len(data),
+                'completed': completed,
+                'pending': len(data) - completed,
+            }
+        write_json(self.segment_filename(segment), data, self.codec or 'none', self.level)
+
+    def _migrate_legacy(self) -> Dict[str, Task]:
+        if not self.legacy_filename:
+            return {}
+        legacy = JsonFileStorage(self.legacy_filename)
+        tasks = legacy.load()
+        if self.codec is None:
+            self.codec, self.level = legacy.codec, legacy.level
+        if tasks:
+            self.save({task_id: task.to_dict() for task_id, task in tasks.items()})
+        return tasks
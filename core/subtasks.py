@@ -0,0 +1,139 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.task import Task
+
+
+class SubtaskError(ValueError):
+    pass
+
+
+class SubtaskIndex:
+
+    def __init__(self):
+        self._children: Dict[str, Dict[str, None]] = {}
+        self._parents: Dict[str, str] = {}
+        self._completed: Dict[str, bool] = {}
+        self._progress: Dict[str, List[int]] = {}
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self._children = {}
+        self._parents = {}
+        self._progress = {}
+        tasks = list(tasks)
+        self._completed = {task.id: task.completed for task in tasks}
+        for task in tasks:
+            if task.parent_id is not None:
+                self._link(task.id, task.parent_id)
+        for task_id in list(self._parents):
+            done = 1 if self._completed[task_id] else 0
+            for ancestor_id in self.ancestors(task_id):
+                progress = self._progress.get(ancestor_id)
+                if progress is None:
+                    progress = self._progress[ancestor_id] = [0, 0]
+                progress[0] += done
+                progress[1] += 1
+
+    def update(self, task: Task):
+        completed = self._completed.get(task.id)
+        if completed is None:
+            self._add(task)
+            return
+        if self._parents.get(task.id) != task.parent_id:
+            done, total = self._subtree(task.id)
+            self._propagate(task.id, -done, -total)
+            self._link(task.id, task.parent_id)
+            self._completed[task.id] = task.completed
+            done, total = self._subtree(task.id)
+            self._propagate(task.id, done, total)
+        elif completed != task.completed:
+            self._completed[task.id] = task.completed
+            self._propagate(task.id, 1 if task.completed else -1, 0)
+
+    def remove(self, task_id: str):
+        if task_id not in self._completed:
+            return
+        done, total = self._subtree(task_id)
+        self._propagate(task_id, -done, -total)
+        self._link(task_id, None)
+        del self._completed[task_id]
+
+    def check_parent(self, task_id: str, parent_id: Optional[str]):
+        if parent_id is None:
+            return
+        if parent_id not in self._completed:
+            raise SubtaskError("Parent task not found.")
+        if self._creates_cycle(task_id, parent_id):
+            raise SubtaskError("A task cannot be moved under itself or one of its subtasks.")
+
+    def parent(self, task_id: str) -> Optional[str]:
+        parent_id = self._parents.get(task_id)
+        return parent_id if parent_id in self._completed else None
+
+    def children(self, task_id: str) -> List[str]:
+        return [child_id for child_id in self._children.get(task_id, ()) if child_id in self._completed]
+
+    def has_children(self, task_id: str) -> bool:
+        progress = self._progress.get(task_id)
+        return progress is not None and progress[1] > 0
+
+    def progress(self, task_id: str) -> Tuple[int, int]:
+        progress = self._progress.get(task_id)
+        return (progress[0], progress[1]) if progress else (0, 0)
+
+    def ancestors(self, task_id: str) -> Iterator[str]:
+        parent_id = self._parents.get(task_id)
+        while parent_id in self._completed:
+            yield parent_id
+            parent_id = self._parents.get(parent_id)
+
+    def descendants(self, task_id: str) -> List[str]:
+        result = []
+        pending = [task_id]
+        while pending:
+            children = self.children(pending.pop())
+            result.extend(children)
+            pending.extend(children)
+        return result
+
+    def _add(self, task: Task):
+        self._completed[task.id] = task.completed
+        self._link(task.id, task.parent_id)
+        progress = [0, 0]
+        for child_id in self.children(task.id):
+            child_done, child_total = self._subtree(child_id)
+            progress[0] += child_done
+            progress[1] += child_total
+        if progress[1]:
+            self._progress[task.id] = progress
+        done, total = self._subtree(task.id)
+        self._propagate(task.id, done, total)
+
+    def _link(self, task_id: str, parent_id: Optional[str]):
+        previous = self._parents.pop(task_id, None)
+        if previous is not None:
+            siblings = self._children.get(previous)
+            if siblings is not None:
+                siblings.pop(task_id, None)
+                if not siblings:
+                    del self._children[previous]
+        if parent_id is not None and not self._creates_cycle(task_id, parent_id):
+            self._parents[task_id] = parent_id
+            self._children.setdefault(parent_id, {})[task_id] = None
+
+    def _creates_cycle(self, task_id: str, parent_id: str) -> bool:
+        return parent_id == task_id or task_id in self.ancestors(parent_id)
+
+    def _subtree(self, task_id: str) -> Tuple[int, int]:
+        done, total = self.progress(task_id)
+        return done + (1 if self._completed[task_id] else 0), total + 1
+
+    def _propagate(self, task_id: str, done: int, total: int):
+        for ancestor_id in self.ancestors(task_id):
+            progress = self._progress.get(ancestor_id)
+            if progress is None:
+                progress = self._progress[ancestor_id] = [0, 0]
+            progress[0] += done
+            progress[1] += total
+            if not progress[1]:
+                del self._progress[ancestor_id]
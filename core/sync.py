@@ -0,0 +1,293 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import argparse
+import hashlib
+import json
+import os
+import time
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from core.compression import load_json
+from core.descriptions import DescriptionStore
+from core.storage import LOAD_ERRORS, read_json, write_json
+from core.task import Task
+
+BUCKETS = 4096
+TOMBSTONE_DAYS = 90
+VOLATILE_FIELDS = ('updated_at', 'status_changed_at')
+
+Entry = Tuple[str, int, bool]
+
+
+class SyncResult(NamedTuple):
+    buckets: int
+    sent: int
+    received: int
+    deleted_local: int
+    deleted_remote: int
+
+
+def _digest(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big')
+
+
+def content_hash(record: Dict) -> int:
+    data = {key: value for key, value in record.items() if key not in VOLATILE_FIELDS}
+    return _digest(json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def tombstone_hash(task_id: str, deleted_at: str) -> int:
+    return _digest(f'{task_id}\0{deleted_at}'.encode('utf-8'))
+
+
+def bucket_of(task_id: str) -> int:
+    return zlib.crc32(task_id.encode('utf-8')) % BUCKETS
+
+
+class SyncIndex:
+
+    def __init__(self, filename: str, tombstones_filename: str):
+        self.filename = filename
+        self.tombstones_filename = tombstones_filename
+        self.entries: Dict[str, Tuple[int, str]] = {}
+        self.tombstones: Dict[str, str] = {}
+        self.buckets: List[int] = [0] * BUCKETS
+        self._members: List[Set[str]] = [set() for _ in range(BUCKETS)]
+        self._tombstones_dirty = False
+
+    def load_tombstones(self):
+        for task_id in list(self.tombstones):
+            self.remove_tombstone(task_id)
+        tombstones = {}
+        if os.path.isfile(self.tombstones_filename):
+            try:
+                tombstones = read_json(self.tombstones_filename)
+            except LOAD_ERRORS:
+                tombstones = {}
+        cutoff = (datetime.now() - timedelta(days=TOMBSTONE_DAYS)).isoformat()
+        for task_id, deleted_at in tombstones.items():
+            if deleted_at >= cutoff:
+                self.add_tombstone(task_id, deleted_at)
+        self._tombstones_dirty = len(self.tombstones) != len(tombstones)
+
+    def load_entries(self):
+        for task_id in list(self.entries):
+            self.remove_entry(task_id)
+        if not os.path.isfile(self.filename):
+            return
+        try:
+            data = read_json(self.filename)
+            ids, buckets, hashes, stamps = data['ids'], data['buckets'], data['hashes'], data['stamps']
+            digests = data['digests']
+        except LOAD_ERRORS + (KeyError, TypeError):
+            return
+        if len(digests) != BUCKETS or not len(ids) == len(buckets) == len(hashes) == len(stamps):
+            return
+        self.entries = dict(zip(ids, zip(hashes, stamps)))
+        members = self._members
+        for task_id, bucket in zip(ids, buckets):
+            members[bucket].add(task_id)
+        self.buckets = [digest ^ saved for digest, saved in zip(self.buckets, digests)]
+
+    def save_entries(self):
+        ids = list(self.entries)
+        buckets = [bucket_of(task_id) for task_id in ids]
+        digests = [0] * BUCKETS
+        hashes = []
+        stamps = []
+        for task_id, bucket in zip(ids, buckets):
+            value, stamp = self.entries[task_id]
+            digests[bucket] ^= value
+            hashes.append(value)
+            stamps.append(stamp)
+        write_json(self.filename, {'digests': digests, 'ids': ids, 'buckets': buckets,
+                                   'hashes': hashes, 'stamps': stamps},
+                   'none', None, compact=True)
+
+    def take_tombstone_changes(self) -> Optional[Dict[str, str]]:
+        if not self._tombstones_dirty:
+            return None
+        self._tombstones_dirty = False
+        return dict(self.tombstones)
+
+    def save_tombstones(self):
+        if self._tombstones_dirty:
+            write_json(self.tombstones_filename, self.tombstones)
+            self._tombstones_dirty = False
+
+    def set_entry(self, task_id: str, value: int, stamp: str):
+        previous = self.entries.get(task_id)
+        bucket = bucket_of(task_id)
+        if previous is not None:
+            self.buckets[bucket] ^= previous[0]
+        self.buckets[bucket] ^= value
+        self.entries[task_id] = (value, stamp)
+        self._members[bucket].add(task_id)
+
+    def remove_entry(self, task_id: str):
+        previous = self.entries.pop(task_id, None)
+        if previous is not None:
+            bucket = bucket_of(task_id)
+            self.buckets[bucket] ^= previous[0]
+            self._members[bucket].discard(task_id)
+
+    def add_tombstone(self, task_id: str, deleted_at: Optional[str] = None):
+        self.remove_tombstone(task_id)
+        deleted_at = deleted_at or datetime.now().isoformat()
+        self.tombstones[task_id] = deleted_at
+        self.buckets[bucket_of(task_id)] ^= tombstone_hash(task_id, deleted_at)
+        self._tombstones_dirty = True
+
+    def remove_tombstone(self, task_id: str):
+        deleted_at = self.tombstones.pop(task_id, None)
+        if deleted_at is not None:
+            self.buckets[bucket_of(task_id)] ^= tombstone_hash(task_id, deleted_at)
+            self._tombstones_dirty = True
+
+    def entries_in(self, buckets: Set[int]) -> Dict[str, Entry]:
+        result = {}
+        for bucket in buckets:
+            for task_id in self._members[bucket]:
+                value, stamp = self.entries[task_id]
+                result[task_id] = (stamp, value, False)
+        for task_id, deleted_at in self.tombstones.items():
+            if task_id not in result and bucket_of(task_id) in buckets:
+                result[task_id] = (deleted_at, 0, True)
+        return result
+
+
+class TaskFileReplica:
+
+    def __init__(self, filename: str):
+        self.filename = os.path.expanduser(filename)
+        base_filename = os.path.splitext(self.filename)[0]
+        self.records: Dict[str, Dict] = {}
+        self.codec = 'none'
+        if os.path.isfile(self.filename):
+            self.records, self.codec = load_json(self.filename)
+        descriptions_filename = base_filename + '.descriptions.bin'
+        self.descriptions = (DescriptionStore(descriptions_filename)
+                             if os.path.isfile(descriptions_filename) else None)
+        self.tasks: Dict[str, Task] = {}
+        for task_id, record in self.records.items():
+            try:
+                task = Task.from_dict(record)
+            except (KeyError, TypeError):
+                continue
+            if self.descriptions is not None and not task.description_loaded:
+                task.set_description_source(self.descriptions.get)
+            self.tasks[task_id] = task
+        self.sync_index = SyncIndex(base_filename + '.sync.json', base_filename + '.tombstones.json')
+        self.sync_index.load_tombstones()
+        self.sync_index.load_entries()
+        for task_id, task in self.tasks.items():
+            self.sync_index.remove_tombstone(task_id)
+            entry = self.sync_index.entries.get(task_id)
+            if entry is None or entry[1] != task.updated_at:
+                self.sync_index.set_entry(task_id, content_hash(self._sync_record(task)), task.updated_at)
+        for task_id in [task_id for task_id in self.sync_index.entries if task_id not in self.tasks]:
+            self.sync_index.remove_entry(task_id)
+        self._changed = False
+
+    def sync_summary(self) -> List[int]:
+        return list(self.sync_index.buckets)
+
+    def sync_entries(self, buckets: Set[int]) -> Dict[str, Entry]:
+        return self.sync_index.entries_in(buckets)
+
+    def sync_records(self, task_ids: Iterable[str]) -> Dict[str, Dict]:
+        return {task_id: self._sync_record(self.tasks[task_id]) for task_id in task_ids if task_id in self.tasks}
+
+    def apply_sync(self, records: Dict[str, Dict], deletions: Dict[str, str]):
+        for task_id, record in records.items():
+            task = Task.from_dict(record)
+            self.records[task_id] = task.to_dict()
+            self.tasks[task_id] = task
+            self.sync_index.remove_tombstone(task_id)
+        for task_id, deleted_at in deletions.items():
+            self.records.pop(task_id, None)
+            self.tasks.pop(task_id, None)
+            self.sync_index.remove_entry(task_id)
+            self.sync_index.add_tombstone(task_id, deleted_at)
+        self._changed = self._changed or bool(records or deletions)
+
+    def close(self):
+        if self.descriptions is not None:
+            self.descriptions.close()
+        if not self._changed:
+            return
+        write_json(self.filename, self.records, self.codec)
+        self.sync_index.save_tombstones()
+        self._changed = False
+
+    @staticmethod
+    def _sync_record(task: Task) -> Dict:
+        record = task.to_dict()
+        record['description'] = task.description
+        return record
+
+
+def plan_sync(local: Dict[str, Entry], remote: Dict[str, Entry]) -> Tuple[Dict[str, Entry], Dict[str, Entry]]:
+    to_local = {}
+    to_remote = {}
+    for task_id in local.keys() | remote.keys():
+        mine = local.get(task_id)
+        theirs = remote.get(task_id)
+        if mine == theirs:
+            continue
+        if mine is None:
+            to_local[task_id] = theirs
+        elif theirs is None:
+            to_remote[task_id] = mine
+        elif mine[1:] == theirs[1:] and not mine[2]:
+            continue
+        elif (mine[0], mine[2], mine[1]) >= (theirs[0], theirs[2], theirs[1]):
+            to_remote[task_id] = mine
+        else:
+            to_local[task_id] = theirs
+    return to_local, to_remote
+
+
+def _transfer(source, target, entries: Dict[str, Entry]) -> Tuple[int, int]:
+    records = source.sync_records([task_id for task_id, entry in entries.items() if not entry[2]])
+    deletions = {task_id: entry[0] for task_id, entry in entries.items() if entry[2]}
+    target.apply_sync(records, deletions)
+    return len(records), len(deletions)
+
+
+def sync_managers(local, remote) -> SyncResult:
+    local_summary = local.sync_summary()
+    remote_summary = remote.sync_summary()
+    buckets = {bucket for bucket in range(BUCKETS) if local_summary[bucket] != remote_summary[bucket]}
+    if not buckets:
+        return SyncResult(0, 0, 0, 0, 0)
+
+    to_local, to_remote = plan_sync(local.sync_entries(buckets), remote.sync_entries(buckets))
+    received, deleted_local = _transfer(remote, local, to_local)
+    sent, deleted_remote = _transfer(local, remote, to_remote)
+    return SyncResult(len(buckets), sent, received, deleted_local, deleted_remote)
+
+
+def main(argv=None):
+    from core.task_manager import TaskManager
+
+    parser = argparse.ArgumentParser(description="Merge two Smart Task Manager task files.")
+    parser.add_argument("other", help="the other task file, e.g. a copy in a synced folder")
+    parser.add_argument("--file", default="~/.todos.json", help="local task file")
+    args = parser.parse_args(argv)
+
+    local = TaskManager(args.file)
+    remote = TaskFileReplica(args.other)
+    started = time.perf_counter()
+    result = sync_managers(local, remote)
+    elapsed = time.perf_counter() - started
+    local.close()
+    remote.close()
+    print(f"{result.buckets} differing bucket(s): sent {result.sent}, received {result.received}, "
+          f"deleted {result.deleted_local} locally and {result.deleted_remote} remotely "
+          f"in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
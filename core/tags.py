@@ -0,0 +1,185 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import heapq
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.task import Task
+
+
+def popcount(bitmap: int) -> int:
+    return bin(bitmap).count('1')
+
+
+def _bitmap_from_slots(slots: Iterable[int], size: int) -> int:
+    data = bytearray((size + 7) // 8)
+    for slot in slots:
+        data[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(bytes(data), 'little')
+
+
+class TagIndex:
+
+    def __init__(self):
+        self._tag_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._bitmaps: List[int] = []
+        self._slots: Dict[str, int] = {}
+        self._task_ids: List[Optional[str]] = []
+        self._task_tags: Dict[str, Tuple[int, ...]] = {}
+        self._free: List[int] = []
+        self._all = 0
+        self._completed = 0
+        self._priorities: Dict[int, int] = {1: 0, 2: 0, 3: 0}
+
+    @property
+    def tags(self) -> List[str]:
+        return sorted(name for name, bitmap in zip(self._names, self._bitmaps) if bitmap)
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self._tag_ids = {}
+        self._names = []
+        self._task_ids = []
+        self._task_tags = {}
+        self._free = []
+        tag_slots: List[List[int]] = []
+        completed_slots = []
+        priority_slots: Dict[int, List[int]] = {1: [], 2: [], 3: []}
+        intern = self._intern
+        for slot, task in enumerate(tasks):
+            self._task_ids.append(task.id)
+            if task.completed:
+                completed_slots.append(slot)
+            slots = priority_slots.get(task.priority)
+            if slots is None:
+                slots = priority_slots[task.priority] = []
+            slots.append(slot)
+            tags = task.tags
+            if tags:
+                tag_ids = tuple(map(intern, tags))
+                while len(tag_slots) < len(self._names):
+                    tag_slots.append([])
+                for tag_id in tag_ids:
+                    tag_slots[tag_id].append(slot)
+                self._task_tags[task.id] = tag_ids
+        size = len(self._task_ids)
+        self._slots = dict(zip(self._task_ids, range(size)))
+        self._bitmaps = [_bitmap_from_slots(slots, size) for slots in tag_slots]
+        self._all = (1 << size) - 1
+        self._completed = _bitmap_from_slots(completed_slots, size)
+        self._priorities = {priority: _bitmap_from_slots(slots, size) for priority, slots in priority_slots.items()}
+
+    def update(self, task: Task):
+        slot = self._slots.get(task.id)
+        if slot is None:
+            slot = self._allocate(task.id)
+        bit = 1 << slot
+        tag_ids = tuple(map(self._intern, task.tags))
+        previous = self._task_tags.get(task.id, ())
+        if tag_ids != previous:
+            for tag_id in set(previous) - set(tag_ids):
+                self._bitmaps[tag_id] &= ~bit
+            for tag_id in set(tag_ids) - set(previous):
+                self._bitmaps[tag_id] |= bit
+            if tag_ids:
+                self._task_tags[task.id] = tag_ids
+            else:
+                self._task_tags.pop(task.id, None)
+        self._clear_facets(bit)
+        if task.completed:
+            self._completed |= bit
+        self._priorities[task.priority] = self._priorities.get(task.priority, 0) | bit
+
+    def remove(self, task_id: str):
+        slot = self._slots.pop(task_id, None)
+        if slot is None:
+            return
+        bit = 1 << slot
+        for tag_id in self._task_tags.pop(task_id, ()):
+            self._bitmaps[tag_id] &= ~bit
+        self._clear_facets(bit)
+        self._all &= ~bit
+        if slot == len(self._task_ids) - 1:
+            self._task_ids.pop()
+            while self._task_ids and self._task_ids[-1] is None:
+                self._task_ids.pop()
+            size = len(self._task_ids)
+            self._free = [free for free in self._free if free < size]
+            heapq.heapify(self._free)
+        else:
+            self._task_ids[slot] = None
+            heapq.heappush(self._free, slot)
+
+    def bitmap(self, tag: str) -> int:
+        tag_id = self._tag_ids.get(tag)
+        return self._bitmaps[tag_id] if tag_id is not None else 0
+
+    def facet(self, completed: Optional[bool] = None, priorities: Optional[Iterable[int]] = None) -> int:
+        bitmap = self._all
+        if completed is True:
+            bitmap &= self._completed
+        elif completed is False:
+            bitmap &= ~self._completed
+        if priorities is not None:
+            selected = 0
+            for priority in priorities:
+                selected |= self._priorities.get(priority, 0)
+            bitmap &= selected
+        return bitmap
+
+    def select(self, include: Iterable[str] = (), exclude: Iterable[str] = (), match_all: bool = True,
+               base: Optional[int] = None) -> int:
+        bitmap = self._all if base is None else base
+        include = list(include)
+        if include:
+            if match_all:
+                for tag in include:
+                    bitmap &= self.bitmap(tag)
+            else:
+                selected = 0
+                for tag in include:
+                    selected |= self.bitmap(tag)
+                bitmap &= selected
+        for tag in exclude:
+            bitmap &= ~self.bitmap(tag)
+        return bitmap
+
+    def counts(self, base: Optional[int] = None) -> Dict[str, int]:
+        return {name: popcount(bitmap if base is None else bitmap & base)
+                for name, bitmap in zip(self._names, self._bitmaps) if bitmap}
+
+    def ids(self, bitmap: int) -> List[str]:
+        bits = bin(bitmap)[:1:-1]
+        task_ids = self._task_ids
+        result = []
+        slot = bits.find('1')
+        while slot >= 0:
+            result.append(task_ids[slot])
+            slot = bits.find('1', slot + 1)
+        return result
+
+    def _intern(self, tag: str) -> int:
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = len(self._names)
+            self._tag_ids[sys.intern(tag)] = tag_id
+            self._names.append(tag)
+            self._bitmaps.append(0)
+        return tag_id
+
+    def _allocate(self, task_id: str) -> int:
+        if self._free:
+            slot = heapq.heappop(self._free)
+            self._task_ids[slot] = task_id
+        else:
+            slot = len(self._task_ids)
+            self._task_ids.append(task_id)
+        self._slots[task_id] = slot
+        self._all |= 1 << slot
+        return slot
+
+    def _clear_facets(self, bit: int):
+        if self._completed & bit:
+            self._completed &= ~bit
+        for priority, bitmap in self._priorities.items():
+            if bitmap & bit:
+                self._priorities[priority] = bitmap & ~bit
@@ -1,20 +1,52 @@
 # Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import re
+import sys
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from core.recurrence import Recurrence
+
+EDITABLE_FIELDS = ('title', 'description', 'priority', 'due_date', 'recurrence', 'remind_at', 'tags', 'parent_id')
+MAX_TAG_LENGTH = 40
+
+_TAG_SEPARATOR_RE = re.compile(r'[\s,]+')
+
+
+def normalize_tags(tags) -> Tuple[str, ...]:
+    if isinstance(tags, str):
+        tags = _TAG_SEPARATOR_RE.split(tags)
+    result = []
+    for tag in tags:
+        tag = tag.strip().lstrip('#').lower()[:MAX_TAG_LENGTH]
+        if tag and tag not in result:
+            result.append(sys.intern(tag))
+    return tuple(result)
 
 
 class Task:
 
-    def __init__(self, id: str, title: str, description: str = "",
+    def __init__(self, id: str, title: str, description: Optional[str] = "",
                  priority: int = 3, completed: bool = False,
-                 created_at: Optional[str] = None, due_date: Optional[str] = None):
+                 created_at: Optional[str] = None, due_date: Optional[str] = None,
+                 recurrence: Optional[Recurrence] = None, remind_at: Optional[str] = None,
+                 completed_at: Optional[str] = None, status_changed_at: Optional[str] = None,
+                 updated_at: Optional[str] = None, tags: Optional[Iterable[str]] = None,
+                 parent_id: Optional[str] = None):
         self._id = id
         self._title = title
         self._description = description
+        self._description_source: Optional[Callable[[str], str]] = None
         self._priority = priority
         self._completed = completed
         self._created_at = created_at or datetime.now().isoformat()
         self._due_date = due_date
+        self._recurrence = recurrence
+        self._remind_at = remind_at
+        self._completed_at = completed_at
+        self._status_changed_at = status_changed_at
+        self._updated_at = updated_at
+        self._tags: Tuple[str, ...] = normalize_tags(tags) if tags else ()
+        self._parent_id = parent_id
 
     @property
     def id(self) -> str:
@@ -24,14 +56,40 @@ class Task:
     def title(self) -> str:
         return self._title
 
+    def set_title(self, title: str) -> bool:
+        return self._set('title', title)
+
     @property
     def description(self) -> str:
+        if self._description is None:
+            return self._description_source(self._id) if self._description_source else ""
         return self._description
 
+    @property
+    def description_loaded(self) -> bool:
+        return self._description is not None
+
+    def set_description(self, description: str) -> bool:
+        if description == self.description:
+            return False
+        self._description = description
+        return True
+
+    def set_description_source(self, source: Callable[[str], str]):
+        self._description = None
+        self._description_source = source
+
+    def materialize_description(self):
+        if self._description is None:
+            self._description = self.description
+
     @property
     def priority(self) -> int:
         return self._priority
 
+    def set_priority(self, priority: int) -> bool:
+        return self._set('priority', priority)
+
     @property
     def completed(self) -> bool:
         return self._completed
@@ -44,28 +102,119 @@ class Task:
     def due_date(self) -> Optional[str]:
         return self._due_date
 
+    def set_due_date(self, due_date: Optional[str]) -> bool:
+        return self._set('due_date', due_date)
+
+    @property
+    def recurrence(self) -> Optional[Recurrence]:
+        return self._recurrence
+
+    def set_recurrence(self, recurrence: Optional[Recurrence]) -> bool:
+        current = self._recurrence.to_dict() if self._recurrence is not None else None
+        if current == (recurrence.to_dict() if recurrence is not None else None):
+            self._recurrence = recurrence
+            return False
+        self._recurrence = recurrence
+        return True
+
+    @property
+    def remind_at(self) -> Optional[str]:
+        return self._remind_at
+
+    def set_remind_at(self, remind_at: Optional[str]) -> bool:
+        return self._set('remind_at', remind_at)
+
+    @property
+    def tags(self) -> Tuple[str, ...]:
+        return self._tags
+
+    def set_tags(self, tags: Iterable[str]) -> bool:
+        return self._set('tags', normalize_tags(tags))
+
+    @property
+    def parent_id(self) -> Optional[str]:
+        return self._parent_id
+
+    def set_parent_id(self, parent_id: Optional[str]) -> bool:
+        return self._set('parent_id', parent_id)
+
+    @property
+    def completed_at(self) -> Optional[str]:
+        return self._completed_at
+
+    @property
+    def status_changed_at(self) -> Optional[str]:
+        return self._status_changed_at
+
+    @property
+    def updated_at(self) -> str:
+        return self._updated_at or self._created_at
+
+    def touch(self, timestamp: Optional[str] = None):
+        self._updated_at = timestamp or datetime.now().isoformat()
+
     def toggle_complete(self):
+        now = datetime.now().isoformat()
         self._completed = not self._completed
+        self._completed_at = now if self._completed else None
+        self._status_changed_at = now
+        self._updated_at = now
+
+    def update(self, **fields) -> Set[str]:
+        unknown = set(fields) - set(EDITABLE_FIELDS)
+        if unknown:
+            raise TypeError(f"Cannot update task field(s): {', '.join(sorted(unknown))}")
+        return {name for name, value in fields.items() if getattr(self, 'set_' + name)(value)}
+
+    def _set(self, name: str, value) -> bool:
+        attribute = '_' + name
+        if getattr(self, attribute) == value:
+            return False
+        setattr(self, attribute, value)
+        return True
 
     def to_dict(self) -> Dict:
-        return {
+        data = {
             "id": self._id,
             "title": self._title,
-            "description": self._description,
             "priority": self._priority,
             "completed": self._completed,
             "created_at": self._created_at,
             "due_date": self._due_date
         }
+        if self._description is not None:
+            data["description"] = self._description
+        if self._recurrence is not None:
+            data["recurrence"] = self._recurrence.to_dict()
+        if self._remind_at is not None:
+            data["remind_at"] = self._remind_at
+        if self._completed_at is not None:
+            data["completed_at"] = self._completed_at
+        if self._status_changed_at is not None:
+            data["status_changed_at"] = self._status_changed_at
+        if self._updated_at is not None:
+            data["updated_at"] = self._updated_at
+        if self._tags:
+            data["tags"] = list(self._tags)
+        if self._parent_id is not None:
+            data["parent_id"] = self._parent_id
+        return data
 
     @staticmethod
     def from_dict(data: Dict) -> 'Task':
         return Task(
             id=data['id'],
             title=data['title'],
-            description=data['description'],
+            description=data.get('description'),
             priority=data['priority'],
             completed=data['completed'],
             created_at=data['created_at'],
-            due_date=data.get('due_date')
+            due_date=data.get('due_date'),
+            recurrence=Recurrence.from_dict(data['recurrence']) if data.get('recurrence') else None,
+            remind_at=data.get('remind_at'),
+            completed_at=data.get('completed_at'),
+            status_changed_at=data.get('status_changed_at'),
+            updated_at=data.get('updated_at'),
+            tags=data.get('tags'),
+            parent_id=data.get('parent_id')
         )
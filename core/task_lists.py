@@ -0,0 +1,155 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import glob
+import os
+import re
+import shutil
+from collections import OrderedDict
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+
+from core.descriptions import DescriptionStore
+from core.storage import LOAD_ERRORS, iter_tasks, write_json
+from core.task import Task
+from core.task_manager import TaskManager
+
+DEFAULT_LIST = 'Default'
+RESIDENT_LISTS = 3
+
+_LIST_NAME_RE = re.compile(r'^\w[\w -]{0,39}$')
+
+
+class TaskListError(ValueError):
+    pass
+
+
+class TaskLists:
+
+    def __init__(self, default_filename: str = '~/.todos.json', directory: str = '~/.todo-lists',
+                 capacity: int = RESIDENT_LISTS, factory: Callable[[str], TaskManager] = TaskManager):
+        self.default_filename = os.path.expanduser(default_filename)
+        self.directory = os.path.expanduser(directory)
+        self.capacity = max(1, capacity)
+        self._factory = factory
+        self._resident: 'OrderedDict[str, TaskManager]' = OrderedDict()
+        self._pinned: Set[str] = set()
+
+    @property
+    def resident(self) -> List[str]:
+        return list(self._resident)
+
+    @property
+    def pinned(self) -> Set[str]:
+        return set(self._pinned)
+
+    def names(self) -> List[str]:
+        names = []
+        if os.path.isdir(self.directory):
+            names = sorted(name for name, extension in map(os.path.splitext, os.listdir(self.directory))
+                           if extension == '.json' and _LIST_NAME_RE.match(name) and name != DEFAULT_LIST)
+        return [DEFAULT_LIST] + names
+
+    def filename(self, name: str) -> str:
+        if name == DEFAULT_LIST:
+            return self.default_filename
+        return os.path.join(self.directory, name + '.json')
+
+    def exists(self, name: str) -> bool:
+        return name == DEFAULT_LIST or (bool(_LIST_NAME_RE.match(name)) and os.path.isfile(self.filename(name)))
+
+    def get(self, name: str) -> TaskManager:
+        manager = self._resident.get(name)
+        if manager is not None:
+            self._resident.move_to_end(name)
+            return manager
+        if not self.exists(name):
+            raise TaskListError(f"Task list not found: {name}")
+        manager = self._factory(self.filename(name))
+        self._resident[name] = manager
+        self._evict()
+        return manager
+
+    def create(self, name: str) -> TaskManager:
+        name = name.strip()
+        if not _LIST_NAME_RE.match(name):
+            raise TaskListError("List names can use letters, digits, spaces, '-' and '_' (up to 40 characters).")
+        if self.exists(name):
+            raise TaskListError(f"A task list named {name} already exists.")
+        os.makedirs(self.directory, exist_ok=True)
+        write_json(self.filename(name), {})
+        return self.get(name)
+
+    def delete(self, name: str):
+        if name == DEFAULT_LIST:
+            raise TaskListError("The default task list cannot be deleted.")
+        if name in self._pinned:
+            raise TaskListError(f"Task list {name} is in use.")
+        if not self.exists(name):
+            raise TaskListError(f"Task list not found: {name}")
+        manager = self._resident.pop(name, None)
+        if manager is not None:
+            manager.close()
+        for path in glob.glob(os.path.join(glob.escape(self.directory), glob.escape(name) + '.*')):
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+    def pin(self, name: str):
+        self._pinned.add(name)
+
+    def unpin(self, name: str):
+        self._pinned.discard(name)
+        self._evict()
+
+    def search(self, text: str) -> Iterator[Tuple[str, Task]]:
+        text = text.lower()
+        for name in self.names():
+            manager = self._resident.get(name)
+            if manager is not None:
+                tasks = list(manager.tasks.values())
+                description_ids = manager.search_descriptions(text)
+            else:
+                tasks = self._stream(name)
+                description_ids = self._search_descriptions(name, text)
+            for task in tasks:
+                if (text in task.title.lower() or task.id in description_ids
+                        or task.description_loaded and text in task.description.lower()):
+                    yield name, task
+
+    def roll_over_due_dates(self):
+        for manager in self._resident.values():
+            manager.roll_over_due_dates()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        drained = True
+        for manager in list(self._resident.values()):
+            manager.flush_deferred_writes()
+            drained = manager.flush(timeout) and drained
+        return drained
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        drained = True
+        while self._resident:
+            _, manager = self._resident.popitem(last=False)
+            drained = manager.close(timeout) and drained
+        return drained
+
+    def _stream(self, name: str) -> Iterator[Task]:
+        try:
+            yield from iter_tasks(self.filename(name))
+        except LOAD_ERRORS:
+            return
+
+    def _search_descriptions(self, name: str, text: str) -> Set[str]:
+        descriptions_filename = os.path.splitext(self.filename(name))[0] + '.descriptions.bin'
+        if not os.path.isfile(descriptions_filename):
+            return set()
+        descriptions = DescriptionStore(descriptions_filename)
+        try:
+            return descriptions.search(text)
+        finally:
+            descriptions.close()
+
+    def _evict(self):
+        candidates = [name for name in list(self._resident)[:-1] if name not in self._pinned]
+        while len(self._resident) > self.capacity and candidates:
+            self._resident.pop(candidates.pop(0)).close()
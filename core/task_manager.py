@@ -1,16 +1,87 @@
 # Copyright (©) 2025, Alexander Suvorov. All rights reserved.
-import json
 import os
-from typing import Dict, Optional
+import threading
+import uuid
+from concurrent.futures import Future
+from datetime import date, datetime, timedelta
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+from core.analytics import ProductivityStats
+from core.archive import TaskArchive
+from core.descriptions import DescriptionStore
+from core.due_dates import DueDateClassifier, parse_due_date
+from core.duplicates import DESCRIPTION_PREFIX, DUPLICATE_THRESHOLD, DuplicateIndex, shingles, similar_pairs
+from core.persistence import BackgroundWriter
+from core.query import compile_query
+from core.reminders import ReminderScheduler, parse_reminder
+from core.search import FuzzySearchIndex, FUZZY_TOP_K
+from core.snapshot import SnapshotCache
+from core.storage import JsonFileStorage, ShardedStorage
+from core.subtasks import SubtaskIndex
+from core.sync import SyncIndex, content_hash
+from core.tags import TagIndex
 from core.task import Task
+from core.views import SavedViews
+
+
+ARCHIVE_AFTER_DAYS = 30
 
 
 class TaskManager:
 
-    def __init__(self, filename: str = '~/.todos.json'):
+    def __init__(self, filename: str = '~/.todos.json', archive_filename: Optional[str] = None,
+                 segment_by: Optional[str] = None, lazy_descriptions: Optional[bool] = None,
+                 background_writes: bool = False, compression: Optional[str] = None):
         self.filename = os.path.expanduser(filename)
+        base_filename = os.path.splitext(self.filename)[0]
+        self.archive = TaskArchive(archive_filename or base_filename + '.archive.jsonl')
+        if segment_by:
+            self.storage = ShardedStorage(base_filename + '.d', segment_by, legacy_filename=self.filename,
+                                          compression=compression)
+        else:
+            self.storage = JsonFileStorage(self.filename, compression, SnapshotCache(base_filename + '.snapshot'))
+        descriptions_filename = base_filename + '.descriptions.bin'
+        if lazy_descriptions is None:
+            lazy_descriptions = os.path.isfile(descriptions_filename)
+        self.descriptions = DescriptionStore(descriptions_filename) if lazy_descriptions else None
+        self.on_write_error: Optional[Callable[[Exception], None]] = None
+        self.revision = 0
+        self._listeners: List[Callable[[str, List[str], Optional[Set[str]]], None]] = []
+        self._deferred_ids: Optional[Set[str]] = None
+        self._deferred_all = False
+        self.writer = BackgroundWriter(self.storage.save, self._write_failed) if background_writes else None
+        self.sync_index = SyncIndex(base_filename + '.sync.json', base_filename + '.tombstones.json')
+        self.sync_index.load_tombstones()
+        self._sync_ready = False
         self.tasks = self.load_data()
+        self._records: Optional[Dict[str, Dict]] = None
+        self.stats = ProductivityStats(base_filename + '.stats.json')
+        if not self.stats.load():
+            self.stats.rebuild(chain(self.tasks.values(), self.archive.iter_tasks()))
+            self.stats.save()
+        migrated_ids = self._detach_descriptions(self.tasks.values())
+        if migrated_ids:
+            self.write_data(migrated_ids)
+        self.due_dates = DueDateClassifier()
+        self.due_dates.rebuild(self.tasks.values())
+        self._recurring: Set[str] = set()
+        for task in self.tasks.values():
+            self._track_recurrence(task)
+        self.reminders = ReminderScheduler()
+        self.reminders.rebuild(self.tasks.values())
+        self.tag_index = TagIndex()
+        self.tag_index.rebuild(self.tasks.values())
+        self.subtasks = SubtaskIndex()
+        self.subtasks.rebuild(self.tasks.values())
+        self._fuzzy_index: Optional[FuzzySearchIndex] = None
+        self._fuzzy_build: Optional[Future] = None
+        self._fuzzy_changes: Set[str] = set()
+        self._duplicate_index: Optional[DuplicateIndex] = None
+        self._duplicate_build: Optional[Future] = None
+        self._duplicate_changes: Set[str] = set()
+        self.views = SavedViews(base_filename + '.views.json')
+        self.views.load(self)
 
     @property
     def count(self) -> int:
@@ -20,30 +91,255 @@ class TaskManager:
     def completed_count(self) -> int:
         return sum(1 for task in self.tasks.values() if task.completed)
 
+    @property
+    def fully_loaded(self) -> bool:
+        return self.storage.fully_loaded
+
+    def load_all(self) -> List[Task]:
+        self.flush()
+        loaded = self.storage.load_remaining(self.tasks)
+        migrated_ids = self._detach_descriptions(loaded.values())
+        for task in loaded.values():
+            self.tasks[task.id] = task
+            if self._records is not None:
+                self._records[task.id] = task.to_dict()
+            self._index_task(task)
+        if migrated_ids:
+            self.write_data(migrated_ids)
+        return list(loaded.values())
+
+    def roll_over_due_dates(self) -> Set[str]:
+        previous_day = self.due_dates.today
+        changed_ids = self.due_dates.rollover()
+        if self.due_dates.today != previous_day:
+            compile_query.cache_clear()
+            self.views.refresh(self)
+        return changed_ids
+
+    def search_descriptions(self, text: str) -> Set[str]:
+        text = text.lower()
+        if self.descriptions is not None:
+            return self.descriptions.search(text)
+        return {task.id for task in self.tasks.values() if text in task.description.lower()}
+
+    def fuzzy_search(self, text: str, k: int = FUZZY_TOP_K,
+                     predicate: Optional[Callable[[Task], bool]] = None) -> List[Task]:
+        if not self.prepare_fuzzy_index():
+            self._fuzzy_build.result()
+            self.prepare_fuzzy_index()
+        task_predicate = (lambda task_id: predicate(self.tasks[task_id])) if predicate else None
+        return [self.tasks[task_id] for task_id in self._fuzzy_index.search(text, k, task_predicate)]
+
+    def prepare_fuzzy_index(self) -> bool:
+        if self._fuzzy_index is not None:
+            return True
+        if self._fuzzy_build is None:
+            texts = [(task.id, task.title, task.description) for task in self.tasks.values()]
+            self._fuzzy_changes = set()
+            index = FuzzySearchIndex()
+            self._fuzzy_build = self._in_background(lambda: index.add_texts(texts) or index, 'fuzzy-index')
+        if not self._fuzzy_build.done():
+            return False
+        future, self._fuzzy_build = self._fuzzy_build, None
+        self._fuzzy_index = self._replay_changes(future.result(), self._fuzzy_changes)
+        self._fuzzy_changes = set()
+        return True
+
+    def prepare_duplicate_index(self) -> bool:
+        if self._duplicate_index is not None:
+            return True
+        if self._duplicate_build is None:
+            texts = [(task.id, task.title, task.description[:DESCRIPTION_PREFIX]) for task in self.tasks.values()]
+            self._duplicate_changes = set()
+            index = DuplicateIndex(
+                lambda task_id: shingles(self.tasks[task_id].title, self.tasks[task_id].description))
+            self._duplicate_build = self._in_background(lambda: index.rebuild_texts(texts) or index,
+                                                        'duplicate-index')
+        if not self._duplicate_build.done():
+            return False
+        future, self._duplicate_build = self._duplicate_build, None
+        self._duplicate_index = self._replay_changes(future.result(), self._duplicate_changes)
+        self._duplicate_changes = set()
+        return True
+
+    def find_duplicates(self, title: str, description: str = "", exclude: Optional[str] = None,
+                        threshold: float = DUPLICATE_THRESHOLD) -> List[Tuple[Task, float]]:
+        matches = self._duplicates().find(title, description, exclude, threshold)
+        return [(self.tasks[match.task_id], match.similarity) for match in matches]
+
+    def duplicate_pairs(self, threshold: float = DUPLICATE_THRESHOLD) -> Future:
+        collisions, signatures = self._duplicates().snapshot()
+        return self._in_background(lambda: similar_pairs(collisions, signatures, threshold), 'duplicate-pairs')
+
+    def duplicate_groups(self, threshold: float = DUPLICATE_THRESHOLD,
+                         pairs: Optional[List[Tuple[str, str]]] = None) -> List[List[Task]]:
+        return [[self.tasks[task_id] for task_id in group]
+                for group in self._duplicates().groups(threshold, pairs)]
+
     def add_task(self, task: Task):
-        self.tasks[task.id] = task
-        self.write_data()
+        self._put_task(task)
+        self.write_data([task.id])
+        self._notify('added', [task.id])
+
+    def edit_task(self, task_id: str, **changes) -> Set[str]:
+        task = self.tasks.get(task_id)
+        if task is None:
+            raise KeyError("Task not found.")
+        restat = task.completed and any(
+            field in changes and changes[field] != getattr(task, field) for field in ('priority', 'due_date'))
+        if 'parent_id' in changes:
+            self.subtasks.check_parent(task_id, changes['parent_id'])
+        if restat:
+            self.stats.record_reopened(task, task.completed_at)
+        fields = task.update(**changes)
+        if restat:
+            self.stats.record_completed(task)
+        if not fields:
+            return fields
+        task.touch()
+        if 'description' in fields:
+            self._detach_descriptions([task])
+        self._reindex_task(task, fields)
+        self.write_data([task_id])
+        self._notify('updated', [task_id], fields)
+        return fields
+
+    def toggle_task(self, task_id: str) -> Optional[Task]:
+        task = self.tasks.get(task_id)
+        if task is None:
+            raise KeyError("Task not found.")
+        previous_completed_at = task.completed_at
+        task.toggle_complete()
+        if task.completed:
+            self.stats.record_completed(task)
+        else:
+            self.stats.record_reopened(task, previous_completed_at)
+        fields = {'completed', 'completed_at', 'status_changed_at'}
+        self._reindex_task(task, fields)
+
+        next_task = self._next_occurrence(task) if task.completed else None
+        if next_task is not None:
+            fields.add('recurrence')
+            self._put_task(next_task)
+            self.write_data([task_id, next_task.id])
+        else:
+            self.write_data([task_id])
+        self._notify('updated', [task_id], fields)
+        if next_task is not None:
+            self._notify('added', [next_task.id])
+        return next_task
+
+    def clear_reminder(self, task_id: str):
+        task = self.tasks.get(task_id)
+        if task is None or task.remind_at is None:
+            return
+        task.set_remind_at(None)
+        task.touch()
+        self.reminders.remove(task_id)
+        self.write_data([task_id])
+        self._notify('updated', [task_id], {'remind_at'})
+
+    def occurrences_between(self, start: date, end: date) -> Iterator[Tuple[Task, date]]:
+        for task_id in list(self._recurring):
+            task = self.tasks[task_id]
+            due = self.due_dates.due(task_id)
+            if due is None:
+                continue
+            for day in task.recurrence.occurrences(due, start, end):
+                yield task, day
+
+    def tasks_by_day(self, start: date, end: date) -> Dict[date, List[Task]]:
+        return {day: sorted((self.tasks[task_id] for task_id in self.due_dates.ids_on(day)),
+                            key=lambda task: (task.completed, task.priority, task.title.lower()))
+                for day in self.due_dates.days_between(start, end)}
 
     def get_task(self, task_id: str) -> Optional[Task]:
         return self.tasks.get(task_id)
 
+    def subtasks_of(self, task_id: str) -> List[Task]:
+        return [self.tasks[child_id] for child_id in self.subtasks.children(task_id)]
+
+    def progress(self, task_id: str) -> Tuple[int, int]:
+        return self.subtasks.progress(task_id)
+
+    def add_subtask(self, parent_id: str, task: Task):
+        self.subtasks.check_parent(task.id, parent_id)
+        task.set_parent_id(parent_id)
+        self.add_task(task)
+
     def delete_task(self, task_id: str):
-        if task_id in self.tasks:
-            del self.tasks[task_id]
-            self.write_data()
-        else:
+        if task_id not in self.tasks:
             raise KeyError("Task not found.")
+        removed_ids = [task_id] + self.subtasks.descendants(task_id)
+        for removed_id in reversed(removed_ids):
+            del self.tasks[removed_id]
+            self._unindex_task(removed_id)
+        self.write_data(removed_ids)
+        self._notify('removed', removed_ids)
 
     def clear_completed(self):
         completed_ids = [task_id for task_id, task in self.tasks.items() if task.completed]
         for task_id in completed_ids:
             del self.tasks[task_id]
+            self._unindex_task(task_id)
         if completed_ids:
-            self.write_data()
+            self.write_data(completed_ids)
+            self._notify('removed', completed_ids)
+
+    def archive_completed(self, older_than_days: int = ARCHIVE_AFTER_DAYS) -> int:
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+        archived = []
+        for task in self.tasks.values():
+            if not task.completed:
+                continue
+            try:
+                if datetime.fromisoformat(task.completed_at or task.created_at) > cutoff:
+                    continue
+            except ValueError:
+                pass
+            archived.append(task)
+
+        if not archived:
+            return 0
+
+        for task in archived:
+            task.materialize_description()
+        self.archive.append(archived)
+        for task in archived:
+            del self.tasks[task.id]
+            self._unindex_task(task.id)
+        self.write_data([task.id for task in archived])
+        self._notify('removed', [task.id for task in archived])
+        return len(archived)
 
     def clear_all(self):
+        self.load_all()
+        removed_ids = list(self.tasks)
+        for task_id in removed_ids:
+            self.sync_index.remove_entry(task_id)
+            self.sync_index.add_tombstone(task_id)
         self.tasks = {}
+        self.due_dates.rebuild([])
+        self._recurring = set()
+        self.reminders.rebuild([])
+        self.tag_index.rebuild([])
+        self.subtasks.rebuild([])
+        self._fuzzy_index = None
+        self._fuzzy_build = None
+        self._duplicate_index = None
+        self._duplicate_build = None
+        self.views.refresh(self)
+        if self.descriptions is not None:
+            self.descriptions.retain([])
         self.write_data()
+        if removed_ids:
+            self._notify('removed', removed_ids)
+
+    def tasks_with_tags(self, include: Iterable[str] = (), exclude: Iterable[str] = (),
+                        match_all: bool = True) -> List[Task]:
+        bitmap = self.tag_index.select(include, exclude, match_all)
+        return sorted((self.tasks[task_id] for task_id in self.tag_index.ids(bitmap)),
+                      key=lambda task: (task.created_at, task.id))
 
     def get_tasks_by_priority(self) -> Dict[int, list]:
         grouped = {1: [], 2: [], 3: []}
@@ -52,22 +348,283 @@ class TaskManager:
         return grouped
 
     def load_data(self) -> Dict[str, Task]:
-        if os.path.isfile(self.filename):
+        return self.storage.load()
+
+    def add_listener(self, listener: Callable[[str, List[str], Optional[Set[str]]], None]):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, List[str], Optional[Set[str]]], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def defer_writes(self):
+        if self._deferred_ids is None:
+            self._deferred_ids = set()
+            self._deferred_all = False
+
+    def flush_deferred_writes(self):
+        if self._deferred_ids is None:
+            return
+        task_ids, write_all = self._deferred_ids, self._deferred_all
+        self._deferred_ids = None
+        self._deferred_all = False
+        if write_all:
+            self.write_data()
+        elif task_ids:
+            self.write_data(task_ids)
+
+    def write_data(self, task_ids: Optional[Iterable[str]] = None):
+        if self._deferred_ids is not None:
+            if task_ids is None:
+                self._deferred_all = True
+            else:
+                self._deferred_ids.update(task_ids)
+            return
+        if self.descriptions is not None:
+            self.descriptions.flush()
+        if self.writer is None:
+            self.stats.save()
+            self.sync_index.save_tombstones()
+        if task_ids is not None:
+            task_ids = list(task_ids)
+        if task_ids is None or self._records is None:
+            self._records = {task_id: task.to_dict() for task_id, task in self.tasks.items()}
+        else:
+            for task_id in task_ids:
+                task = self.tasks.get(task_id)
+                if task is not None:
+                    self._records[task_id] = task.to_dict()
+                else:
+                    self._records.pop(task_id, None)
+        if self.writer is not None:
+            files = {}
+            stats = self.stats.take_changes()
+            if stats is not None:
+                files[self.stats.filename] = stats
+            tombstones = self.sync_index.take_tombstone_changes()
+            if tombstones is not None:
+                files[self.sync_index.tombstones_filename] = tombstones
+            self.writer.submit(dict(self._records), task_ids, files)
+        else:
+            self.storage.save(self._records, task_ids)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        if self.writer is None:
+            return True
+        return self.writer.drain(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        self.flush_deferred_writes()
+        drained = self.writer.close(timeout) if self.writer is not None else True
+        if drained:
+            self.storage.close()
+        if self._sync_ready:
+            self.sync_index.save_entries()
+        if self.descriptions is not None:
+            self.descriptions.close()
+        return drained
+
+    def sync_summary(self) -> List[int]:
+        self._prepare_sync()
+        return list(self.sync_index.buckets)
+
+    def sync_entries(self, buckets: Set[int]) -> Dict[str, Tuple[str, int, bool]]:
+        self._prepare_sync()
+        return self.sync_index.entries_in(buckets)
+
+    def sync_records(self, task_ids: Iterable[str]) -> Dict[str, Dict]:
+        return {task_id: self._sync_record(self.tasks[task_id]) for task_id in task_ids if task_id in self.tasks}
+
+    def apply_sync(self, records: Dict[str, Dict], deletions: Dict[str, str]):
+        added = [task_id for task_id in records if task_id not in self.tasks]
+        updated = [task_id for task_id in records if task_id in self.tasks]
+        for record in records.values():
+            self._put_task(Task.from_dict(record))
+        removed = []
+        for task_id, deleted_at in deletions.items():
+            if task_id in self.tasks:
+                del self.tasks[task_id]
+                self._unindex_task(task_id, deleted_at)
+                removed.append(task_id)
+            else:
+                self.sync_index.add_tombstone(task_id, deleted_at)
+        if records or deletions:
+            self.write_data(added + updated + removed)
+        for event, task_ids in (('added', added), ('updated', updated), ('removed', removed)):
+            if task_ids:
+                self._notify(event, task_ids)
+
+    def _prepare_sync(self):
+        if self._sync_ready:
+            return
+        self.load_all()
+        self.sync_index.load_entries()
+        for task_id, task in self.tasks.items():
+            self.sync_index.remove_tombstone(task_id)
+            entry = self.sync_index.entries.get(task_id)
+            if entry is None or entry[1] != task.updated_at:
+                self.sync_index.set_entry(task_id, content_hash(self._sync_record(task)), task.updated_at)
+        for task_id in [task_id for task_id in self.sync_index.entries if task_id not in self.tasks]:
+            self.sync_index.remove_entry(task_id)
+        self._sync_ready = True
+
+    @staticmethod
+    def _sync_record(task: Task) -> Dict:
+        record = task.to_dict()
+        record['description'] = task.description
+        return record
+
+    def _put_task(self, task: Task):
+        previous = self.tasks.get(task.id)
+        if previous is None:
+            self.stats.record_created(task)
+        elif previous.completed:
+            self.stats.record_reopened(previous, previous.completed_at)
+        if task.completed:
+            self.stats.record_completed(task)
+        self.sync_index.remove_tombstone(task.id)
+        self._detach_descriptions([task])
+        self.tasks[task.id] = task
+        self._index_task(task)
+
+    def _notify(self, event: str, task_ids: List[str], fields: Optional[Set[str]] = None):
+        self.revision += 1
+        if self._sync_ready and event != 'removed':
+            for task_id in task_ids:
+                task = self.tasks.get(task_id)
+                if task is not None:
+                    self.sync_index.set_entry(task_id, content_hash(self._sync_record(task)), task.updated_at)
+        for listener in list(self._listeners):
+            listener(event, task_ids, fields)
+
+    def _write_failed(self, error: Exception):
+        if self.on_write_error is not None:
+            self.on_write_error(error)
+
+    def _detach_descriptions(self, tasks: Iterable[Task]) -> List[str]:
+        if self.descriptions is None:
+            return []
+        detached_ids = []
+        for task in tasks:
+            if task.description_loaded:
+                self.descriptions.put(task.id, task.description)
+                detached_ids.append(task.id)
+            task.set_description_source(self.descriptions.get)
+        return detached_ids
+
+    def _duplicates(self) -> DuplicateIndex:
+        if not self.prepare_duplicate_index():
+            self._duplicate_build.result()
+            self.prepare_duplicate_index()
+        return self._duplicate_index
+
+    def _replay_changes(self, index: Union[FuzzySearchIndex, DuplicateIndex],
+                        changes: Set[str]) -> Union[FuzzySearchIndex, DuplicateIndex]:
+        for task_id in changes:
+            task = self.tasks.get(task_id)
+            if task is not None:
+                index.update(task)
+            else:
+                index.remove(task_id)
+        return index
+
+    @staticmethod
+    def _in_background(build: Callable[[], object], name: str) -> Future:
+        future = Future()
+
+        def run():
             try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return {task_id: Task.from_dict(task_data)
-                            for task_id, task_data in data.items()}
-            except (json.JSONDecodeError, IOError):
-                return {}
+                result = build()
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=run, name=name, daemon=True).start()
+        return future
+
+    def _next_occurrence(self, task: Task) -> Optional[Task]:
+        if task.recurrence is None:
+            return None
+        due = parse_due_date(task.due_date) or date.today()
+        recurrence = task.recurrence.next_after(due)
+        next_due = task.recurrence.step(due, 1)
+        task.set_recurrence(None)
+        if recurrence is None:
+            return None
+        remind_at = parse_reminder(task.remind_at)
+        return Task(
+            id=str(uuid.uuid4()),
+            title=task.title,
+            description=task.description,
+            priority=task.priority,
+            due_date=next_due.isoformat(),
+            recurrence=recurrence,
+            remind_at=(remind_at + (next_due - due)).isoformat(timespec='minutes') if remind_at else None,
+            tags=task.tags,
+            parent_id=task.parent_id
+        )
+
+    def _index_task(self, task: Task):
+        self.due_dates.update(task)
+        self._track_recurrence(task)
+        self.reminders.schedule(task)
+        self.tag_index.update(task)
+        self.subtasks.update(task)
+        self._fuzzy_update(task)
+        self._duplicate_update(task)
+        self.views.task_changed(task, self)
+
+    def _fuzzy_update(self, task: Task):
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.update(task)
+        elif self._fuzzy_build is not None:
+            self._fuzzy_changes.add(task.id)
+
+    def _duplicate_update(self, task: Task):
+        if self._duplicate_index is not None:
+            self._duplicate_index.update(task)
+        elif self._duplicate_build is not None:
+            self._duplicate_changes.add(task.id)
+
+    def _track_recurrence(self, task: Task):
+        if task.recurrence is not None and not task.completed:
+            self._recurring.add(task.id)
         else:
-            return {}
-
-    def write_data(self):
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            json.dump({task_id: task.to_dict()
-                       for task_id, task in self.tasks.items()},
-                      f,
-                      indent=4,
-                      ensure_ascii=False,
-                      sort_keys=True)
+            self._recurring.discard(task.id)
+
+    def _reindex_task(self, task: Task, fields: Set[str]):
+        if fields & {'due_date', 'completed'}:
+            self.due_dates.update(task)
+        if fields & {'recurrence', 'completed'}:
+            self._track_recurrence(task)
+        if fields & {'remind_at', 'completed'}:
+            self.reminders.schedule(task)
+        if fields & {'tags', 'completed', 'priority'}:
+            self.tag_index.update(task)
+        if fields & {'parent_id', 'completed'}:
+            self.subtasks.update(task)
+        if fields & {'title', 'description'}:
+            self._fuzzy_update(task)
+            self._duplicate_update(task)
+        self.views.task_changed(task, self)
+
+    def _unindex_task(self, task_id: str, deleted_at: Optional[str] = None):
+        self.sync_index.remove_entry(task_id)
+        self.sync_index.add_tombstone(task_id, deleted_at)
+        self.due_dates.remove(task_id)
+        self._recurring.discard(task_id)
+        self.reminders.remove(task_id)
+        self.tag_index.remove(task_id)
+        self.subtasks.remove(task_id)
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.remove(task_id)
+        elif self._fuzzy_build is not None:
+            self._fuzzy_changes.add(task_id)
+        if self._duplicate_index is not None:
+            self._duplicate_index.remove(task_id)
+        elif self._duplicate_build is not None:
+            self._duplicate_changes.add(task_id)
+        self.views.task_removed(task_id)
+        if self.descriptions is not None:
+            self.descriptions.remove(task_id)
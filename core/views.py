@@ -0,0 +1,87 @@
+# Copyright (©) 2025, Alexander Suvorov. All rights reserved.
+import json
+import os
+from typing import Dict, Optional, Set
+
+from core.query import QueryError, QueryPlan, compile_query
+from core.storage import read_json, write_json
+from core.task import Task
+
+
+class SavedView:
+
+    def __init__(self, name: str, query: str):
+        self.name = name
+        self.query = query
+        self.task_ids: Set[str] = set()
+
+    @property
+    def count(self) -> int:
+        return len(self.task_ids)
+
+    @property
+    def plan(self) -> QueryPlan:
+        return compile_query(self.query)
+
+    def materialize(self, manager):
+        self.task_ids = {task.id for task in self.plan.execute(manager)}
+
+    def update(self, task: Task, manager):
+        if self.plan.matches(task, manager):
+            self.task_ids.add(task.id)
+        else:
+            self.task_ids.discard(task.id)
+
+
+class SavedViews:
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.views: Dict[str, SavedView] = {}
+
+    def __iter__(self):
+        return iter(self.views.values())
+
+    def get(self, name: str) -> Optional[SavedView]:
+        return self.views.get(name)
+
+    def load(self, manager):
+        self.views = {}
+        if os.path.isfile(self.filename):
+            try:
+                data = read_json(self.filename)
+            except (json.JSONDecodeError, IOError):
+                data = {}
+            for name, query in data.items():
+                view = SavedView(name, query)
+                try:
+                    view.materialize(manager)
+                except QueryError:
+                    continue
+                self.views[name] = view
+
+    def save(self):
+        write_json(self.filename, {view.name: view.query for view in self.views.values()})
+
+    def add(self, name: str, query: str, manager) -> SavedView:
+        view = SavedView(name, query)
+        view.materialize(manager)
+        self.views[name] = view
+        self.save()
+        return view
+
+    def remove(self, name: str):
+        if self.views.pop(name, None) is not None:
+            self.save()
+
+    def refresh(self, manager):
+        for view in self.views.values():
+            view.materialize(manager)
+
+    def task_changed(self, task: Task, manager):
+        for view in self.views.values():
+            view.update(task, manager)
+
+    def task_removed(self, task_id: str):
+        for view in self.views.values():
+            view.task_ids.discard(task_id)